@@ -0,0 +1,104 @@
+"""Shared LLM connection settings for the example scripts.
+
+Examples call ``load_config()`` instead of reading ``LLM_*`` variables one by
+one, and ``openai_provider(config)`` to build a provider from them. The
+environment is parsed and validated once per set of defaults; later calls
+return the same frozen ``Config``.
+
+Environment variables:
+  LLM_API_KEY          — API key for the LLM provider (empty if unset)
+  LLM_BASE_URL         — Base URL for the API
+  LLM_MODEL            — Model name
+  LLM_CONNECT_TIMEOUT  — Connect timeout in seconds (default: 10)
+  LLM_READ_TIMEOUT     — Read timeout in seconds (default: 120)
+  LLM_WRITE_TIMEOUT    — Write timeout in seconds (default: 10)
+  LLM_POOL_TIMEOUT     — Connection pool timeout in seconds (default: 10)
+  LLM_MAX_RETRIES      — Retry attempts for transient errors (default: 3)
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+from ecs_agent.providers import OpenAIProvider
+
+DEFAULT_BASE_URL = "https://dashscope.aliyuncs.com/compatible-mode/v1"
+DEFAULT_MODEL = "qwen3.5-plus"
+
+
+@dataclass(slots=True, frozen=True)
+class Config:
+    """LLM connection settings read from the environment."""
+
+    api_key: str
+    base_url: str
+    model: str
+    connect_timeout: float
+    read_timeout: float
+    write_timeout: float
+    pool_timeout: float
+    max_retries: int
+
+
+def _float_env(name: str, default: str) -> float:
+    value = os.environ.get(name, default)
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number, got {value!r}") from None
+
+
+def _int_env(name: str, default: str) -> int:
+    value = os.environ.get(name, default)
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}") from None
+
+
+@lru_cache(maxsize=None)
+def load_config(
+    base_url: str = DEFAULT_BASE_URL, model: str = DEFAULT_MODEL
+) -> Config:
+    """Parse the environment once; later calls return the same config.
+
+    Args:
+        base_url: Base URL used when ``LLM_BASE_URL`` is unset.
+        model: Model name used when ``LLM_MODEL`` is unset.
+
+    Raises:
+        ValueError: If a timeout or retry variable is not a valid number.
+    """
+    return Config(
+        api_key=os.environ.get("LLM_API_KEY", ""),
+        base_url=os.environ.get("LLM_BASE_URL", base_url),
+        model=os.environ.get("LLM_MODEL", model),
+        connect_timeout=_float_env("LLM_CONNECT_TIMEOUT", "10"),
+        read_timeout=_float_env("LLM_READ_TIMEOUT", "120"),
+        write_timeout=_float_env("LLM_WRITE_TIMEOUT", "10"),
+        pool_timeout=_float_env("LLM_POOL_TIMEOUT", "10"),
+        max_retries=_int_env("LLM_MAX_RETRIES", "3"),
+    )
+
+
+def openai_provider(config: Config) -> OpenAIProvider:
+    """Build an ``OpenAIProvider`` with the config's connection settings.
+
+    Each example builds exactly one provider, so this is deliberately not
+    cached: the provider's ``httpx.AsyncClient`` belongs to the event loop of
+    the ``run()`` call that uses it and must not outlive it.
+
+    Args:
+        config: Settings returned by ``load_config()``.
+    """
+    return OpenAIProvider(
+        api_key=config.api_key,
+        base_url=config.base_url,
+        model=config.model,
+        connect_timeout=config.connect_timeout,
+        read_timeout=config.read_timeout,
+        write_timeout=config.write_timeout,
+        pool_timeout=config.pool_timeout,
+    )
@@ -0,0 +1,87 @@
+"""Shared output helpers for the example scripts."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import sys
+
+from ecs_agent.components import ConversationComponent
+
+# Interned role constants; identical objects make each == an identity check
+_ROLE_USER = sys.intern("user")
+_ROLE_ASSISTANT = sys.intern("assistant")
+_ROLE_TOOL = sys.intern("tool")
+
+
+def print_conversation(
+    conv: ConversationComponent | None, *, show_tool_calls: bool = True
+) -> None:
+    """Print a conversation with one labelled entry per message.
+
+    The whole transcript is assembled in memory and written with a single
+    ``sys.stdout.write`` call.
+
+    Args:
+        conv: Conversation to print; ``None`` prints a short notice instead.
+        show_tool_calls: Include assistant tool calls and tool results.
+    """
+    if conv is None:
+        print("No conversation found")
+        return
+
+    buf = io.StringIO()
+    buf.write("\n" + "=" * 60 + "\nCONVERSATION\n" + "=" * 60 + "\n")
+    for msg in conv.messages:
+        role = msg.role
+        if role == _ROLE_USER:
+            buf.write(f"\n[User] {msg.content}\n")
+        elif role == _ROLE_ASSISTANT:
+            if msg.tool_calls and show_tool_calls:
+                for tc in msg.tool_calls:
+                    buf.write(f"\n[Tool Call] {tc.name}({tc.arguments})\n")
+            else:
+                buf.write(f"\n[Assistant] {msg.content}\n")
+        elif role == _ROLE_TOOL and show_tool_calls:
+            buf.write(f"[Tool Result] {msg.content}\n")
+    sys.stdout.write(buf.getvalue())
+
+
+class StreamPrinter:
+    """Write streamed text to stdout, flushing at most once per interval.
+
+    Each chunk is written to stdout's buffer immediately; the flush that puts
+    it on screen is deferred until ``interval`` seconds after the first
+    unflushed chunk. At token rates this turns one flush per delta into
+    about one per frame, with no visible delay. Must be used from within a
+    running event loop; call ``close()`` when the stream ends.
+    """
+
+    __slots__ = ("_interval", "_pending")
+
+    def __init__(self, interval: float = 0.016) -> None:
+        """Create a printer.
+
+        Args:
+            interval: Seconds to coalesce writes before flushing (~60 Hz).
+        """
+        self._interval = interval
+        self._pending: asyncio.TimerHandle | None = None
+
+    def write(self, text: str) -> None:
+        """Buffer ``text`` and schedule a flush if none is pending."""
+        sys.stdout.write(text)
+        if self._pending is None:
+            self._pending = asyncio.get_running_loop().call_later(
+                self._interval, self._flush
+            )
+
+    def _flush(self) -> None:
+        self._pending = None
+        sys.stdout.flush()
+
+    def close(self) -> None:
+        """Flush anything still buffered and cancel the pending flush."""
+        if self._pending is not None:
+            self._pending.cancel()
+        self._flush()
@@ -0,0 +1,39 @@
+"""Shared event-loop entry point for the example scripts.
+
+Examples call ``run(main())`` instead of ``asyncio.run(main())``. When uvloop
+is installed (``pip install -e '.[speedups]'``) the libuv-backed loop is used;
+otherwise the stock asyncio loop runs the coroutine unchanged.
+
+On Python 3.12+ the loop also uses ``asyncio.eager_task_factory`` so tasks
+whose coroutines finish without suspending (fake providers, cached tool
+lookups) complete inline instead of taking a trip through the scheduler.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore[assignment]
+
+
+def run(main: Coroutine[Any, Any, None]) -> None:
+    """Run an example's ``main()`` coroutine to completion.
+
+    The loop comes straight from ``uvloop.new_event_loop`` (no global
+    event-loop policy is installed), is configured once before ``main``
+    starts, and is shut down like ``asyncio.run`` would: pending tasks are
+    cancelled and async generators finalized before the loop closes.
+
+    Args:
+        main: Top-level coroutine of the example script.
+    """
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        if hasattr(asyncio, "eager_task_factory"):
+            runner.get_loop().set_task_factory(asyncio.eager_task_factory)
+        runner.run(main)
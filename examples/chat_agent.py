@@ -7,8 +7,6 @@ This example demonstrates:
 - Printing the conversation history
 """
 
-import asyncio
-
 from ecs_agent.components import ConversationComponent, LLMComponent
 from ecs_agent.core import Runner, World
 from ecs_agent.providers import FakeProvider
@@ -17,6 +15,9 @@ from ecs_agent.systems.memory import MemorySystem
 from ecs_agent.systems.reasoning import ReasoningSystem
 from ecs_agent.types import CompletionResult, Message
 
+from _print import print_conversation
+from _runtime import run
+
 
 async def main() -> None:
     """Run a simple chat agent example."""
@@ -53,9 +54,13 @@ async def main() -> None:
     )
 
     # Register Systems
-    world.register_system(ReasoningSystem(priority=0), priority=0)
-    world.register_system(MemorySystem(), priority=10)
-    world.register_system(ErrorHandlingSystem(priority=99), priority=99)
+    world.register_systems(
+        [
+            (ReasoningSystem(priority=0), 0),
+            (MemorySystem(), 10),
+            (ErrorHandlingSystem(priority=99), 99),
+        ]
+    )
 
     # Run
     runner = Runner()
@@ -63,13 +68,8 @@ async def main() -> None:
 
     # Print results
     conv = world.get_component(agent_id, ConversationComponent)
-    if conv is not None:
-        print("Conversation:")
-        for msg in conv.messages:
-            print(f"  {msg.role}: {msg.content}")
-    else:
-        print("No conversation found")
+    print_conversation(conv)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
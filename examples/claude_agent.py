@@ -16,10 +16,7 @@ Without API credentials, this example falls back to FakeProvider for demonstrati
 
 from __future__ import annotations
 
-import asyncio
-import os
-import sys
-from typing import Any
+from functools import lru_cache
 
 from ecs_agent.components import (
     ConversationComponent,
@@ -35,46 +32,91 @@ from ecs_agent.systems.memory import MemorySystem
 from ecs_agent.systems.reasoning import ReasoningSystem
 from ecs_agent.systems.tool_execution import ToolExecutionSystem
 
+from _config import load_config
+from _print import print_conversation
+from _runtime import run
+
+
+_WEATHER_DB = {
+    "beijing": "Beijing: Sunny, 22°C, humidity 40%",
+    "shanghai": "Shanghai: Cloudy, 20°C, humidity 55%",
+    "shenzhen": "Shenzhen: Rainy, 24°C, humidity 75%",
+}
+_WEATHER_FALLBACK = "Weather for {} not available"
+
+_TIME_DB = {
+    "beijing": "14:30 (UTC+8)",
+    "shanghai": "14:30 (UTC+8)",
+    "newyork": "02:30 (UTC-5)",
+}
+_TIME_FALLBACK = "Time in {} not available"
+
+
+_GET_WEATHER_SCHEMA = ToolSchema(
+    name="get_weather",
+    description="Get the current weather for a city",
+    parameters={
+        "type": "object",
+        "properties": {
+            "city": {
+                "type": "string",
+                "description": "City name",
+            }
+        },
+        "required": ["city"],
+    },
+)
+
+_GET_TIME_SCHEMA = ToolSchema(
+    name="get_time",
+    description="Get the current time in a city",
+    parameters={
+        "type": "object",
+        "properties": {
+            "city": {
+                "type": "string",
+                "description": "City name",
+            }
+        },
+        "required": ["city"],
+    },
+)
+
 
-# Try to import ClaudeProvider; fall back gracefully if not available
-try:
-    from ecs_agent.providers import ClaudeProvider
+# Lookups are deterministic, so repeated or retried calls reuse the cached string
+@lru_cache(maxsize=128)
+def _weather_sync(city: str) -> str:
+    return _WEATHER_DB.get(city.lower()) or _WEATHER_FALLBACK.format(city)
 
-    HAS_CLAUDE = True
-except (ImportError, AttributeError):
-    HAS_CLAUDE = False
+
+@lru_cache(maxsize=128)
+def _time_sync(city: str) -> str:
+    return _TIME_DB.get(city.lower()) or _TIME_FALLBACK.format(city)
 
 
 async def get_weather(city: str) -> str:
     """Simulate getting weather for a city."""
-    weather_db = {
-        "beijing": "Beijing: Sunny, 22°C, humidity 40%",
-        "shanghai": "Shanghai: Cloudy, 20°C, humidity 55%",
-        "shenzhen": "Shenzhen: Rainy, 24°C, humidity 75%",
-    }
-    return weather_db.get(city.lower(), f"Weather for {city} not available")
+    return _weather_sync(city)
 
 
 async def get_time(city: str) -> str:
     """Simulate getting current time in a city."""
-    time_db = {
-        "beijing": "14:30 (UTC+8)",
-        "shanghai": "14:30 (UTC+8)",
-        "newyork": "02:30 (UTC-5)",
-    }
-    return time_db.get(city.lower(), f"Time in {city} not available")
+    return _time_sync(city)
 
 
 async def main() -> None:
     """Run ClaudeProvider agent example."""
     # Load config from environment
-    api_key = os.environ.get("LLM_API_KEY", "")
-    base_url = os.environ.get("LLM_BASE_URL", "https://api.anthropic.com")
-    model = os.environ.get("LLM_MODEL", "claude-3-5-haiku-latest")
+    config = load_config(base_url="https://api.anthropic.com", model="claude-3-5-haiku-latest")
+    api_key = config.api_key
+    base_url = config.base_url
+    model = config.model
 
     # Decide which provider to use
     provider: LLMProvider
-    if api_key and HAS_CLAUDE:
+    if api_key:
+        from ecs_agent.providers.claude_provider import ClaudeProvider
+
         print(f"Using ClaudeProvider: {model}")
         provider = ClaudeProvider(
             api_key=api_key,
@@ -82,7 +124,7 @@ async def main() -> None:
             model=model,
         )
     else:
-        print("Using FakeProvider (no API key or ClaudeProvider unavailable)")
+        print("Using FakeProvider (no API key)")
         provider = FakeProvider(
             responses=[
                 CompletionResult(
@@ -121,44 +163,22 @@ async def main() -> None:
         agent_id,
         ToolRegistryComponent(
             tools={
-                "get_weather": ToolSchema(
-                    name="get_weather",
-                    description="Get the current weather for a city",
-                    parameters={
-                        "type": "object",
-                        "properties": {
-                            "city": {
-                                "type": "string",
-                                "description": "City name",
-                            }
-                        },
-                        "required": ["city"],
-                    },
-                ),
-                "get_time": ToolSchema(
-                    name="get_time",
-                    description="Get the current time in a city",
-                    parameters={
-                        "type": "object",
-                        "properties": {
-                            "city": {
-                                "type": "string",
-                                "description": "City name",
-                            }
-                        },
-                        "required": ["city"],
-                    },
-                ),
+                "get_weather": _GET_WEATHER_SCHEMA,
+                "get_time": _GET_TIME_SCHEMA,
             },
             handlers={"get_weather": get_weather, "get_time": get_time},
         ),
     )
 
     # Register systems
-    world.register_system(ReasoningSystem(priority=0), priority=0)
-    world.register_system(ToolExecutionSystem(priority=5), priority=5)
-    world.register_system(MemorySystem(), priority=10)
-    world.register_system(ErrorHandlingSystem(priority=99), priority=99)
+    world.register_systems(
+        [
+            (ReasoningSystem(priority=0), 0),
+            (ToolExecutionSystem(priority=5, parallel=True), 5),
+            (MemorySystem(), 10),
+            (ErrorHandlingSystem(priority=99), 99),
+        ]
+    )
 
     # Run the agent
     print("Running agent...\n")
@@ -167,22 +187,8 @@ async def main() -> None:
 
     # Print conversation
     conv = world.get_component(agent_id, ConversationComponent)
-    if conv:
-        print("\n" + "=" * 60)
-        print("CONVERSATION")
-        print("=" * 60)
-        for msg in conv.messages:
-            if msg.role == "user":
-                print(f"\n[User] {msg.content}")
-            elif msg.role == "assistant":
-                if msg.tool_calls:
-                    for tc in msg.tool_calls:
-                        print(f"\n[Tool Call] {tc.name}({tc.arguments})")
-                else:
-                    print(f"\n[Assistant] {msg.content}")
-            elif msg.role == "tool":
-                print(f"[Tool Result] {msg.content}")
+    print_conversation(conv)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
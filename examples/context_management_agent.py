@@ -14,8 +14,9 @@ Usage:
 
 from __future__ import annotations
 
-import asyncio
 import json
+import os
+import sys
 import tempfile
 from pathlib import Path
 
@@ -34,41 +35,65 @@ from ecs_agent.systems.memory import MemorySystem
 from ecs_agent.systems.reasoning import ReasoningSystem
 from ecs_agent.types import CompletionResult, Message, Usage
 
+from _runtime import run
+
+
+# Runner keeps no per-run state (ticks live in RunnerStateComponent), so one
+# instance drives every world in this demo.
+_RUNNER = Runner()
+
+_FAKE_TEMPLATE: tuple[CompletionResult, ...] = (
+    CompletionResult(
+        message=Message(
+            role="assistant",
+            content="This is response 1 from the agent.",
+        ),
+        usage=Usage(prompt_tokens=10, completion_tokens=20, total_tokens=30),
+    ),
+    CompletionResult(
+        message=Message(
+            role="assistant",
+            content="This is response 2 from the agent.",
+        ),
+        usage=Usage(prompt_tokens=10, completion_tokens=20, total_tokens=30),
+    ),
+    CompletionResult(
+        message=Message(
+            role="assistant",
+            content="This is response 3 from the agent.",
+        ),
+        usage=Usage(prompt_tokens=10, completion_tokens=20, total_tokens=30),
+    ),
+    CompletionResult(
+        message=Message(
+            role="assistant",
+            content="Summary of conversation so far.",
+        ),
+        usage=Usage(prompt_tokens=50, completion_tokens=30, total_tokens=80),
+    ),
+)
+
+
+def _truncate(text: str, limit: int = 50) -> str:
+    """Shorten text to limit characters, marking the cut with an ellipsis."""
+    head = text[: limit + 1]
+    return head[:limit] + "..." if len(head) > limit else text
+
+
+def _dump(conv: ConversationComponent | None, limit: int = 50) -> None:
+    """Print an indexed, truncated listing of a conversation."""
+    if conv is None or not conv.messages:
+        return
+    lines = [
+        f"  [{i}] {msg.role}: {_truncate(msg.content, limit)}"
+        for i, msg in enumerate(conv.messages)
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
 def create_fake_provider() -> FakeProvider:
     """Create a FakeProvider with deterministic responses."""
-    return FakeProvider(
-        responses=[
-            CompletionResult(
-                message=Message(
-                    role="assistant",
-                    content="This is response 1 from the agent.",
-                ),
-                usage=Usage(prompt_tokens=10, completion_tokens=20, total_tokens=30),
-            ),
-            CompletionResult(
-                message=Message(
-                    role="assistant",
-                    content="This is response 2 from the agent.",
-                ),
-                usage=Usage(prompt_tokens=10, completion_tokens=20, total_tokens=30),
-            ),
-            CompletionResult(
-                message=Message(
-                    role="assistant",
-                    content="This is response 3 from the agent.",
-                ),
-                usage=Usage(prompt_tokens=10, completion_tokens=20, total_tokens=30),
-            ),
-            CompletionResult(
-                message=Message(
-                    role="assistant",
-                    content="Summary of conversation so far.",
-                ),
-                usage=Usage(prompt_tokens=50, completion_tokens=30, total_tokens=80),
-            ),
-        ]
-    )
+    return FakeProvider(responses=_FAKE_TEMPLATE)
 
 
 async def part_1_undo() -> None:
@@ -99,24 +124,24 @@ async def part_1_undo() -> None:
     world.add_component(agent_id, CheckpointComponent(max_snapshots=10))
 
     # Register systems
-    world.register_system(ReasoningSystem(priority=0), priority=0)
-    world.register_system(CheckpointSystem(), priority=1)
-    world.register_system(MemorySystem(), priority=10)
-    world.register_system(ErrorHandlingSystem(priority=99), priority=99)
+    world.register_systems(
+        [
+            (ReasoningSystem(priority=0), 0),
+            (CheckpointSystem(), 1),
+            (MemorySystem(), 10),
+            (ErrorHandlingSystem(priority=99), 99),
+        ]
+    )
 
     # Run for 3 ticks
-    runner = Runner()
-    await runner.run(world, max_ticks=3)
+    await _RUNNER.run(world, max_ticks=3)
 
     # Show conversation after 3 ticks
     conv = world.get_component(agent_id, ConversationComponent)
     print(
         f"\nAfter 3 ticks: {len(conv.messages) if conv else 0} messages in conversation"
     )
-    if conv:
-        for i, msg in enumerate(conv.messages):
-            content = msg.content[:50] + "..." if len(msg.content) > 50 else msg.content
-            print(f"  [{i}] {msg.role}: {content}")
+    _dump(conv)
 
     # Undo the last tick
     print("\nUndoing last tick...")
@@ -125,10 +150,7 @@ async def part_1_undo() -> None:
     # Show conversation after undo
     conv = world.get_component(agent_id, ConversationComponent)
     print(f"\nAfter undo: {len(conv.messages) if conv else 0} messages in conversation")
-    if conv:
-        for i, msg in enumerate(conv.messages):
-            content = msg.content[:50] + "..." if len(msg.content) > 50 else msg.content
-            print(f"  [{i}] {msg.role}: {content}")
+    _dump(conv)
 
     print("\n✓ Undo complete — conversation reverted to prior state")
 
@@ -162,28 +184,28 @@ async def part_2_resume() -> None:
     )
 
     # Register systems
-    world.register_system(ReasoningSystem(priority=0), priority=0)
-    world.register_system(MemorySystem(), priority=10)
-    world.register_system(ErrorHandlingSystem(priority=99), priority=99)
+    world.register_systems(
+        [
+            (ReasoningSystem(priority=0), 0),
+            (MemorySystem(), 10),
+            (ErrorHandlingSystem(priority=99), 99),
+        ]
+    )
 
     # Run for 2 ticks
-    runner = Runner()
-    await runner.run(world, max_ticks=2)
+    await _RUNNER.run(world, max_ticks=2)
 
     # Show initial state
     conv = world.get_component(agent_id, ConversationComponent)
     print(f"\nAfter 2 ticks: {len(conv.messages) if conv else 0} messages")
-    if conv:
-        for i, msg in enumerate(conv.messages):
-            content = msg.content[:50] + "..." if len(msg.content) > 50 else msg.content
-            print(f"  [{i}] {msg.role}: {content}")
+    _dump(conv)
 
     # Save checkpoint to temp file
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        checkpoint_path = f.name
+    fd, checkpoint_path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
 
     try:
-        runner.save_checkpoint(world, checkpoint_path)
+        _RUNNER.save_checkpoint(world, checkpoint_path)
         print(f"\n✓ Checkpoint saved to {checkpoint_path}")
 
         # Load checkpoint and resume
@@ -192,21 +214,15 @@ async def part_2_resume() -> None:
         )
         print(f"✓ Checkpoint loaded (current_tick={current_tick})")
 
-        # Create new runner and resume from saved state
-        new_runner = Runner()
-        await new_runner.run(loaded_world, max_ticks=4, start_tick=current_tick)
+        # Resume from saved state; the tick count lives in the loaded world
+        await _RUNNER.run(loaded_world, max_ticks=4, start_tick=current_tick)
 
         # Show final state
         conv = loaded_world.get_component(agent_id, ConversationComponent)
         print(
             f"\nAfter resume and 2 more ticks: {len(conv.messages) if conv else 0} messages"
         )
-        if conv:
-            for i, msg in enumerate(conv.messages):
-                content = (
-                    msg.content[:50] + "..." if len(msg.content) > 50 else msg.content
-                )
-                print(f"  [{i}] {msg.role}: {content}")
+        _dump(conv)
 
         print("\n✓ Resume complete — state preserved and execution continued")
 
@@ -215,6 +231,36 @@ async def part_2_resume() -> None:
         Path(checkpoint_path).unlink(missing_ok=True)
 
 
+# Long conversation (10+ messages) used to exceed the compaction threshold.
+_INITIAL_MESSAGES: tuple[Message, ...] = (
+    Message(role="user", content="What is machine learning?"),
+    Message(
+        role="assistant",
+        content="Machine learning is a branch of artificial intelligence that focuses on the development of algorithms and statistical models.",
+    ),
+    Message(role="user", content="Can you explain neural networks?"),
+    Message(
+        role="assistant",
+        content="Neural networks are computing systems inspired by the biological neural networks in animal brains.",
+    ),
+    Message(role="user", content="What is deep learning?"),
+    Message(
+        role="assistant",
+        content="Deep learning is a subset of machine learning that uses neural networks with multiple layers.",
+    ),
+    Message(role="user", content="Tell me about transformers."),
+    Message(
+        role="assistant",
+        content="Transformers are a type of neural network architecture introduced in 2017 for natural language processing.",
+    ),
+    Message(role="user", content="What is a token?"),
+    Message(
+        role="assistant",
+        content="A token is a unit of text that an LLM processes, typically a word, subword, or character.",
+    ),
+)
+
+
 async def part_3_compact() -> None:
     """Part 3: Demonstrate conversation compaction."""
     print("\n" + "=" * 70)
@@ -227,35 +273,6 @@ async def part_3_compact() -> None:
 
     agent_id = world.create_entity()
 
-    # Build a long conversation (10+ messages to exceed threshold)
-    initial_messages = [
-        Message(role="user", content="What is machine learning?"),
-        Message(
-            role="assistant",
-            content="Machine learning is a branch of artificial intelligence that focuses on the development of algorithms and statistical models.",
-        ),
-        Message(role="user", content="Can you explain neural networks?"),
-        Message(
-            role="assistant",
-            content="Neural networks are computing systems inspired by the biological neural networks in animal brains.",
-        ),
-        Message(role="user", content="What is deep learning?"),
-        Message(
-            role="assistant",
-            content="Deep learning is a subset of machine learning that uses neural networks with multiple layers.",
-        ),
-        Message(role="user", content="Tell me about transformers."),
-        Message(
-            role="assistant",
-            content="Transformers are a type of neural network architecture introduced in 2017 for natural language processing.",
-        ),
-        Message(role="user", content="What is a token?"),
-        Message(
-            role="assistant",
-            content="A token is a unit of text that an LLM processes, typically a word, subword, or character.",
-        ),
-    ]
-
     world.add_component(
         agent_id,
         LLMComponent(
@@ -266,7 +283,7 @@ async def part_3_compact() -> None:
     )
     world.add_component(
         agent_id,
-        ConversationComponent(messages=initial_messages),
+        ConversationComponent(messages=list(_INITIAL_MESSAGES)),
     )
     world.add_component(
         agent_id,
@@ -276,12 +293,16 @@ async def part_3_compact() -> None:
         ),
     )
 
-    print(f"\nBefore compaction: {len(initial_messages)} messages")
+    print(f"\nBefore compaction: {len(_INITIAL_MESSAGES)} messages")
 
     # Register systems
-    world.register_system(CompactionSystem(bisect_ratio=0.5), priority=0)
-    world.register_system(MemorySystem(), priority=10)
-    world.register_system(ErrorHandlingSystem(priority=99), priority=99)
+    world.register_systems(
+        [
+            (CompactionSystem(bisect_ratio=0.5), 0),
+            (MemorySystem(), 10),
+            (ErrorHandlingSystem(priority=99), 99),
+        ]
+    )
 
     # Run one tick to trigger compaction
     await world.process()
@@ -291,9 +312,7 @@ async def part_3_compact() -> None:
     if conv:
         print(f"\nAfter compaction: {len(conv.messages)} messages")
         print("\nCompacted conversation:")
-        for i, msg in enumerate(conv.messages):
-            content = msg.content[:60] + "..." if len(msg.content) > 60 else msg.content
-            print(f"  [{i}] {msg.role}: {content}")
+        _dump(conv, limit=60)
 
         # Show if archive was created
         from ecs_agent.components import ConversationArchiveComponent
@@ -325,4 +344,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
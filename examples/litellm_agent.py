@@ -15,10 +15,8 @@ If litellm is not installed or API key is missing, the example gracefully falls
 
 from __future__ import annotations
 
-import asyncio
-import os
-import sys
-from typing import Any
+import importlib.util
+from functools import lru_cache
 
 from ecs_agent.components import (
     ConversationComponent,
@@ -34,48 +32,73 @@ from ecs_agent.systems.memory import MemorySystem
 from ecs_agent.systems.reasoning import ReasoningSystem
 from ecs_agent.systems.tool_execution import ToolExecutionSystem
 
+from _config import load_config
+from _print import print_conversation
+from _runtime import run
 
-# Try to import LiteLLMProvider; gracefully handle if litellm is not installed
-try:
-    from ecs_agent.providers import LiteLLMProvider
 
-    HAS_LITELLM = True
-except (ImportError, AttributeError):
-    HAS_LITELLM = False
+# Probe for litellm without importing it; the provider is imported lazily in main()
+HAS_LITELLM = importlib.util.find_spec("litellm") is not None
+
+
+_RESULTS = {
+    "users": "Found 42 users matching the search",
+    "products": "Found 156 products in inventory",
+    "orders": "Found 89 recent orders",
+}
+_RESULTS_FALLBACK = "No results for '{}'"
+
+
+_SEARCH_DB_SCHEMA = ToolSchema(
+    name="search_database",
+    description="Search the database for entities",
+    parameters={
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "What to search for (users, products, or orders)",
+            }
+        },
+        "required": ["query"],
+    },
+)
+
+
+# Lookups are deterministic, so repeated or retried calls reuse the cached string
+@lru_cache(maxsize=128)
+def _search_sync(query: str) -> str:
+    return _RESULTS.get(query.lower()) or _RESULTS_FALLBACK.format(query)
 
 
 async def search_database(query: str) -> str:
     """Simulate searching a database."""
-    results = {
-        "users": "Found 42 users matching the search",
-        "products": "Found 156 products in inventory",
-        "orders": "Found 89 recent orders",
-    }
-    return results.get(query.lower(), f"No results for '{query}'")
+    return _search_sync(query)
 
 
 async def main() -> None:
     """Run LiteLLMProvider agent example."""
     # Check if litellm is installed
     if not HAS_LITELLM:
-        print("litellm is not installed.")
-        print("Install with: pip install litellm")
-        sys.exit(0)
+        print("litellm is not installed (pip install litellm).")
 
     # Load config from environment
-    api_key = os.environ.get("LLM_API_KEY", "")
-    model = os.environ.get("LLM_MODEL", "")
+    config = load_config(model="")
+    api_key = config.api_key
+    model = config.model
 
     # Decide which provider to use
     provider: LLMProvider
-    if api_key and model:
+    if HAS_LITELLM and api_key and model:
+        from ecs_agent.providers.litellm_provider import LiteLLMProvider
+
         print(f"Using LiteLLMProvider: {model}")
         provider = LiteLLMProvider(
             model=model,
             api_key=api_key,
         )
     else:
-        print("No API key or model specified. Using FakeProvider instead.")
+        print("No litellm, API key or model available. Using FakeProvider instead.")
         provider = FakeProvider(
             responses=[
                 CompletionResult(
@@ -113,31 +136,20 @@ async def main() -> None:
     world.add_component(
         agent_id,
         ToolRegistryComponent(
-            tools={
-                "search_database": ToolSchema(
-                    name="search_database",
-                    description="Search the database for entities",
-                    parameters={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "What to search for (users, products, or orders)",
-                            }
-                        },
-                        "required": ["query"],
-                    },
-                ),
-            },
+            tools={"search_database": _SEARCH_DB_SCHEMA},
             handlers={"search_database": search_database},
         ),
     )
 
     # Register systems
-    world.register_system(ReasoningSystem(priority=0), priority=0)
-    world.register_system(ToolExecutionSystem(priority=5), priority=5)
-    world.register_system(MemorySystem(), priority=10)
-    world.register_system(ErrorHandlingSystem(priority=99), priority=99)
+    world.register_systems(
+        [
+            (ReasoningSystem(priority=0), 0),
+            (ToolExecutionSystem(priority=5, parallel=True), 5),
+            (MemorySystem(), 10),
+            (ErrorHandlingSystem(priority=99), 99),
+        ]
+    )
 
     # Run the agent
     print("Running agent...\n")
@@ -146,22 +158,8 @@ async def main() -> None:
 
     # Print conversation
     conv = world.get_component(agent_id, ConversationComponent)
-    if conv:
-        print("\n" + "=" * 60)
-        print("CONVERSATION")
-        print("=" * 60)
-        for msg in conv.messages:
-            if msg.role == "user":
-                print(f"\n[User] {msg.content}")
-            elif msg.role == "assistant":
-                if msg.tool_calls:
-                    for tc in msg.tool_calls:
-                        print(f"\n[Tool Call] {tc.name}({tc.arguments})")
-                else:
-                    print(f"\n[Assistant] {msg.content}")
-            elif msg.role == "tool":
-                print(f"[Tool Result] {msg.content}")
+    print_conversation(conv)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
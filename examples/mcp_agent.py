@@ -8,9 +8,9 @@ This example shows how to:
 4. Verify that MCP tools are correctly namespaced and accessible.
 """
 
-import asyncio
-import json
-from typing import Any
+import importlib.util
+from collections.abc import Callable
+from typing import Any, ClassVar
 
 from ecs_agent import SkillManager
 from ecs_agent.components import ConversationComponent, LLMComponent
@@ -20,20 +20,30 @@ from ecs_agent.systems.reasoning import ReasoningSystem
 from ecs_agent.systems.tool_execution import ToolExecutionSystem
 from ecs_agent.types import CompletionResult, Message, ToolCall
 
-# Check if MCP is available
-try:
-    from ecs_agent.mcp.adapter import MCPSkillAdapter
-    from ecs_agent.mcp.client import MCPClient
-    from ecs_agent.mcp.components import MCPConfigComponent
+from _print import print_conversation
+from _runtime import run
+
+# Probe for the mcp package without importing it; ecs_agent.mcp is imported in main()
+HAS_MCP = importlib.util.find_spec("mcp") is not None
+
+
+def _get_weather(args: dict[str, Any]) -> str:
+    city = args.get("city", "unknown")
+    return f"The weather in {city} is sunny, 22°C."
+
 
-    HAS_MCP = True
-except ImportError:
-    HAS_MCP = False
+def _unknown(args: dict[str, Any]) -> str:
+    return "Unknown tool"
 
 
 class MockMCPClient:
     """A mock MCP client that simulates server behavior for demonstration."""
 
+    # Tool name -> handler; unknown names fall back to _unknown
+    _HANDLERS: ClassVar[dict[str, Callable[[dict[str, Any]], str]]] = {
+        "get_weather": _get_weather,
+    }
+
     def __init__(self, config: Any) -> None:
         self.server_name = config.server_name
         self.is_connected = False
@@ -58,10 +68,7 @@ class MockMCPClient:
         ]
 
     async def call_tool(self, name: str, args: dict[str, Any]) -> str:
-        if name == "get_weather":
-            city = args.get("city", "unknown")
-            return f"The weather in {city} is sunny, 22°C."
-        return "Unknown tool"
+        return self._HANDLERS.get(name, _unknown)(args)
 
 
 async def main() -> None:
@@ -69,6 +76,9 @@ async def main() -> None:
         print("MCP dependencies not found. Install with: uv pip install -e '.[mcp]'")
         return
 
+    from ecs_agent.mcp.adapter import MCPSkillAdapter
+    from ecs_agent.mcp.components import MCPConfigComponent
+
     world = World()
     agent = world.create_entity()
 
@@ -120,8 +130,12 @@ async def main() -> None:
     manager = SkillManager()
     manager.install(world, agent, skill)
 
-    world.register_system(ReasoningSystem(), priority=0)
-    world.register_system(ToolExecutionSystem(), priority=5)
+    world.register_systems(
+        [
+            (ReasoningSystem(), 0),
+            (ToolExecutionSystem(), 5),
+        ]
+    )
 
     # 5. Run loop
     print("Starting MCP agent demo...")
@@ -130,10 +144,8 @@ async def main() -> None:
 
     # Verify that the tool was called and results captured
     conv = world.get_component(agent, ConversationComponent)
-    if conv:
-        for msg in conv.messages:
-            print(f"{msg.role}: {msg.content}")
+    print_conversation(conv)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
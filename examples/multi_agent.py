@@ -3,13 +3,13 @@
 This example demonstrates:
 - Creating a World with ReasoningSystem, CollaborationSystem, MemorySystem, and ErrorHandlingSystem
 - Creating two Agent Entities (researcher and summarizer)
-- Setting up CollaborationComponent with peers and inbox
+- Setting up CollaborationComponent with peers and inbox queues
 - Agent A sends a message to Agent B via inbox
 - Running the agents to process collaboration messages
 - Printing both agents' conversations
 """
 
-import asyncio
+from collections import deque
 
 from ecs_agent.components import (
     CollaborationComponent,
@@ -24,6 +24,8 @@ from ecs_agent.systems.memory import MemorySystem
 from ecs_agent.systems.reasoning import ReasoningSystem
 from ecs_agent.types import CompletionResult, Message
 
+from _runtime import run
+
 
 async def main() -> None:
     """Run a multi-agent collaboration example."""
@@ -89,26 +91,28 @@ async def main() -> None:
     # Set up collaboration: Agent A sends message to Agent B
     world.add_component(
         agent_a_id,
-        CollaborationComponent(peers=[agent_b_id], inbox=[]),
+        CollaborationComponent(peers=[agent_b_id]),
     )
     world.add_component(
         agent_b_id,
         CollaborationComponent(
             peers=[agent_a_id],
-            inbox=[
-                (
-                    agent_a_id,
-                    Message(role="assistant", content="I found interesting data."),
-                )
-            ],
+            senders=deque([agent_a_id]),
+            messages=deque(
+                [Message(role="assistant", content="I found interesting data.")]
+            ),
         ),
     )
 
     # Register Systems
-    world.register_system(ReasoningSystem(priority=0), priority=0)
-    world.register_system(CollaborationSystem(priority=5), priority=5)
-    world.register_system(MemorySystem(), priority=10)
-    world.register_system(ErrorHandlingSystem(priority=99), priority=99)
+    world.register_systems(
+        [
+            (ReasoningSystem(priority=0), 0),
+            (CollaborationSystem(priority=5), 5),
+            (MemorySystem(), 10),
+            (ErrorHandlingSystem(priority=99), 99),
+        ]
+    )
 
     # Run
     runner = Runner()
@@ -133,4 +137,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -5,7 +5,6 @@ This script shows how to restrict an agent's access to specific tools using
 a whitelist/blacklist policy.
 """
 
-import asyncio
 
 from ecs_agent.core import World, Runner
 from ecs_agent.components import (
@@ -20,6 +19,8 @@ from ecs_agent.systems.permission import PermissionSystem
 from ecs_agent.systems.tool_execution import ToolExecutionSystem
 from ecs_agent.types import CompletionResult, Message, ToolCall, ToolSchema
 
+from _runtime import run
+
 
 async def main() -> None:
     world = World()
@@ -53,8 +54,12 @@ async def main() -> None:
     world.add_component(agent, ConversationComponent(messages=[]))
 
     # 3. Register PermissionSystem (priority -10) and ToolExecutionSystem (priority 5)
-    world.register_system(PermissionSystem(priority=-10), priority=-10)
-    world.register_system(ToolExecutionSystem(priority=5), priority=5)
+    world.register_systems(
+        [
+            (PermissionSystem(priority=-10), -10),
+            (ToolExecutionSystem(priority=5), 5),
+        ]
+    )
 
     # 4. Attempt to call both tools
     print("Attempting to call 'safe_tool' and 'dangerous_tool'...")
@@ -82,4 +87,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -25,22 +25,22 @@ Environment variables:
 
 from __future__ import annotations
 
-import asyncio
-import os
 import sys
+from collections.abc import Callable
 
 from ecs_agent.components import (
     ConversationComponent,
     LLMComponent,
+    PlanCacheComponent,
     PlanComponent,
     SystemPromptComponent,
     ToolRegistryComponent,
 )
 from ecs_agent.core import Runner, World
-from ecs_agent.providers import OpenAIProvider
 from ecs_agent.providers.retry_provider import RetryProvider
 from ecs_agent.systems.error_handling import ErrorHandlingSystem
 from ecs_agent.systems.memory import MemorySystem
+from ecs_agent.systems.plan_cache import PlanCacheSystem
 from ecs_agent.systems.planning import PlanningSystem
 from ecs_agent.systems.replanning import ReplanningSystem
 from ecs_agent.systems.tool_execution import ToolExecutionSystem
@@ -52,24 +52,129 @@ from ecs_agent.types import (
     ToolSchema,
 )
 
+from _config import load_config, openai_provider
+from _runtime import run
+
+
+_CONFIG = load_config()
+
+# Completed plans keyed by fingerprint; share across worlds to replay a plan
+# whose prompt, goal, steps and tools match an earlier run without LLM calls
+_PLAN_CACHE: dict[str, list[Message]] = {}
+
+# Tool schemas built once at import; the provider reuses its converted request
+# payload for as long as these ToolSchema objects stay registered
+_TOOLS = {
+    "get_weather": ToolSchema(
+        name="get_weather",
+        description="Get the weather forecast for a city",
+        parameters={
+            "type": "object",
+            "properties": {
+                "city": {
+                    "type": "string",
+                    "description": "The city name, e.g. 'Beijing'",
+                }
+            },
+            "required": ["city"],
+        },
+    ),
+    "search_attractions": ToolSchema(
+        name="search_attractions",
+        description="Search for popular tourist attractions in a city",
+        parameters={
+            "type": "object",
+            "properties": {
+                "city": {
+                    "type": "string",
+                    "description": "The city name, e.g. 'Beijing'",
+                }
+            },
+            "required": ["city"],
+        },
+    ),
+    "search_restaurants": ToolSchema(
+        name="search_restaurants",
+        description="Search for recommended restaurants in a city",
+        parameters={
+            "type": "object",
+            "properties": {
+                "city": {
+                    "type": "string",
+                    "description": "The city name, e.g. 'Beijing'",
+                },
+                "cuisine_type": {
+                    "type": "string",
+                    "description": "Type of cuisine to search for (optional)",
+                },
+            },
+            "required": ["city"],
+        },
+    ),
+    "check_transport": ToolSchema(
+        name="check_transport",
+        description="Check transport options between two cities",
+        parameters={
+            "type": "object",
+            "properties": {
+                "from_city": {
+                    "type": "string",
+                    "description": "Departure city",
+                },
+                "to_city": {
+                    "type": "string",
+                    "description": "Destination city",
+                },
+            },
+            "required": ["from_city", "to_city"],
+        },
+    ),
+}
+
 
 # ---------------------------------------------------------------------------
 # Tool definitions — simulated tools for travel planning
 # ---------------------------------------------------------------------------
 
+# Lookup tables keyed by lowercase city name, built once at import rather
+# than on every tool call
+_WEATHER: dict[str, str] = {
+    "beijing": (
+        "Beijing 3-day forecast:\n"
+        "  Day 1: Rainy, 15°C, humidity 75%\n"
+        "  Day 2: Sunny, 22°C, humidity 40%\n"
+        "  Day 3: Sunny, 24°C, humidity 35%"
+    ),
+    "shanghai": "Shanghai: Cloudy, 20-25°C, moderate humidity",
+}
+
+_ATTRACTIONS: dict[str, str] = {
+    "beijing": (
+        "Top attractions in Beijing:\n"
+        "  1. 故宫 (Forbidden City) — Imperial palace, indoor, 3-4 hours\n"
+        "  2. 长城 (Great Wall) — Outdoor, full day trip\n"
+        "  3. 天坛 (Temple of Heaven) — Park & temple, 2-3 hours\n"
+        "  4. 颐和园 (Summer Palace) — Gardens & lake, 3-4 hours\n"
+        "  5. 798艺术区 (798 Art District) — Indoor galleries, 2-3 hours\n"
+        "  6. 国家博物馆 (National Museum) — Indoor, 3-4 hours"
+    ),
+}
+
+_RESTAURANTS: dict[str, str] = {
+    "beijing": (
+        "Recommended restaurants in Beijing:\n"
+        "  1. 全聚德 (Quanjude) — Peking Duck, ¥200-300/person\n"
+        "  2. 便宜坊 (Bianyifang) — Peking Duck, ¥150-250/person\n"
+        "  3. 东来顺 (Donglaishun) — Hot Pot, ¥150-200/person\n"
+        "  4. 护国寺小吃 (Huguosi Snacks) — Local snacks, ¥30-50/person\n"
+        "  5. 南锣鼓巷小吃街 (Nanluoguxiang Food Street) — Street food, ¥20-60/person"
+    ),
+}
+
 
 async def get_weather(city: str) -> str:
     """Simulate fetching weather forecast for a city."""
-    weather_db = {
-        "beijing": (
-            "Beijing 3-day forecast:\n"
-            "  Day 1: Rainy, 15°C, humidity 75%\n"
-            "  Day 2: Sunny, 22°C, humidity 40%\n"
-            "  Day 3: Sunny, 24°C, humidity 35%"
-        ),
-        "shanghai": "Shanghai: Cloudy, 20-25°C, moderate humidity",
-    }
-    result = weather_db.get(city.lower())
+    result = _WEATHER.get(city.lower())
     if result:
         return result
     return f"Weather data not available for {city}"
@@ -77,18 +182,7 @@ async def get_weather(city: str) -> str:
 
 async def search_attractions(city: str) -> str:
     """Simulate searching for tourist attractions."""
-    attractions_db = {
-        "beijing": (
-            "Top attractions in Beijing:\n"
-            "  1. 故宫 (Forbidden City) — Imperial palace, indoor, 3-4 hours\n"
-            "  2. 长城 (Great Wall) — Outdoor, full day trip\n"
-            "  3. 天坛 (Temple of Heaven) — Park & temple, 2-3 hours\n"
-            "  4. 颐和园 (Summer Palace) — Gardens & lake, 3-4 hours\n"
-            "  5. 798艺术区 (798 Art District) — Indoor galleries, 2-3 hours\n"
-            "  6. 国家博物馆 (National Museum) — Indoor, 3-4 hours"
-        ),
-    }
-    result = attractions_db.get(city.lower())
+    result = _ATTRACTIONS.get(city.lower())
     if result:
         return result
     return f"No attraction data for {city}"
@@ -96,17 +190,7 @@ async def search_attractions(city: str) -> str:
 
 async def search_restaurants(city: str, cuisine_type: str = "") -> str:
     """Simulate searching for restaurants."""
-    restaurants_db = {
-        "beijing": (
-            "Recommended restaurants in Beijing:\n"
-            "  1. 全聚德 (Quanjude) — Peking Duck, ¥200-300/person\n"
-            "  2. 便宜坊 (Bianyifang) — Peking Duck, ¥150-250/person\n"
-            "  3. 东来顺 (Donglaishun) — Hot Pot, ¥150-200/person\n"
-            "  4. 护国寺小吃 (Huguosi Snacks) — Local snacks, ¥30-50/person\n"
-            "  5. 南锣鼓巷小吃街 (Nanluoguxiang Food Street) — Street food, ¥20-60/person"
-        ),
-    }
-    result = restaurants_db.get(city.lower())
+    result = _RESTAURANTS.get(city.lower())
     if result:
         return result
     return f"No restaurant data for {city}"
@@ -141,6 +225,40 @@ async def on_plan_revised(event: PlanRevisedEvent) -> None:
     print()
 
 
+# ---------------------------------------------------------------------------
+# Conversation printing — one handler per message role
+# ---------------------------------------------------------------------------
+
+
+def _print_user(msg: Message) -> None:
+    print(f"\n[User] {msg.content}")
+
+
+def _print_assistant(msg: Message) -> None:
+    if msg.tool_calls:
+        for tc in msg.tool_calls:
+            print(f"\n[Action] {tc.name}({tc.arguments})")
+    else:
+        print(f"\n[Thought] {msg.content}")
+
+
+def _print_tool(msg: Message) -> None:
+    print(f"[Observation] {msg.content}")
+
+
+def _skip(msg: Message) -> None:
+    """System messages and unknown roles are not printed."""
+
+
+# One dict lookup per message instead of an if/elif chain over roles
+_PRINT_BY_ROLE: dict[str, Callable[[Message], None]] = {
+    "user": _print_user,
+    "assistant": _print_assistant,
+    "tool": _print_tool,
+    "system": _skip,
+}
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -148,47 +266,29 @@ async def on_plan_revised(event: PlanRevisedEvent) -> None:
 
 async def main() -> None:
     """Run a Plan-and-Execute agent that plans a Beijing 3-day trip."""
-    # --- Load config from environment ---
-    api_key = os.environ.get("LLM_API_KEY", "")
-    if not api_key:
+    # --- Config is parsed once at import (see _config.load_config) ---
+    config = _CONFIG
+    if not config.api_key:
         print("Error: LLM_API_KEY environment variable is required.")
         print("Copy .env.example to .env and fill in your API key.")
         sys.exit(1)
 
-    base_url = os.environ.get(
-        "LLM_BASE_URL", "https://dashscope.aliyuncs.com/compatible-mode/v1"
-    )
-    model = os.environ.get("LLM_MODEL", "qwen3.5-plus")
-    connect_timeout = float(os.environ.get("LLM_CONNECT_TIMEOUT", "10"))
-    read_timeout = float(os.environ.get("LLM_READ_TIMEOUT", "120"))
-    write_timeout = float(os.environ.get("LLM_WRITE_TIMEOUT", "10"))
-    pool_timeout = float(os.environ.get("LLM_POOL_TIMEOUT", "10"))
-    max_retries = int(os.environ.get("LLM_MAX_RETRIES", "3"))
-
-    print(f"Using model: {model}")
-    print(f"Base URL: {base_url}")
+    print(f"Using model: {config.model}")
+    print(f"Base URL: {config.base_url}")
     print(
         "Timeouts: "
-        f"connect={connect_timeout}s read={read_timeout}s "
-        f"write={write_timeout}s pool={pool_timeout}s"
+        f"connect={config.connect_timeout}s read={config.read_timeout}s "
+        f"write={config.write_timeout}s pool={config.pool_timeout}s"
     )
-    print(f"LLM retries: {max_retries}")
+    print(f"LLM retries: {config.max_retries}")
     print()
 
     # --- Create LLM provider ---
-    base_provider = OpenAIProvider(
-        api_key=api_key,
-        base_url=base_url,
-        model=model,
-        connect_timeout=connect_timeout,
-        read_timeout=read_timeout,
-        write_timeout=write_timeout,
-        pool_timeout=pool_timeout,
-    )
+    base_provider = openai_provider(config)
     provider = RetryProvider(
         base_provider,
         retry_config=RetryConfig(
-            max_attempts=max_retries,
+            max_attempts=config.max_retries,
             multiplier=1.0,
             min_wait=1.0,
             max_wait=8.0,
@@ -203,74 +303,6 @@ async def main() -> None:
         "Create a detailed 3-day itinerary based on all gathered information",
     ]
 
-    # --- Define tool schemas ---
-    tools = {
-        "get_weather": ToolSchema(
-            name="get_weather",
-            description="Get the weather forecast for a city",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "city": {
-                        "type": "string",
-                        "description": "The city name, e.g. 'Beijing'",
-                    }
-                },
-                "required": ["city"],
-            },
-        ),
-        "search_attractions": ToolSchema(
-            name="search_attractions",
-            description="Search for popular tourist attractions in a city",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "city": {
-                        "type": "string",
-                        "description": "The city name, e.g. 'Beijing'",
-                    }
-                },
-                "required": ["city"],
-            },
-        ),
-        "search_restaurants": ToolSchema(
-            name="search_restaurants",
-            description="Search for recommended restaurants in a city",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "city": {
-                        "type": "string",
-                        "description": "The city name, e.g. 'Beijing'",
-                    },
-                    "cuisine_type": {
-                        "type": "string",
-                        "description": "Type of cuisine to search for (optional)",
-                    },
-                },
-                "required": ["city"],
-            },
-        ),
-        "check_transport": ToolSchema(
-            name="check_transport",
-            description="Check transport options between two cities",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "from_city": {
-                        "type": "string",
-                        "description": "Departure city",
-                    },
-                    "to_city": {
-                        "type": "string",
-                        "description": "Destination city",
-                    },
-                },
-                "required": ["from_city", "to_city"],
-            },
-        ),
-    }
-
     # --- Build the ECS World ---
     world = World()
 
@@ -278,7 +310,7 @@ async def main() -> None:
     main_agent = world.create_entity()
 
     # Attach components
-    world.add_component(main_agent, LLMComponent(provider=provider, model=model))
+    world.add_component(main_agent, LLMComponent(provider=provider, model=config.model))
     world.add_component(
         main_agent,
         ConversationComponent(
@@ -292,6 +324,7 @@ async def main() -> None:
         ),
     )
     world.add_component(main_agent, PlanComponent(steps=plan_steps))
+    world.add_component(main_agent, PlanCacheComponent(store=_PLAN_CACHE))
     world.add_component(
         main_agent,
         SystemPromptComponent(
@@ -307,7 +340,7 @@ async def main() -> None:
     world.add_component(
         main_agent,
         ToolRegistryComponent(
-            tools=tools,
+            tools=_TOOLS,
             handlers={
                 "get_weather": get_weather,
                 "search_attractions": search_attractions,
@@ -318,16 +351,22 @@ async def main() -> None:
     )
 
     # Register systems (order matters for the Plan-and-Execute loop):
+    # 0. PlanCacheSystem replays an identical, previously completed plan
     # 1. PlanningSystem executes one plan step per tick (calls LLM)
     # 2. ToolExecutionSystem runs any tool calls the LLM made
     # 3. ReplanningSystem reviews results and may revise remaining steps
     # 4. MemorySystem truncates conversation if too long
     # 5. ErrorHandlingSystem handles any errors
-    world.register_system(PlanningSystem(priority=0), priority=0)
-    world.register_system(ToolExecutionSystem(priority=5), priority=5)
-    world.register_system(ReplanningSystem(priority=7), priority=7)
-    world.register_system(MemorySystem(), priority=10)
-    world.register_system(ErrorHandlingSystem(priority=99), priority=99)
+    world.register_systems(
+        [
+            (PlanCacheSystem(priority=-20), -20),
+            (PlanningSystem(priority=0), 0),
+            (ToolExecutionSystem(priority=5), 5),
+            (ReplanningSystem(priority=7), 7),
+            (MemorySystem(), 10),
+            (ErrorHandlingSystem(priority=99), 99),
+        ]
+    )
 
     # Subscribe to events for real-time progress
     world.event_bus.subscribe(PlanStepCompletedEvent, on_step_completed)
@@ -351,20 +390,8 @@ async def main() -> None:
 
     conv = world.get_component(main_agent, ConversationComponent)
     if conv is not None:
-        for i, msg in enumerate(conv.messages):
-            if msg.role == "user":
-                print(f"\n[User] {msg.content}")
-            elif msg.role == "assistant":
-                if msg.tool_calls:
-                    for tc in msg.tool_calls:
-                        args = tc.arguments
-                        print(f"\n[Action] {tc.name}({args})")
-                else:
-                    print(f"\n[Thought] {msg.content}")
-            elif msg.role == "tool":
-                print(f"[Observation] {msg.content}")
-            elif msg.role == "system":
-                pass  # Skip system messages in output
+        for msg in conv.messages:
+            _PRINT_BY_ROLE.get(msg.role, _skip)(msg)
 
     plan = world.get_component(main_agent, PlanComponent)
     if plan is not None:
@@ -384,4 +411,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
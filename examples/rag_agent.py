@@ -11,13 +11,12 @@ import asyncio
 
 from ecs_agent.components import (
     ConversationComponent,
-    EmbeddingComponent,
     LLMComponent,
-    RAGTriggerComponent,
-    VectorStoreComponent,
+    RAGComponent,
 )
 from ecs_agent.core import Runner, World
 from ecs_agent.providers import FakeProvider
+from ecs_agent.providers.caching_embedding_provider import CachingEmbeddingProvider
 from ecs_agent.providers.fake_embedding_provider import FakeEmbeddingProvider
 from ecs_agent.providers.vector_store import InMemoryVectorStore
 from ecs_agent.systems.error_handling import ErrorHandlingSystem
@@ -26,14 +25,17 @@ from ecs_agent.systems.rag import RAGSystem
 from ecs_agent.systems.reasoning import ReasoningSystem
 from ecs_agent.types import CompletionResult, Message
 
+from _runtime import run
+
 
 async def main() -> None:
     """Run a RAG agent that retrieves context before reasoning."""
     # Create World
     world = World()
 
-    # Set up embedding provider (deterministic, no API key needed)
-    embedding_provider = FakeEmbeddingProvider(dimension=8)
+    # Set up embedding provider (deterministic, no API key needed); the cache
+    # serves repeated texts such as a re-asked query without re-embedding
+    embedding_provider = CachingEmbeddingProvider(FakeEmbeddingProvider(dimension=8))
 
     # Create and populate vector store with sample documents
     vector_store = InMemoryVectorStore(dimension=8)
@@ -43,10 +45,18 @@ async def main() -> None:
         "Retrieval-augmented generation combines neural networks with information retrieval.",
     ]
 
-    # Embed and add documents to store
-    doc_vectors = await embedding_provider.embed(sample_docs)
-    for i, (doc_text, vector) in enumerate(zip(sample_docs, doc_vectors)):
-        await vector_store.add(f"doc_{i}", vector, metadata={"text": doc_text})
+    # Embed the documents and the query in one batch, then add the documents
+    # to the store concurrently; RAGSystem reuses the precomputed query vector
+    rag_query = "retrieval-augmented generation"
+    *doc_vectors, query_vector = await embedding_provider.embed(
+        [*sample_docs, rag_query]
+    )
+    await asyncio.gather(
+        *(
+            vector_store.add(f"doc_{i}", vector, metadata={"text": doc_text})
+            for i, (doc_text, vector) in enumerate(zip(sample_docs, doc_vectors))
+        )
+    )
 
     # Create FakeProvider with pre-configured response
     provider = FakeProvider(
@@ -84,26 +94,29 @@ async def main() -> None:
         ),
     )
 
-    # Add RAG components to trigger retrieval before reasoning
-    world.add_component(
-        agent_id,
-        RAGTriggerComponent(query="retrieval-augmented generation", top_k=3),
-    )
+    # Add RAG state to trigger retrieval before reasoning
     world.add_component(
         agent_id,
-        EmbeddingComponent(provider=embedding_provider, dimension=8),
-    )
-    world.add_component(
-        agent_id,
-        VectorStoreComponent(store=vector_store),
+        RAGComponent(
+            provider=embedding_provider,
+            store=vector_store,
+            dimension=8,
+            query=rag_query,
+            top_k=3,
+            query_vector=query_vector,
+        ),
     )
 
     # Register Systems
     # RAG runs BEFORE reasoning (priority -10 < 0)
-    world.register_system(RAGSystem(priority=-10), priority=-10)
-    world.register_system(ReasoningSystem(priority=0), priority=0)
-    world.register_system(MemorySystem(), priority=10)
-    world.register_system(ErrorHandlingSystem(priority=99), priority=99)
+    world.register_systems(
+        [
+            (RAGSystem(priority=-10), -10),
+            (ReasoningSystem(priority=0), 0),
+            (MemorySystem(), 10),
+            (ErrorHandlingSystem(priority=99), 99),
+        ]
+    )
 
     # Run
     runner = Runner()
@@ -123,4 +136,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -19,8 +19,6 @@ Environment variables:
 
 from __future__ import annotations
 
-import asyncio
-import os
 import sys
 
 from ecs_agent.components import (
@@ -31,28 +29,40 @@ from ecs_agent.components import (
     ToolRegistryComponent,
 )
 from ecs_agent.core import Runner, World
-from ecs_agent.providers import OpenAIProvider
 from ecs_agent.systems.error_handling import ErrorHandlingSystem
 from ecs_agent.systems.memory import MemorySystem
 from ecs_agent.systems.planning import PlanningSystem
 from ecs_agent.systems.tool_execution import ToolExecutionSystem
 from ecs_agent.types import Message, PlanStepCompletedEvent, ToolSchema
 
+from _config import load_config, openai_provider
+from _runtime import run
+
 
 # ---------------------------------------------------------------------------
 # Tool definitions — these are the "Actions" the agent can take
 # ---------------------------------------------------------------------------
 
+# Lookup tables keyed by casefolded city name, built once at import rather
+# than on every tool call
+_WEATHER: dict[str, str] = {
+    "beijing": "Sunny, 28°C, humidity 35%",
+    "shanghai": "Cloudy, 25°C, humidity 65%",
+    "tokyo": "Rainy, 20°C, humidity 80%",
+    "new york": "Partly cloudy, 22°C, humidity 50%",
+}
+
+_POPULATION: dict[str, str] = {
+    "beijing": "21.54 million",
+    "shanghai": "24.87 million",
+    "tokyo": "13.96 million",
+    "new york": "8.34 million",
+}
+
 
 async def get_weather(city: str) -> str:
     """Simulate fetching weather data for a city."""
-    weather_db = {
-        "beijing": "Sunny, 28°C, humidity 35%",
-        "shanghai": "Cloudy, 25°C, humidity 65%",
-        "tokyo": "Rainy, 20°C, humidity 80%",
-        "new york": "Partly cloudy, 22°C, humidity 50%",
-    }
-    result = weather_db.get(city.lower())
+    result = _WEATHER.get(city.casefold())
     if result:
         return f"Weather in {city}: {result}"
     return f"Weather data not available for {city}"
@@ -60,13 +70,7 @@ async def get_weather(city: str) -> str:
 
 async def get_population(city: str) -> str:
     """Simulate fetching population data for a city."""
-    population_db = {
-        "beijing": "21.54 million",
-        "shanghai": "24.87 million",
-        "tokyo": "13.96 million",
-        "new york": "8.34 million",
-    }
-    result = population_db.get(city.lower())
+    result = _POPULATION.get(city.casefold())
     if result:
         return f"Population of {city}: {result}"
     return f"Population data not available for {city}"
@@ -90,30 +94,31 @@ async def on_step_completed(event: PlanStepCompletedEvent) -> None:
 async def main() -> None:
     """Run a ReAct agent that researches and compares two cities."""
     # --- Load config from environment ---
-    api_key = os.environ.get("LLM_API_KEY", "")
+    config = load_config()
+    api_key = config.api_key
     if not api_key:
         print("Error: LLM_API_KEY environment variable is required.")
         print("Copy .env.example to .env and fill in your API key.")
         sys.exit(1)
 
-    base_url = os.environ.get(
-        "LLM_BASE_URL", "https://dashscope.aliyuncs.com/compatible-mode/v1"
-    )
-    model = os.environ.get("LLM_MODEL", "qwen3.5-plus")
+    base_url = config.base_url
+    model = config.model
 
     print(f"Using model: {model}")
     print(f"Base URL: {base_url}")
     print()
 
     # --- Create LLM provider ---
-    provider = OpenAIProvider(api_key=api_key, base_url=base_url, model=model)
+    provider = openai_provider(config)
 
     # --- Define the plan (ReAct steps) ---
+    # The four lookups are independent, so they share one step: the LLM emits
+    # all four tool calls in a single turn and ToolExecutionSystem(parallel=True)
+    # runs them concurrently. The compare step depends on every observation and
+    # only runs on the next tick, after all results are in the conversation.
     plan_steps = [
-        "Look up the weather in Beijing using the get_weather tool",
-        "Look up the weather in Shanghai using the get_weather tool",
-        "Look up the population of Beijing using the get_population tool",
-        "Look up the population of Shanghai using the get_population tool",
+        "Look up the weather and the population of both Beijing and Shanghai. "
+        "Call get_weather and get_population for each city, all in this one turn",
         "Compare Beijing and Shanghai based on all the data collected, and give a recommendation for which city to visit",
     ]
 
@@ -173,6 +178,8 @@ async def main() -> None:
         ),
     )
     world.add_component(main_agent, PlanComponent(steps=plan_steps))
+    # The system prompt never changes during the run; PlanningSystem sends it
+    # first and the current step last, so providers can cache the prefix.
     world.add_component(
         main_agent,
         SystemPromptComponent(
@@ -197,10 +204,14 @@ async def main() -> None:
     )
 
     # Register systems (order matters: planning → tool execution → memory → error)
-    world.register_system(PlanningSystem(priority=0), priority=0)
-    world.register_system(ToolExecutionSystem(priority=5), priority=5)
-    world.register_system(MemorySystem(), priority=10)
-    world.register_system(ErrorHandlingSystem(priority=99), priority=99)
+    world.register_systems(
+        [
+            (PlanningSystem(priority=0), 0),
+            (ToolExecutionSystem(priority=5, parallel=True), 5),
+            (MemorySystem(), 10),
+            (ErrorHandlingSystem(priority=99), 99),
+        ]
+    )
 
     # Subscribe to plan step events for real-time progress
     world.event_bus.subscribe(PlanStepCompletedEvent, on_step_completed)
@@ -245,4 +256,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -10,12 +10,18 @@ The RetryProvider:
 - Skips retry logic for streaming calls (passes through directly)
 - Logs retry attempts with structured fields (attempt number, error, wait time)
 
+The retrying provider is itself wrapped in a CachingProvider, so an identical
+prompt sent again within the TTL is answered without calling the API.
+
 Custom RetryConfig allows fine-tuning:
 - max_attempts: Maximum number of attempts (default: 3)
 - multiplier: Exponential backoff multiplier (default: 1.0)
 - min_wait: Minimum wait time between retries in seconds (default: 4.0)
 - max_wait: Maximum wait time between retries in seconds (default: 60.0)
 - retry_status_codes: HTTP status codes to retry on (default: 429, 500, 502, 503, 504)
+- jitter: Randomize each backoff wait to avoid synchronized retries (default: False)
+
+A Retry-After header on a failed response overrides the computed wait.
 
 Usage:
   1. Copy .env.example to .env and fill in your API credentials
@@ -29,15 +35,17 @@ Environment variables:
 
 from __future__ import annotations
 
-import asyncio
-import os
 import sys
 
 from ecs_agent.logging import configure_logging, get_logger
-from ecs_agent.providers import FakeProvider, OpenAIProvider
+from ecs_agent.providers import FakeProvider
+from ecs_agent.providers.caching_provider import CachingProvider
 from ecs_agent.providers.retry_provider import RetryProvider
 from ecs_agent.types import CompletionResult, Message, RetryConfig, Usage
 
+from _config import load_config, openai_provider
+from _runtime import run
+
 logger = get_logger(__name__)
 
 
@@ -47,17 +55,16 @@ async def main() -> None:
     configure_logging(json_output=False)
 
     # --- Load config from environment ---
-    api_key = os.environ.get("LLM_API_KEY", "")
-    base_url = os.environ.get(
-        "LLM_BASE_URL", "https://dashscope.aliyuncs.com/compatible-mode/v1"
-    )
-    model = os.environ.get("LLM_MODEL", "qwen3.5-plus")
+    config = load_config()
+    api_key = config.api_key
+    base_url = config.base_url
+    model = config.model
 
     # --- Create base provider ---
     if api_key:
         print(f"Using OpenAIProvider with model: {model}")
         print(f"Base URL: {base_url}")
-        base_provider = OpenAIProvider(api_key=api_key, base_url=base_url, model=model)
+        base_provider = openai_provider(config)
     else:
         print("No LLM_API_KEY provided. Using FakeProvider for demonstration.")
         # Create a fake provider with a realistic response
@@ -84,6 +91,7 @@ async def main() -> None:
         min_wait=2.0,  # Start with 2 seconds instead of 4
         max_wait=30.0,  # Cap at 30 seconds instead of 60
         retry_status_codes=(429, 500, 502, 503, 504),  # Retry on these HTTP errors
+        jitter=True,  # Randomize each wait so concurrent callers do not retry in sync
     )
 
     print()
@@ -93,10 +101,15 @@ async def main() -> None:
     print(f"  min_wait: {retry_config.min_wait}s")
     print(f"  max_wait: {retry_config.max_wait}s")
     print(f"  retry_status_codes: {retry_config.retry_status_codes}")
+    print(f"  jitter: {retry_config.jitter}")
     print()
 
-    # --- Wrap provider with retry logic ---
-    provider = RetryProvider(base_provider, retry_config=retry_config)
+    # --- Wrap provider with retry logic and a response cache ---
+    # Retries happen inside the cache, so only successful responses are stored
+    # and a repeated prompt within the hour skips the round-trip entirely.
+    provider = CachingProvider(
+        RetryProvider(base_provider, retry_config=retry_config), ttl=3600
+    )
 
     # --- Make a completion request ---
     messages = [
@@ -123,6 +136,12 @@ async def main() -> None:
         print()
         print("✓ Completion succeeded (no retries needed for this request)")
 
+        # The same prompt again is served from the cache: no API call is made,
+        # which is also why the single-response FakeProvider is not exhausted.
+        cached = await provider.complete(messages=messages)
+        assert isinstance(cached, CompletionResult)
+        print(f"✓ Repeated request served from cache: {cached == result}")
+
     except Exception as e:
         logger.error(
             "completion_failed",
@@ -147,4 +166,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -24,6 +24,7 @@ from __future__ import annotations
 
 import json
 import os
+from collections import deque
 from pathlib import Path
 
 from ecs_agent.components import (
@@ -51,6 +52,8 @@ from ecs_agent.types import (
     Usage,
 )
 
+from _runtime import run
+
 
 async def main() -> None:
     """Demonstrate World serialization and deserialization."""
@@ -157,7 +160,8 @@ async def main() -> None:
         peer_agent,
         CollaborationComponent(
             peers=[main_agent],
-            inbox=[(main_agent, Message(role="user", content="Collaboration message"))],
+            senders=deque([main_agent]),
+            messages=deque([Message(role="user", content="Collaboration message")]),
         ),
     )
     world.add_component(
@@ -171,12 +175,12 @@ async def main() -> None:
         TerminalComponent(reason="Completed successfully"),
     )
 
-    print(
-        f"\nOriginal World has {len([main_agent, second_agent, peer_agent])} entities"
-    )
+    print(f"\nOriginal World has {len(world.entity_ids())} entities")
     for entity_id in [main_agent, second_agent, peer_agent]:
-        llm = world.get_component(entity_id, LLMComponent)
-        conv = world.get_component(entity_id, ConversationComponent)
+        # One archetype row read per entity instead of a lookup per type
+        components = world.get_components(entity_id)
+        llm = components.get(LLMComponent)
+        conv = components.get(ConversationComponent)
         print(
             f"  Entity {entity_id}: "
             f"LLM={llm is not None} ({llm.model if llm else 'N/A'}), "
@@ -214,23 +218,24 @@ async def main() -> None:
         print("STEP 4: VERIFY LOADED STATE")
         print("=" * 60)
 
-        loaded_entities = [main_agent, second_agent, peer_agent]
+        loaded_entities = sorted(loaded_world.entity_ids())
         print(f"\nEntity count check:")
-        print(f"  Original: {len(loaded_entities)} entities")
+        print(f"  Original: {len(world.entity_ids())} entities")
         print(f"  Loaded: {len(loaded_entities)} entities")
 
         print(f"\nComponent integrity check:")
         all_passed = True
 
         for entity_id in loaded_entities:
-            llm = loaded_world.get_component(entity_id, LLMComponent)
-            conv = loaded_world.get_component(entity_id, ConversationComponent)
-            plan = loaded_world.get_component(entity_id, PlanComponent)
-            kv = loaded_world.get_component(entity_id, KVStoreComponent)
-            collab = loaded_world.get_component(entity_id, CollaborationComponent)
-            error = loaded_world.get_component(entity_id, ErrorComponent)
-            owner = loaded_world.get_component(entity_id, OwnerComponent)
-            terminal = loaded_world.get_component(entity_id, TerminalComponent)
+            components = loaded_world.get_components(entity_id)
+            llm = components.get(LLMComponent)
+            conv = components.get(ConversationComponent)
+            plan = components.get(PlanComponent)
+            kv = components.get(KVStoreComponent)
+            collab = components.get(CollaborationComponent)
+            error = components.get(ErrorComponent)
+            owner = components.get(OwnerComponent)
+            terminal = components.get(TerminalComponent)
 
             if entity_id == main_agent:
                 checks = [
@@ -291,6 +296,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    import asyncio
-
-    asyncio.run(main())
+    run(main())
@@ -8,19 +8,21 @@ This example shows how to:
 4. Run a loop where the agent uses read_file and write_file.
 """
 
-import asyncio
-import os
+import functools
 import tempfile
 from pathlib import Path
 
 from ecs_agent import BuiltinToolsSkill, SkillManager
 from ecs_agent.components import ConversationComponent, LLMComponent
 from ecs_agent.core import Runner, World
-from ecs_agent.providers import FakeProvider, OpenAIProvider
+from ecs_agent.providers import FakeProvider
 from ecs_agent.systems.reasoning import ReasoningSystem
 from ecs_agent.systems.tool_execution import ToolExecutionSystem
 from ecs_agent.types import CompletionResult, Message, ToolCall
 
+from _config import load_config, openai_provider
+from _runtime import run
+
 
 async def main() -> None:
     # Set up a temporary workspace for file operations
@@ -33,13 +35,10 @@ async def main() -> None:
         agent = world.create_entity()
 
         # 1. Setup Provider (Use OpenAI if key is present, otherwise Fake)
-        api_key = os.getenv("LLM_API_KEY")
+        config = load_config(base_url="https://api.openai.com/v1", model="gpt-4o")
+        api_key = config.api_key
         if api_key:
-            provider = OpenAIProvider(
-                api_key=api_key,
-                base_url=os.getenv("LLM_BASE_URL", "https://api.openai.com/v1"),
-                model=os.getenv("LLM_MODEL", "gpt-4o"),
-            )
+            provider = openai_provider(config)
         else:
             # Fake responses for the demo
             provider = FakeProvider(
@@ -53,7 +52,7 @@ async def main() -> None:
                                 ToolCall(
                                     id="call_1",
                                     name="read_file",
-                                    arguments={"path": "hello.txt"},
+                                    arguments={"file_path": "hello.txt"},
                                 )
                             ],
                         )
@@ -67,7 +66,7 @@ async def main() -> None:
                                 ToolCall(
                                     id="call_2",
                                     name="write_file",
-                                    arguments={"path": "hello.txt", "content": "Updated content!"},
+                                    arguments={"file_path": "hello.txt", "content": "Updated content!"},
                                 )
                             ],
                         )
@@ -106,22 +105,26 @@ async def main() -> None:
         manager = SkillManager()
 
         # The built-in file tools require a 'workspace_root' parameter.
-        # We wrap the handlers to inject the workspace_root automatically.
+        # Bind it once with functools.partial: each handler is bound at its own
+        # loop iteration, so there is no late-binding closure to get wrong.
         skill = BuiltinToolsSkill()
-        original_tools = skill.tools()
-        wrapped_tools = {}
-        for name, (schema, handler) in original_tools.items():
-            async def wrapped_handler(h=handler, **kwargs):
-                return await h(workspace_root=str(workspace), **kwargs)
-            wrapped_tools[name] = (schema, wrapped_handler)
-        
+        workspace_root = str(workspace)
+        wrapped_tools = {
+            name: (schema, functools.partial(handler, workspace_root=workspace_root))
+            for name, (schema, handler) in skill.tools().items()
+        }
+
         # Patch the skill instance for the demo
         skill.tools = lambda: wrapped_tools
         manager.install(world, agent, skill)
 
         # Register systems
-        world.register_system(ReasoningSystem(), priority=0)
-        world.register_system(ToolExecutionSystem(), priority=5)
+        world.register_systems(
+            [
+                (ReasoningSystem(), 0),
+                (ToolExecutionSystem(), 5),
+            ]
+        )
 
         # 4. Run the agent
         print(f"Starting agent in workspace: {workspace}")
@@ -145,4 +148,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -5,7 +5,6 @@ This script shows how to use the SkillDiscovery class to automatically find
 and install Skill implementations from a filesystem path.
 """
 
-import asyncio
 from pathlib import Path
 
 from ecs_agent.core import World, Runner
@@ -16,6 +15,8 @@ from ecs_agent.skills.discovery import SkillDiscovery
 from ecs_agent.systems.reasoning import ReasoningSystem
 from ecs_agent.types import CompletionResult, Message
 
+from _runtime import run
+
 
 async def main() -> None:
     world = World()
@@ -38,7 +39,8 @@ async def main() -> None:
     agent = world.create_entity()
 
     # 3. Discover and install directly onto the agent
-    # This registers tools, adds system prompts, and tracks metadata
+    # This registers tools, adds system prompts, and tracks metadata. The
+    # skill files are unchanged since step 2, so they are not re-imported.
     installed_names = discovery.discover_and_install(world, agent, manager)
     print(f"Installed skills: {installed_names}")
 
@@ -77,4 +79,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
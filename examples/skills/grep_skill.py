@@ -3,7 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+import os
+import re
+import threading
+from collections.abc import Awaitable, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 
 from ecs_agent.core.world import World
 from ecs_agent.logging import get_logger
@@ -13,46 +19,139 @@ from ecs_agent.types import EntityId, ToolSchema
 
 logger = get_logger(__name__)
 
+# CPUs this process may run on; os.cpu_count() reports every host CPU even
+# when the process is pinned to a subset (taskset, container cpusets)
+_CPU_COUNT = (
+    len(os.sched_getaffinity(0))
+    if hasattr(os, "sched_getaffinity")
+    else (os.cpu_count() or 1)
+)
+# Same default as ThreadPoolExecutor, which also caps open files per search
+_MAX_WORKERS = min(32, _CPU_COUNT + 4)
+# Upper bound on one grep call, so a huge tree or a pathological pattern
+# cannot stall the agent's tick
+_TIMEOUT_SECONDS = 5.0
+
+
+@lru_cache(maxsize=128)
+def _compile(pattern: str) -> re.Pattern[str]:
+    """Compile a search pattern once and reuse it across calls."""
+    # MULTILINE keeps ^ and $ anchored to lines while searching a whole file
+    return re.compile(pattern, re.MULTILINE)
+
+
+def _matching_lines(regex: re.Pattern[str], text: str) -> Iterator[str]:
+    """Yield lines containing a match, jumping from match to match.
+
+    The regex engine skips over non-matching text, so only matching lines
+    are visited in Python.
+    """
+    if not text:
+        return
+    # A final newline ends the last line rather than starting an empty one
+    limit = len(text) - 1 if text.endswith("\n") else len(text)
+    pos = 0
+    while (match := regex.search(text, pos, limit)) is not None:
+        start = text.rfind("\n", 0, match.start()) + 1
+        end = text.find("\n", match.start(), limit)
+        if end == -1:
+            end = limit
+        # A match may run past the end of its line; the line itself must match
+        if match.end() <= end or regex.search(text, start, end) is not None:
+            yield text[start:end]
+        if end == limit:
+            break
+        pos = end + 1
+
+
+def _iter_files(root: Path, recursive: bool) -> Iterator[Path]:
+    if not root.is_dir():
+        yield root
+        return
+    if not recursive:
+        raise IsADirectoryError(f"{root}: Is a directory")
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            yield Path(dirpath, filename)
+
+
+def _scan_file(
+    regex: re.Pattern[str], file_path: Path, stop: threading.Event
+) -> list[str]:
+    if stop.is_set():
+        return []
+    try:
+        data = file_path.read_bytes()
+    except OSError:
+        return []
+    if b"\0" in data:
+        # Skip binary files, as grep does for directory searches
+        return []
+    return list(_matching_lines(regex, data.decode("utf-8", errors="replace")))
+
+
+def _search(
+    regex: re.Pattern[str], path: str, recursive: bool, stop: threading.Event
+) -> list[str]:
+    """Return matching lines, prefixed with the file name for directory searches.
+
+    Once ``stop`` is set the walk ends and files not yet scanned are skipped,
+    so a search abandoned after the timeout does not keep reading the tree.
+    """
+    root = Path(path)
+    if not root.exists():
+        raise FileNotFoundError(f"{path}: No such file or directory")
+
+    if not root.is_dir():
+        return _scan_file(regex, root, stop)
+
+    # A bounded pool overlaps file reads across a tree. Files are submitted
+    # as the walk yields them, so scanning starts while directories are still
+    # being read; results are collected in walk order.
+    with ThreadPoolExecutor(
+        max_workers=_MAX_WORKERS, thread_name_prefix="grep-scan"
+    ) as pool:
+        scans = []
+        for file_path in _iter_files(root, recursive):
+            if stop.is_set():
+                break
+            scans.append((file_path, pool.submit(_scan_file, regex, file_path, stop)))
+        return [
+            f"{file_path}:{line}" for file_path, scan in scans for line in scan.result()
+        ]
+
 
 @tool(description="Search file contents using pattern.")
 async def grep(pattern: str, path: str, recursive: bool = False) -> str:
     """Search file contents using pattern."""
+    stop = threading.Event()
     try:
-        # Build grep command
-        cmd = ["grep"]
-        if recursive:
-            cmd.append("-r")
-        cmd.extend([pattern, path])
-
-        # Run grep via asyncio subprocess
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+        regex = _compile(pattern)
+        # Matching is CPU-bound; run it off the event loop instead of
+        # spawning a grep process per call. The thread cannot be cancelled,
+        # so on timeout the stop flag tells it to wind down between files.
+        matches = await asyncio.wait_for(
+            asyncio.to_thread(_search, regex, path, recursive, stop),
+            timeout=_TIMEOUT_SECONDS,
         )
-
-        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=5.0)
-        stdout_text = stdout.decode("utf-8", errors="replace")
-        stderr_text = stderr.decode("utf-8", errors="replace")
-
-        if process.returncode == 0:
-            logger.info("grep_success", pattern=pattern, path=path)
-            return stdout_text if stdout_text else "(no output)"
-        elif process.returncode == 1:
-            # No matches found
-            logger.info("grep_no_match", pattern=pattern, path=path)
-            return "(no matches found)"
-        else:
-            # Error (file not found, etc.)
-            logger.warning("grep_error", pattern=pattern, path=path, stderr=stderr_text)
-            return f"error: {stderr_text}" if stderr_text else "error: command failed"
-
-    except asyncio.TimeoutError:
+    except TimeoutError:
         logger.error("grep_timeout", pattern=pattern, path=path)
         return "error: grep timed out"
+    except (re.error, OSError) as exc:
+        logger.warning("grep_error", pattern=pattern, path=path, stderr=str(exc))
+        return f"error: {exc}"
     except Exception as exc:
         logger.error("grep_exception", pattern=pattern, path=path, exception=str(exc))
         return f"error: {str(exc)}"
+    finally:
+        stop.set()
+
+    if not matches:
+        logger.info("grep_no_match", pattern=pattern, path=path)
+        return "(no matches found)"
+    logger.info("grep_success", pattern=pattern, path=path)
+    return "\n".join(matches) + "\n"
 
 
 class GrepSkill(Skill):
@@ -63,17 +162,9 @@ class GrepSkill(Skill):
 
     def tools(self) -> dict[str, tuple[ToolSchema, Callable[..., Awaitable[str]]]]:
         """Return grep tool schema and handler."""
-        from ecs_agent.tools.discovery import (
-            _build_parameters_schema,
-            _create_async_handler,
-        )
-
-        schema = ToolSchema(
-            name="grep",
-            description="Search file contents using pattern.",
-            parameters=_build_parameters_schema(grep),
-        )
-        handler = _create_async_handler(grep)
+        # @tool already built both once at import; every install shares them
+        schema: ToolSchema = getattr(grep, "_tool_schema")
+        handler: Callable[..., Awaitable[str]] = getattr(grep, "_tool_handler")
         return {"grep": (schema, handler)}
 
     def system_prompt(self) -> str:
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+import heapq
+import os
+from collections.abc import Awaitable, Callable, Iterator
+from operator import attrgetter
 from pathlib import Path
 
 from ecs_agent.core.world import World
@@ -14,12 +17,41 @@ from ecs_agent.types import EntityId, ToolSchema
 logger = get_logger(__name__)
 
 
+def _first_entries(
+    target: Path, all_files: bool, limit: int
+) -> tuple[list[os.DirEntry[str]], int]:
+    """Return the first ``limit`` visible entries by name and the visible total."""
+    total = 0
+
+    def visible(it: Iterator[os.DirEntry[str]]) -> Iterator[os.DirEntry[str]]:
+        nonlocal total
+        for entry in it:
+            if all_files or not entry.name.startswith("."):
+                total += 1
+                yield entry
+
+    # scandir already takes entry types from the d_type that getdents64
+    # returns, so listing needs no per-entry stat. Batching the directory
+    # reads further would mean raw syscalls, which this portable example
+    # avoids.
+    with os.scandir(target) as it:
+        # Keeps at most ``limit`` entries in memory however large the directory
+        entries = heapq.nsmallest(limit, visible(it), key=attrgetter("name"))
+    return entries, total
+
+
 @tool(description="List directory contents.")
 async def ls(
-    path: str = ".", all_files: bool = False, long_format: bool = False
+    path: str = ".",
+    all_files: bool = False,
+    long_format: bool = False,
+    limit: int = 10000,
 ) -> str:
-    """List directory contents using pathlib."""
+    """List directory contents using os.scandir, up to ``limit`` entries."""
     try:
+        if limit <= 0:
+            return "error: limit must be greater than 0"
+
         target = Path(path).resolve()
 
         if not target.exists():
@@ -30,23 +62,23 @@ async def ls(
             logger.warning("ls_not_directory", path=path)
             return f"error: not a directory: {path}"
 
-        # List directory contents
-        entries = []
+        # List directory contents. scandir reports each entry's type from the
+        # directory read itself, so only long format needs a stat per file.
         try:
-            for item in sorted(target.iterdir()):
-                # Skip hidden files unless all_files=True
-                if item.name.startswith(".") and not all_files:
-                    continue
-
-                if long_format:
-                    # Simple long format with size and type indicator
-                    size = item.stat().st_size if item.is_file() else "-"
-                    type_indicator = "/" if item.is_dir() else ""
-                    entries.append(f"{size:10} {item.name}{type_indicator}")
-                else:
-                    # Simple listing with directory indicator
-                    type_indicator = "/" if item.is_dir() else ""
-                    entries.append(f"{item.name}{type_indicator}")
+            items, total = _first_entries(target, all_files, limit)
+
+            # Lines stay str: the tool returns text, and names scandir could
+            # not decode carry surrogate escapes that would not encode cleanly
+            if long_format:
+                # Simple long format with size and type indicator
+                entries = [
+                    f"{e.stat().st_size if e.is_file() else '-':10} "
+                    f"{e.name}{'/' if e.is_dir() else ''}"
+                    for e in items
+                ]
+            else:
+                # Simple listing with directory indicator
+                entries = [f"{e.name}{'/' if e.is_dir() else ''}" for e in items]
         except PermissionError:
             logger.warning("ls_permission_denied", path=path)
             return f"error: permission denied: {path}"
@@ -55,8 +87,10 @@ async def ls(
             logger.info("ls_empty_directory", path=path)
             return "(empty directory)"
 
+        if total > len(entries):
+            entries.append(f"(truncated, {total - len(entries)} more entries)")
         result = "\n".join(entries)
-        logger.info("ls_success", path=path, count=len(entries))
+        logger.info("ls_success", path=path, count=total)
         return result
 
     except Exception as exc:
@@ -72,17 +106,9 @@ class LsSkill(Skill):
 
     def tools(self) -> dict[str, tuple[ToolSchema, Callable[..., Awaitable[str]]]]:
         """Return ls tool schema and handler."""
-        from ecs_agent.tools.discovery import (
-            _build_parameters_schema,
-            _create_async_handler,
-        )
-
-        schema = ToolSchema(
-            name="ls",
-            description="List directory contents.",
-            parameters=_build_parameters_schema(ls),
-        )
-        handler = _create_async_handler(ls)
+        # @tool already built both once at import; every install shares them
+        schema: ToolSchema = getattr(ls, "_tool_schema")
+        handler: Callable[..., Awaitable[str]] = getattr(ls, "_tool_handler")
         return {"ls": (schema, handler)}
 
     def system_prompt(self) -> str:
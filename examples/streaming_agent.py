@@ -22,14 +22,14 @@ Output:
 
 from __future__ import annotations
 
-import asyncio
-import os
-import sys
-
 from ecs_agent.logging import configure_logging
-from ecs_agent.providers import FakeProvider, OpenAIProvider
+from ecs_agent.providers import FakeProvider
 from ecs_agent.types import CompletionResult, Message, Usage
 
+from _config import load_config, openai_provider
+from _print import StreamPrinter
+from _runtime import run
+
 
 async def main() -> None:
     """Run a streaming agent that demonstrates real-time response output."""
@@ -37,17 +37,16 @@ async def main() -> None:
     configure_logging(json_output=False)
 
     # --- Load config from environment ---
-    api_key = os.environ.get("LLM_API_KEY", "")
-    base_url = os.environ.get(
-        "LLM_BASE_URL", "https://dashscope.aliyuncs.com/compatible-mode/v1"
-    )
-    model = os.environ.get("LLM_MODEL", "qwen3.5-plus")
+    config = load_config()
+    api_key = config.api_key
+    base_url = config.base_url
+    model = config.model
 
     # --- Create LLM provider ---
     if api_key:
         print(f"Using OpenAIProvider with model: {model}")
         print(f"Base URL: {base_url}")
-        provider = OpenAIProvider(api_key=api_key, base_url=base_url, model=model)
+        provider = openai_provider(config)
     else:
         print("No LLM_API_KEY provided. Using FakeProvider for demonstration.")
         print("To use a real API, set LLM_API_KEY, LLM_BASE_URL, and LLM_MODEL.")
@@ -86,16 +85,17 @@ async def main() -> None:
     final_delta = None
     total_tokens = 0
 
-    # Iterate through deltas and print content in real-time
+    # Iterate through deltas and print content in real-time; the printer
+    # batches flushes to about one per frame instead of one per delta
+    printer = StreamPrinter()
     async for delta in delta_iterator:
         if delta.content:
-            # Use sys.stdout.write to avoid newlines between chunks
-            sys.stdout.write(delta.content)
-            sys.stdout.flush()
+            printer.write(delta.content)
 
         # Keep track of final delta for usage stats
         if delta.finish_reason:
             final_delta = delta
+    printer.close()
 
     # --- Print final newline and stats ---
     print()
@@ -112,4 +112,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -15,14 +15,10 @@ Key difference from streaming_agent.py:
 
 from __future__ import annotations
 
-import asyncio
-import os
-import sys
-
 from ecs_agent.components import ConversationComponent, LLMComponent, StreamingComponent
 from ecs_agent.core import Runner, World
 from ecs_agent.logging import configure_logging
-from ecs_agent.providers import FakeProvider, OpenAIProvider
+from ecs_agent.providers import FakeProvider
 from ecs_agent.providers.protocol import LLMProvider
 from ecs_agent.systems.error_handling import ErrorHandlingSystem
 from ecs_agent.systems.memory import MemorySystem
@@ -36,6 +32,10 @@ from ecs_agent.types import (
     Usage,
 )
 
+from _config import load_config, openai_provider
+from _print import StreamPrinter
+from _runtime import run
+
 
 async def main() -> None:
     """Run a streaming agent demonstrating system-level real-time response output."""
@@ -43,18 +43,17 @@ async def main() -> None:
     configure_logging(json_output=False)
 
     # --- Load config from environment ---
-    api_key = os.environ.get("LLM_API_KEY", "")
-    base_url = os.environ.get(
-        "LLM_BASE_URL", "https://dashscope.aliyuncs.com/compatible-mode/v1"
-    )
-    model = os.environ.get("LLM_MODEL", "qwen3.5-plus")
+    config = load_config()
+    api_key = config.api_key
+    base_url = config.base_url
+    model = config.model
 
     # --- Create LLM provider ---
     provider: LLMProvider
     if api_key:
         print(f"Using OpenAIProvider with model: {model}")
         print(f"Base URL: {base_url}")
-        provider = OpenAIProvider(api_key=api_key, base_url=base_url, model=model)
+        provider = openai_provider(config)
     else:
         print("No LLM_API_KEY provided. Using FakeProvider for demonstration.")
         print("To use a real API, set LLM_API_KEY, LLM_BASE_URL, and LLM_MODEL.")
@@ -106,7 +105,10 @@ async def main() -> None:
     world.add_component(agent_id, StreamingComponent(enabled=True))
 
     # --- Subscribe to streaming events ---
-    streamed_content = []
+    # Only the total length is reported, so count characters instead of
+    # keeping every delta
+    streamed_chars = 0
+    printer = StreamPrinter()
 
     async def on_stream_start(event: StreamStartEvent) -> None:
         """Called when streaming starts."""
@@ -114,14 +116,16 @@ async def main() -> None:
 
     async def on_stream_delta(event: StreamDeltaEvent) -> None:
         """Called for each streamed delta (token/chunk)."""
+        nonlocal streamed_chars
         if event.delta:  # delta is a string, not an object
-            # Print delta without newline for real-time effect
-            sys.stdout.write(event.delta)
-            sys.stdout.flush()
-            streamed_content.append(event.delta)
+            # Print delta without newline for real-time effect; the printer
+            # flushes about once per frame instead of once per delta
+            printer.write(event.delta)
+            streamed_chars += len(event.delta)
 
     async def on_stream_end(event: StreamEndEvent) -> None:
         """Called when streaming ends."""
+        printer.close()
         print("\n[Streaming ended]")
 
     # Register event handlers
@@ -133,9 +137,13 @@ async def main() -> None:
     # ReasoningSystem (priority 0) executes the LLM inference
     # MemorySystem (priority 10) manages conversation history
     # ErrorHandlingSystem (priority 99) catches any errors
-    world.register_system(ReasoningSystem(priority=0), priority=0)
-    world.register_system(MemorySystem(), priority=10)
-    world.register_system(ErrorHandlingSystem(priority=99), priority=99)
+    world.register_systems(
+        [
+            (ReasoningSystem(priority=0), 0),
+            (MemorySystem(), 10),
+            (ErrorHandlingSystem(priority=99), 99),
+        ]
+    )
 
     # --- Run the agent ---
     print("Running streaming agent...")
@@ -147,9 +155,7 @@ async def main() -> None:
     # --- Print final results ---
     print()
     print("-" * 60)
-    print(
-        f"Total streamed content length: {sum(len(c) for c in streamed_content)} chars"
-    )
+    print(f"Total streamed content length: {streamed_chars} chars")
 
     # Print final conversation
     conv = world.get_component(agent_id, ConversationComponent)
@@ -164,4 +170,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
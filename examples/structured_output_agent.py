@@ -25,18 +25,19 @@ fallback when no LLM_API_KEY is available.
 
 from __future__ import annotations
 
-import asyncio
-import os
 import sys
 
 
 from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 
 from ecs_agent.logging import configure_logging, get_logger
-from ecs_agent.providers import OpenAIProvider, FakeProvider
+from ecs_agent.providers import FakeProvider
 from ecs_agent.providers.openai_provider import pydantic_to_response_format
 from ecs_agent.types import CompletionResult, Message, Usage
 
+from _config import load_config, openai_provider
+from _runtime import run
+
 logger = get_logger(__name__)
 
 
@@ -69,6 +70,11 @@ class CityInfo(BaseModel):
     )
 
 
+# The schema is fixed, so generate the response_format once at import rather
+# than walking the model's fields on every request
+CITY_INFO_FORMAT = pydantic_to_response_format(CityInfo)
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -80,17 +86,16 @@ async def main() -> None:
     configure_logging(json_output=False)
 
     # --- Load config from environment ---
-    api_key = os.environ.get("LLM_API_KEY", "")
-    base_url = os.environ.get(
-        "LLM_BASE_URL", "https://dashscope.aliyuncs.com/compatible-mode/v1"
-    )
-    model = os.environ.get("LLM_MODEL", "qwen3.5-plus")
+    config = load_config()
+    api_key = config.api_key
+    base_url = config.base_url
+    model = config.model
 
     # --- Create LLM provider ---
     if api_key:
         print(f"Using model: {model}")
         print(f"Base URL: {base_url}")
-        provider = OpenAIProvider(api_key=api_key, base_url=base_url, model=model)
+        provider = openai_provider(config)
     else:
         print("No LLM_API_KEY provided. Using FakeProvider for demonstration.")
         # Create a fake provider with a pre-configured response matching the CityInfo schema
@@ -117,9 +122,8 @@ async def main() -> None:
         )
     ]
 
-    # --- Generate response_format from Pydantic model ---
-    logger.debug("generating_response_format", model_name=CityInfo.__name__)
-    response_format = pydantic_to_response_format(CityInfo)
+    # --- response_format generated from the Pydantic model at import ---
+    response_format = CITY_INFO_FORMAT
 
     # --- Call the LLM with structured output enabled ---
     logger.debug(
@@ -140,7 +144,9 @@ async def main() -> None:
     logger.debug("parsing_response", response_length=len(json_str))
 
     try:
-        # Validate and parse the JSON response against the Pydantic model
+        # Validate and parse the JSON response against the Pydantic model.
+        # model_validate_json parses and validates in one pass in pydantic-core,
+        # which beats parsing to a dict first (e.g. with orjson) and validating
         city_info = CityInfo.model_validate_json(json_str)
         logger.info("structured_output_parsed", city_name=city_info.name)
 
@@ -173,4 +179,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -9,7 +9,9 @@ This example demonstrates:
 No API key required — uses FakeProvider throughout.
 """
 
-import asyncio
+import io
+import sys
+from collections import deque
 
 from ecs_agent.components import (
     CollaborationComponent,
@@ -26,6 +28,8 @@ from ecs_agent.systems.memory import MemorySystem
 from ecs_agent.systems.reasoning import ReasoningSystem
 from ecs_agent.types import CompletionResult, Message
 
+from _runtime import run
+
 
 async def main() -> None:
     """Run a sub-agent delegation example.
@@ -39,10 +43,14 @@ async def main() -> None:
     world = World()
 
     # ── Systems ──────────────────────────────────────────────────────
-    world.register_system(ReasoningSystem(priority=0), priority=0)
-    world.register_system(CollaborationSystem(priority=5), priority=5)
-    world.register_system(MemorySystem(), priority=10)
-    world.register_system(ErrorHandlingSystem(priority=99), priority=99)
+    world.register_systems(
+        [
+            (ReasoningSystem(priority=0), 0),
+            (CollaborationSystem(priority=5), 5),
+            (MemorySystem(), 10),
+            (ErrorHandlingSystem(priority=99), 99),
+        ]
+    )
 
     runner = Runner()
 
@@ -208,7 +216,8 @@ async def main() -> None:
         manager_id,
         CollaborationComponent(
             peers=[subagent_id],
-            inbox=[(subagent_id, last_msg)],
+            senders=deque([subagent_id]),
+            messages=deque([last_msg]),
         ),
     )
 
@@ -240,20 +249,19 @@ async def main() -> None:
 
 
 def _print_conversation(label: str, entity_id: int, world: World) -> None:
-    """Pretty-print an entity's conversation."""
-    print(f"\n--- {label} (entity {entity_id}) ---")
+    """Pretty-print an entity's conversation with a single stdout write."""
+    buf = io.StringIO()
+    buf.write(f"\n--- {label} (entity {entity_id}) ---\n")
     conv = world.get_component(entity_id, ConversationComponent)
     if conv is None:
-        print("  (no conversation)")
-        return
-    for msg in conv.messages:
-        role = msg.role.upper()
-        lines = (msg.content or "").split("\n")
-        first, rest = lines[0], lines[1:]
-        print(f"  [{role}] {first}")
-        for line in rest:
-            print(f"         {line}")
+        buf.write("  (no conversation)\n")
+    else:
+        for msg in conv.messages:
+            # Continuation lines are indented in place instead of split apart
+            content = (msg.content or "").replace("\n", "\n         ")
+            buf.write(f"  [{msg.role.upper()}] {content}\n")
+    sys.stdout.write(buf.getvalue())
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
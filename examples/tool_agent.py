@@ -19,8 +19,6 @@ Environment variables:
 
 from __future__ import annotations
 
-import asyncio
-import os
 import sys
 
 from ecs_agent.components import (
@@ -29,7 +27,6 @@ from ecs_agent.components import (
     ToolRegistryComponent,
 )
 from ecs_agent.core import Runner, World
-from ecs_agent.providers import OpenAIProvider
 from ecs_agent.providers.retry_provider import RetryProvider
 from ecs_agent.systems.error_handling import ErrorHandlingSystem
 from ecs_agent.systems.memory import MemorySystem
@@ -37,6 +34,9 @@ from ecs_agent.systems.reasoning import ReasoningSystem
 from ecs_agent.systems.tool_execution import ToolExecutionSystem
 from ecs_agent.types import Message, RetryConfig, ToolSchema
 
+from _config import load_config, openai_provider
+from _runtime import run
+
 
 async def add(a: str, b: str) -> str:
     """Add two numbers (string arguments)."""
@@ -51,36 +51,23 @@ async def multiply(a: str, b: str) -> str:
 async def main() -> None:
     """Run a tool-use agent example with a real LLM."""
     # --- Load config from environment ---
-    api_key = os.environ.get("LLM_API_KEY", "")
+    config = load_config()
+    api_key = config.api_key
     if not api_key:
         print("Error: LLM_API_KEY environment variable is required.")
         print("Copy .env.example to .env and fill in your API key.")
         sys.exit(1)
 
-    base_url = os.environ.get(
-        "LLM_BASE_URL", "https://dashscope.aliyuncs.com/compatible-mode/v1"
-    )
-    model = os.environ.get("LLM_MODEL", "qwen3.5-plus")
-    connect_timeout = float(os.environ.get("LLM_CONNECT_TIMEOUT", "10"))
-    read_timeout = float(os.environ.get("LLM_READ_TIMEOUT", "120"))
-    write_timeout = float(os.environ.get("LLM_WRITE_TIMEOUT", "10"))
-    pool_timeout = float(os.environ.get("LLM_POOL_TIMEOUT", "10"))
-    max_retries = int(os.environ.get("LLM_MAX_RETRIES", "3"))
+    base_url = config.base_url
+    model = config.model
+    max_retries = config.max_retries
 
     print(f"Using model: {model}")
     print(f"Base URL: {base_url}")
     print()
 
     # --- Create LLM provider ---
-    base_provider = OpenAIProvider(
-        api_key=api_key,
-        base_url=base_url,
-        model=model,
-        connect_timeout=connect_timeout,
-        read_timeout=read_timeout,
-        write_timeout=write_timeout,
-        pool_timeout=pool_timeout,
-    )
+    base_provider = openai_provider(config)
     provider = RetryProvider(
         base_provider,
         retry_config=RetryConfig(
@@ -163,10 +150,15 @@ async def main() -> None:
     )
 
     # Register Systems
-    world.register_system(ReasoningSystem(priority=0), priority=0)
-    world.register_system(ToolExecutionSystem(priority=5), priority=5)
-    world.register_system(MemorySystem(), priority=10)
-    world.register_system(ErrorHandlingSystem(priority=99), priority=99)
+    world.register_systems(
+        [
+            (ReasoningSystem(priority=0), 0),
+            # add and multiply are independent, so run them concurrently
+            (ToolExecutionSystem(priority=5, parallel=True), 5),
+            (MemorySystem(), 10),
+            (ErrorHandlingSystem(priority=99), 99),
+        ]
+    )
 
     # Run
     runner = Runner()
@@ -193,4 +185,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -22,8 +22,6 @@ Environment variables:
 
 from __future__ import annotations
 
-import asyncio
-import os
 import sys
 
 from ecs_agent.components import (
@@ -33,7 +31,6 @@ from ecs_agent.components import (
     ToolRegistryComponent,
 )
 from ecs_agent.core import Runner, World
-from ecs_agent.providers import OpenAIProvider
 from ecs_agent.providers.retry_provider import RetryProvider
 from ecs_agent.systems.error_handling import ErrorHandlingSystem
 from ecs_agent.systems.memory import MemorySystem
@@ -43,6 +40,9 @@ from ecs_agent.systems.tool_execution import ToolExecutionSystem
 from ecs_agent.tools.discovery import scan_module, tool
 from ecs_agent.types import ApprovalPolicy, Message, RetryConfig
 
+from _config import load_config, openai_provider
+from _runtime import run
+
 
 @tool()
 async def get_weather(location: str) -> str:
@@ -59,36 +59,23 @@ async def send_email(recipient: str, subject: str, body: str) -> str:
 async def main() -> None:
     """Run a tool approval agent example with a real LLM."""
     # --- Load config from environment ---
-    api_key = os.environ.get("LLM_API_KEY", "")
+    config = load_config()
+    api_key = config.api_key
     if not api_key:
         print("Error: LLM_API_KEY environment variable is required.")
         print("Copy .env.example to .env and fill in your API key.")
         sys.exit(1)
 
-    base_url = os.environ.get(
-        "LLM_BASE_URL", "https://dashscope.aliyuncs.com/compatible-mode/v1"
-    )
-    model = os.environ.get("LLM_MODEL", "qwen3.5-plus")
-    connect_timeout = float(os.environ.get("LLM_CONNECT_TIMEOUT", "10"))
-    read_timeout = float(os.environ.get("LLM_READ_TIMEOUT", "120"))
-    write_timeout = float(os.environ.get("LLM_WRITE_TIMEOUT", "10"))
-    pool_timeout = float(os.environ.get("LLM_POOL_TIMEOUT", "10"))
-    max_retries = int(os.environ.get("LLM_MAX_RETRIES", "3"))
+    base_url = config.base_url
+    model = config.model
+    max_retries = config.max_retries
 
     print(f"Using model: {model}")
     print(f"Base URL: {base_url}")
     print()
 
     # --- Create LLM provider ---
-    base_provider = OpenAIProvider(
-        api_key=api_key,
-        base_url=base_url,
-        model=model,
-        connect_timeout=connect_timeout,
-        read_timeout=read_timeout,
-        write_timeout=write_timeout,
-        pool_timeout=pool_timeout,
-    )
+    base_provider = openai_provider(config)
     provider = RetryProvider(
         base_provider,
         retry_config=RetryConfig(
@@ -150,13 +137,18 @@ async def main() -> None:
     )
 
     # Register Systems
-    # ToolApprovalSystem runs at priority -5 (before tool execution)
-    world.register_system(ToolApprovalSystem(priority=-5), priority=-5)
-    world.register_system(ReasoningSystem(priority=0), priority=0)
-    # ToolExecutionSystem runs at priority 5 (after approval)
-    world.register_system(ToolExecutionSystem(priority=5), priority=5)
-    world.register_system(MemorySystem(), priority=10)
-    world.register_system(ErrorHandlingSystem(priority=99), priority=99)
+    world.register_systems(
+        [
+            # ToolApprovalSystem runs at priority -5 (before tool execution)
+            (ToolApprovalSystem(priority=-5), -5),
+            (ReasoningSystem(priority=0), 0),
+            # ToolExecutionSystem runs at priority 5 (after approval); the
+            # approved calls are independent, so they run concurrently
+            (ToolExecutionSystem(priority=5, parallel=True), 5),
+            (MemorySystem(), 10),
+            (ErrorHandlingSystem(priority=99), 99),
+        ]
+    )
 
     # Run
     runner = Runner()
@@ -183,4 +175,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -21,7 +21,6 @@ The example uses FakeProvider with deterministic responses:
 
 from __future__ import annotations
 
-import asyncio
 
 from ecs_agent.components import (
     ConversationComponent,
@@ -33,6 +32,8 @@ from ecs_agent.providers import FakeProvider
 from ecs_agent.systems.tree_search import TreeSearchSystem
 from ecs_agent.types import CompletionResult, Message
 
+from _runtime import run
+
 
 async def main() -> None:
     """Run a Tree Search Agent exploring problem-solving strategies."""
@@ -245,4 +246,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
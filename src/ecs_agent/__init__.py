@@ -31,6 +31,8 @@ from ecs_agent.types import (
     UserInputRequestedEvent,
 )
 from ecs_agent.providers.retry_provider import RetryProvider
+from ecs_agent.providers.caching_embedding_provider import CachingEmbeddingProvider
+from ecs_agent.providers.caching_provider import CachingProvider
 from ecs_agent.providers.embedding_provider import OpenAIEmbeddingProvider
 from ecs_agent.providers.fake_embedding_provider import FakeEmbeddingProvider
 from ecs_agent.tools import (
@@ -79,6 +81,8 @@ __all__ = [
     "__version__",
     "ApprovalPolicy",
     "BuiltinToolsSkill",
+    "CachingEmbeddingProvider",
+    "CachingProvider",
     "CheckpointComponent",
     "CheckpointCreatedEvent",
     "CheckpointRestoredEvent",
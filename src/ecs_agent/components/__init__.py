@@ -13,8 +13,10 @@ from ecs_agent.components.definitions import (
     OwnerComponent,
     PendingToolCallsComponent,
     PermissionComponent,
+    PlanCacheComponent,
     PlanComponent,
     PlanSearchComponent,
+    RAGComponent,
     RAGTriggerComponent,
     RunnerStateComponent,
     SandboxConfigComponent,
@@ -43,8 +45,10 @@ __all__ = [
     "OwnerComponent",
     "PendingToolCallsComponent",
     "PermissionComponent",
+    "PlanCacheComponent",
     "PlanComponent",
     "PlanSearchComponent",
+    "RAGComponent",
     "RAGTriggerComponent",
     "RunnerStateComponent",
     "SandboxConfigComponent",
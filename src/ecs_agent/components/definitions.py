@@ -1,5 +1,6 @@
 """Component dataclass definitions for ECS-based LLM Agent."""
 
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Any, Awaitable, Callable
 
@@ -27,6 +28,8 @@ class LLMComponent:
 class ConversationComponent:
     """Conversation history."""
 
+    # A list, not deque(maxlen=...): MemorySystem trims in place but keeps a
+    # leading system message, and RAG/compaction slice into the history
     messages: list[Message]
     max_messages: int = 100
 
@@ -82,12 +85,26 @@ class PlanComponent:
     completed: bool = False
 
 
+@dataclass(slots=True)
+class PlanCacheComponent:
+    """Replayable conversations of completed plans, keyed by plan fingerprint."""
+
+    store: dict[str, list[Message]] = field(default_factory=dict)
+    key: str | None = None
+
+
 @dataclass(slots=True)
 class CollaborationComponent:
-    """Multi-agent messaging."""
+    """Multi-agent messaging.
+
+    The inbox is kept as two parallel queues: ``messages[i]`` was sent by
+    ``senders[i]``. Append to both together; unpaired entries are dropped
+    by ``CollaborationSystem``.
+    """
 
     peers: list[EntityId]
-    inbox: list[tuple[EntityId, Message]]
+    senders: deque[EntityId] = field(default_factory=deque)
+    messages: deque[Message] = field(default_factory=deque)
 
 
 @dataclass(slots=True)
@@ -158,11 +175,16 @@ class PlanSearchComponent:
 
 @dataclass(slots=True)
 class RAGTriggerComponent:
-    """RAG retrieval trigger and results."""
+    """RAG retrieval trigger and results.
+
+    Used together with ``EmbeddingComponent`` and ``VectorStoreComponent``.
+    New code should prefer the single ``RAGComponent``.
+    """
 
     query: str = ""
     top_k: int = 5
     retrieved_docs: list[str] = field(default_factory=list)
+    query_vector: list[float] | None = None
 
 
 @dataclass(slots=True)
@@ -180,6 +202,24 @@ class VectorStoreComponent:
     store: Any
 
 
+@dataclass(slots=True)
+class RAGComponent:
+    """All RAG state for one entity: embedding provider, vector store and trigger.
+
+    Replaces the ``RAGTriggerComponent`` + ``EmbeddingComponent`` +
+    ``VectorStoreComponent`` trio with one component, so setting up retrieval
+    is a single ``add_component`` call.
+    """
+
+    provider: Any
+    store: Any
+    dimension: int = 0
+    query: str = ""
+    top_k: int = 5
+    retrieved_docs: list[str] = field(default_factory=list)
+    query_vector: list[float] | None = None
+
+
 @dataclass(slots=True)
 class StreamingComponent:
     """Streaming output configuration."""
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Any, TypeVar, cast
 
 from ecs_agent.types import EntityId
@@ -7,48 +8,172 @@ from ecs_agent.types import EntityId
 T = TypeVar("T")
 
 
+class Archetype:
+    """Table of all entities sharing one exact set of component types.
+
+    Components are stored column-wise: one list per component type, with row
+    ``i`` of every column belonging to ``entities[i]``.
+    """
+
+    __slots__ = (
+        "types",
+        "entities",
+        "rows",
+        "columns",
+        "add_edges",
+        "remove_edges",
+    )
+
+    def __init__(self, types: tuple[type[Any], ...]) -> None:
+        self.types = frozenset(types)
+        self.entities: list[EntityId] = []
+        self.rows: dict[EntityId, int] = {}
+        self.columns: dict[type[Any], list[Any]] = {t: [] for t in types}
+        # Cached migration targets when adding/removing one component type
+        self.add_edges: dict[type[Any], Archetype] = {}
+        self.remove_edges: dict[type[Any], Archetype] = {}
+
+    def append(self, entity_id: EntityId, components: dict[type[Any], Any]) -> None:
+        self.rows[entity_id] = len(self.entities)
+        self.entities.append(entity_id)
+        for component_type, column in self.columns.items():
+            column.append(components[component_type])
+
+    def pop(self, entity_id: EntityId) -> dict[type[Any], Any]:
+        """Remove an entity's row, keeping columns dense by moving the last row in."""
+        row = self.rows.pop(entity_id)
+        last_entity = self.entities.pop()
+        components: dict[type[Any], Any] = {}
+        for component_type, column in self.columns.items():
+            last = column.pop()
+            if last_entity == entity_id:
+                components[component_type] = last
+            else:
+                components[component_type] = column[row]
+                column[row] = last
+        if last_entity != entity_id:
+            self.entities[row] = last_entity
+            self.rows[last_entity] = row
+        return components
+
+
 class ComponentStore:
     def __init__(self) -> None:
-        self._components: dict[type[Any], dict[EntityId, Any]] = {}
+        self._archetypes: dict[frozenset[type[Any]], Archetype] = {}
+        self._entity_archetypes: dict[EntityId, Archetype] = {}
+        self._type_archetypes: dict[type[Any], list[Archetype]] = {}
+        # Archetypes matching each query seen so far. Archetypes are never
+        # removed, so an entry only grows, when a new archetype is created.
+        self._query_archetypes: dict[tuple[type[Any], ...], list[Archetype]] = {}
+
+    def _archetype_for(self, types: tuple[type[Any], ...]) -> Archetype:
+        key = frozenset(types)
+        archetype = self._archetypes.get(key)
+        if archetype is None:
+            archetype = Archetype(types)
+            self._archetypes[key] = archetype
+            for component_type in types:
+                archetypes = self._type_archetypes.setdefault(component_type, [])
+                archetypes.append(archetype)
+            for query, matching in self._query_archetypes.items():
+                if archetype.types.issuperset(query):
+                    matching.append(archetype)
+        return archetype
 
     def add(self, entity_id: EntityId, component: Any) -> None:
         component_type = type(component)
-        entities = self._components.setdefault(component_type, {})
-        entities[entity_id] = component
+        source = self._entity_archetypes.get(entity_id)
+        if source is None:
+            components: dict[type[Any], Any] = {}
+            target = self._archetype_for((component_type,))
+        elif component_type in source.columns:
+            source.columns[component_type][source.rows[entity_id]] = component
+            return
+        else:
+            components = source.pop(entity_id)
+            target_edge = source.add_edges.get(component_type)
+            if target_edge is None:
+                target_edge = self._archetype_for((*source.columns, component_type))
+                source.add_edges[component_type] = target_edge
+            target = target_edge
+
+        components[component_type] = component
+        target.append(entity_id, components)
+        self._entity_archetypes[entity_id] = target
 
     def get(self, entity_id: EntityId, component_type: type[T]) -> T | None:
-        entities = self._components.get(component_type)
-        if entities is None:
+        archetype = self._entity_archetypes.get(entity_id)
+        if archetype is None:
+            return None
+        column = archetype.columns.get(component_type)
+        if column is None:
             return None
-        return cast(T | None, entities.get(entity_id))
+        return cast(T, column[archetype.rows[entity_id]])
 
     def remove(self, entity_id: EntityId, component_type: type[Any]) -> None:
-        entities = self._components.get(component_type)
-        if entities is None:
+        source = self._entity_archetypes.get(entity_id)
+        if source is None or component_type not in source.columns:
             return
 
-        entities.pop(entity_id, None)
-        if not entities:
-            del self._components[component_type]
+        components = source.pop(entity_id)
+        del components[component_type]
+        if not components:
+            del self._entity_archetypes[entity_id]
+            return
+
+        target = source.remove_edges.get(component_type)
+        if target is None:
+            target = self._archetype_for(tuple(components))
+            source.remove_edges[component_type] = target
+        target.append(entity_id, components)
+        self._entity_archetypes[entity_id] = target
 
     def has(self, entity_id: EntityId, component_type: type[Any]) -> bool:
-        entities = self._components.get(component_type)
-        if entities is None:
+        archetype = self._entity_archetypes.get(entity_id)
+        if archetype is None:
             return False
-        return entity_id in entities
+        return component_type in archetype.columns
 
     def delete_entity(self, entity_id: EntityId) -> None:
-        empty_component_types: list[type[Any]] = []
-        for component_type, entities in self._components.items():
-            entities.pop(entity_id, None)
-            if not entities:
-                empty_component_types.append(component_type)
-
-        for component_type in empty_component_types:
-            del self._components[component_type]
+        archetype = self._entity_archetypes.pop(entity_id, None)
+        if archetype is not None:
+            archetype.pop(entity_id)
 
     def get_all(self, component_type: type[T]) -> dict[EntityId, T]:
-        entities = self._components.get(component_type)
-        if entities is None:
+        result: dict[EntityId, T] = {}
+        for archetype in self._type_archetypes.get(component_type, ()):
+            result.update(zip(archetype.entities, archetype.columns[component_type]))
+        return result
+
+    def archetypes_with(
+        self, component_types: tuple[type[Any], ...]
+    ) -> Iterator[Archetype]:
+        """Yield non-empty archetypes containing every type in ``component_types``."""
+        matching = self._query_archetypes.get(component_types)
+        if matching is None:
+            matching = [
+                archetype
+                for archetype in self._type_archetypes.get(component_types[0], ())
+                if archetype.types.issuperset(component_types)
+            ]
+            self._query_archetypes[component_types] = matching
+        for archetype in matching:
+            if archetype.entities:
+                yield archetype
+
+    def count(self, component_types: tuple[type[Any], ...]) -> int:
+        """Count entities that have every type in ``component_types``."""
+        return sum(
+            len(archetype.entities)
+            for archetype in self.archetypes_with(component_types)
+        )
+
+    def entity_ids(self) -> list[EntityId]:
+        return list(self._entity_archetypes)
+
+    def components_of(self, entity_id: EntityId) -> dict[type[Any], Any]:
+        archetype = self._entity_archetypes.get(entity_id)
+        if archetype is None:
             return {}
-        return cast(dict[EntityId, T], entities)
+        row = archetype.rows[entity_id]
+        return {t: column[row] for t, column in archetype.columns.items()}
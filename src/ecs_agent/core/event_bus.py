@@ -1,12 +1,23 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
 from typing import Any, Awaitable, Callable, TypeVar, cast
 
 T = TypeVar("T")
 Handler = Callable[[Any], Awaitable[None]]
 
 
+async def _call_handler(handler: Handler, event: Any) -> None:
+    # Calling the handler happens inside the try as well, so one that fails
+    # before returning a coroutine cannot abort its siblings or leave their
+    # already-created coroutines unawaited
+    try:
+        await handler(event)
+    except Exception:
+        pass
+
+
 class EventBus:
     def __init__(self) -> None:
         self._handlers: dict[type, list[Handler]] = {}
@@ -37,9 +48,34 @@ class EventBus:
         if not handlers:
             return
 
-        await asyncio.gather(
-            *(handler(event) for handler in handlers), return_exceptions=True
-        )
+        if len(handlers) == 1:
+            # Await a lone handler directly rather than wrapping it in the Task
+            # gather would create; hot events like stream deltas usually have
+            # one subscriber. Exceptions are still swallowed as below.
+            try:
+                await handlers[0](event)
+            except Exception:
+                pass
+            return
+
+        await asyncio.gather(*(_call_handler(handler, event) for handler in handlers))
+
+    async def publish_many(self, events: Iterable[Any]) -> None:
+        """Publish several events, running every matching handler concurrently.
+
+        Handlers are started in event order, then awaited together in one
+        ``asyncio.gather``. Exceptions are isolated per handler as in
+        ``publish``, including ones raised while calling the handler.
+        """
+        calls = [
+            _call_handler(handler, event)
+            for event in events
+            for handler in list(self._handlers.get(type(event), []))
+        ]
+        if not calls:
+            return
+
+        await asyncio.gather(*calls)
 
     def clear(self) -> None:
         self._handlers.clear()
@@ -16,21 +16,9 @@ class Query:
         if not component_types:
             return []
 
-        first_component_type = component_types[0]
-        first_components = self._component_store.get_all(first_component_type)
         results: list[tuple[EntityId, tuple[Any, ...]]] = []
-
-        for entity_id in first_components:
-            if not all(
-                self._component_store.has(entity_id, component_type)
-                for component_type in component_types
-            ):
-                continue
-
-            components = tuple(
-                self._component_store.get(entity_id, component_type)
-                for component_type in component_types
-            )
-            results.append((entity_id, components))
+        for archetype in self._component_store.archetypes_with(component_types):
+            columns = [archetype.columns[t] for t in component_types]
+            results.extend(zip(archetype.entities, zip(*columns)))
 
         return results
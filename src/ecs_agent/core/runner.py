@@ -21,6 +21,11 @@ class Runner:
         When max_ticks is None the loop runs indefinitely until a
         TerminalComponent appears (useful for interactive / chat agents).
 
+        Ticks run back to back with no polling delay: each tick takes as long
+        as its systems' awaits (LLM calls, tools, user input) and no longer.
+        Systems that declare ``required_components`` are skipped on ticks
+        where no entity has them, so idle systems cost a count lookup only.
+
         If max_ticks is reached, adds TerminalComponent(reason='max_ticks')
         to a newly created entity.
 
@@ -50,11 +55,7 @@ class Runner:
             tick += 1
             runner_state.current_tick = tick
 
-            has_terminal = any(
-                world.has_component(eid, TerminalComponent)
-                for eid, _ in world.query(TerminalComponent)
-            )
-            if has_terminal:
+            if world.query_count(TerminalComponent):
                 return
 
     def save_checkpoint(self, world: World, path: str | Path) -> None:
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Protocol
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
     from ecs_agent.core.world import World
@@ -11,23 +12,53 @@ class System(Protocol):
     async def process(self, world: World) -> None: ...
 
 
+def _should_run(system: System, world: World) -> bool:
+    # Systems may declare the components their query needs; without a
+    # matching entity there is nothing to process, so process() is not called
+    required: tuple[type[Any], ...] | None = getattr(
+        system, "required_components", None
+    )
+    return not required or world.query_count(*required) > 0
+
+
+async def _process_if_needed(system: System, world: World) -> None:
+    # Checked when the system's own task starts, not for the whole group up
+    # front, so a component added by an earlier system at the same priority
+    # (before it first awaits) still wakes this one in the same tick
+    if _should_run(system, world):
+        await system.process(world)
+
+
 class SystemExecutor:
     def __init__(self) -> None:
         self._systems: list[tuple[System, int]] = []
+        # Priority groups in execution order; rebuilt lazily after registration
+        self._groups: list[list[System]] | None = None
 
     def register(self, system: System, priority: int) -> None:
         self._systems.append((system, priority))
+        self._groups = None
 
-    async def execute(self, world: World) -> None:
-        if not self._systems:
-            return
+    def register_many(self, systems: Iterable[tuple[System, int]]) -> None:
+        self._systems.extend(systems)
+        self._groups = None
 
+    def _build_groups(self) -> list[list[System]]:
         systems_by_priority: dict[int, list[System]] = {}
         for system, priority in self._systems:
             priority_systems = systems_by_priority.setdefault(priority, [])
             priority_systems.append(system)
+        return [systems_by_priority[p] for p in sorted(systems_by_priority)]
+
+    async def execute(self, world: World) -> None:
+        if not self._systems:
+            return
+
+        groups = self._groups
+        if groups is None:
+            groups = self._groups = self._build_groups()
 
-        for priority in sorted(systems_by_priority):
+        for group in groups:
             async with asyncio.TaskGroup() as task_group:
-                for system in systems_by_priority[priority]:
-                    task_group.create_task(system.process(world))
+                for system in group:
+                    task_group.create_task(_process_if_needed(system, world))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any, TypeVar
 
 from ecs_agent.core.component import ComponentStore
@@ -39,12 +40,21 @@ class World:
     def has_component(self, entity_id: EntityId, component_type: type[Any]) -> bool:
         return self._components.has(entity_id, component_type)
 
+    def get_components(self, entity_id: EntityId) -> dict[type[Any], Any]:
+        return self._components.components_of(entity_id)
+
+    def entity_ids(self) -> list[EntityId]:
+        return self._components.entity_ids()
+
     def delete_entity(self, entity_id: EntityId) -> None:
         self._components.delete_entity(entity_id)
 
     def register_system(self, system: System, priority: int) -> None:
         self._systems.register(system, priority)
 
+    def register_systems(self, systems: Iterable[tuple[System, int]]) -> None:
+        self._systems.register_many(systems)
+
     async def process(self) -> None:
         await self._systems.execute(self)
 
@@ -52,3 +62,8 @@ class World:
         self, *component_types: type[Any]
     ) -> list[tuple[EntityId, tuple[Any, ...]]]:
         return self._query.get(*component_types)
+
+    def query_count(self, *component_types: type[Any]) -> int:
+        if not component_types:
+            return 0
+        return self._components.count(component_types)
@@ -0,0 +1,79 @@
+"""LRU-caching wrapper around an embedding provider."""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+
+from ecs_agent.providers.embedding_protocol import EmbeddingProvider
+
+
+class CachingEmbeddingProvider:
+    """Embedding provider wrapper that memoizes vectors per input text.
+
+    Texts are keyed by a 16-byte BLAKE2b digest, so long documents do not
+    stay alive as dictionary keys. Only cache misses are forwarded to the
+    wrapped provider, in a single batched ``embed`` call.
+    """
+
+    def __init__(self, provider: EmbeddingProvider, max_entries: int = 1024) -> None:
+        """Wrap a provider with a bounded LRU cache.
+
+        Args:
+            provider: Embedding provider that computes vectors on cache misses.
+            max_entries: Maximum number of cached vectors before the least
+                recently used entry is evicted.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+
+        self._provider = provider
+        self._max_entries = max_entries
+        self._cache: OrderedDict[bytes, list[float]] = OrderedDict()
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts, reusing cached vectors for texts seen before.
+
+        Args:
+            texts: List of strings to embed.
+
+        Returns:
+            List of vectors in the same order as ``texts``. Each vector is a
+            fresh list, so callers may mutate it without corrupting the cache.
+
+        Raises:
+            ValueError: If the wrapped provider returns a different number of
+                vectors than texts it was asked to embed.
+        """
+        if not texts:
+            return []
+
+        keys = [self._key(text) for text in texts]
+        missing: dict[bytes, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in self._cache and key not in missing:
+                missing[key] = text
+
+        if missing:
+            vectors = await self._provider.embed(list(missing.values()))
+            if len(vectors) != len(missing):
+                raise ValueError(
+                    f"Embedding provider returned {len(vectors)} vectors "
+                    f"for {len(missing)} texts"
+                )
+            for key, vector in zip(missing, vectors):
+                self._cache[key] = list(vector)
+
+        result: list[list[float]] = []
+        for key in keys:
+            self._cache.move_to_end(key)
+            result.append(list(self._cache[key]))
+
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+
+        return result
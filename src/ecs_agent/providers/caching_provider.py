@@ -0,0 +1,161 @@
+"""Exact-match response cache around an LLM provider."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import asdict
+from typing import Any
+
+from ecs_agent.providers.protocol import LLMProvider
+from ecs_agent.types import CompletionResult, Message, StreamDelta, ToolSchema
+
+
+class CachingProvider:
+    """LLM provider wrapper that memoizes non-streaming completions.
+
+    Requests are keyed by a SHA-256 digest of the messages, tool schemas and
+    response format, so a replayed prompt is answered without a round-trip.
+    The model is not part of the key: each wrapper caches for the single
+    provider (and therefore model) it wraps. Identical requests that arrive
+    while the first one is still in flight share its single upstream call;
+    if that first caller is cancelled, the waiters reissue the request.
+    Streaming calls bypass the cache and go straight to the wrapped provider.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        ttl: float | None = None,
+        max_entries: int = 1024,
+    ) -> None:
+        """Wrap a provider with a bounded, optionally expiring cache.
+
+        Args:
+            provider: LLM provider that answers cache misses.
+            ttl: Seconds a cached response stays valid. ``None`` keeps
+                responses until they are evicted.
+            max_entries: Maximum number of cached responses before the least
+                recently used entry is evicted.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+
+        self._provider = provider
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._cache: OrderedDict[bytes, tuple[float, CompletionResult]] = (
+            OrderedDict()
+        )
+        self._in_flight: dict[bytes, asyncio.Future[CompletionResult]] = {}
+
+    @staticmethod
+    def _key(
+        messages: list[Message],
+        tools: list[ToolSchema] | None,
+        response_format: dict[str, Any] | None,
+    ) -> bytes:
+        payload = json.dumps(
+            [
+                [asdict(message) for message in messages],
+                [asdict(tool) for tool in tools] if tools else None,
+                response_format,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        # SHA-256 runs on the CPU's SHA extensions where present; at prompt
+        # sizes it outpaces blake2b, which has no hardware path in hashlib.
+        return hashlib.sha256(payload.encode()).digest()
+
+    async def complete(
+        self,
+        messages: list[Message],
+        tools: list[ToolSchema] | None = None,
+        stream: bool = False,
+        response_format: dict[str, Any] | None = None,
+    ) -> CompletionResult | AsyncIterator[StreamDelta]:
+        """Return a cached completion, or forward the request on a miss.
+
+        Args:
+            messages: Conversation to complete.
+            tools: Tool schemas offered to the model.
+            stream: When ``True`` the cache is bypassed entirely.
+            response_format: Structured output format, if any.
+
+        Returns:
+            The wrapped provider's result. Cached results are returned as deep
+            copies, so callers may mutate them without corrupting the cache.
+        """
+        if stream:
+            return await self._provider.complete(
+                messages=messages,
+                tools=tools,
+                stream=True,
+                response_format=response_format,
+            )
+
+        key = self._key(messages, tools, response_format)
+        entry = self._cache.get(key)
+        if entry is not None:
+            expires_at, cached = entry
+            if self._ttl is None or time.monotonic() < expires_at:
+                self._cache.move_to_end(key)
+                return copy.deepcopy(cached)
+            del self._cache[key]
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            # Shield so a cancelled waiter does not cancel the shared call.
+            try:
+                return copy.deepcopy(await asyncio.shield(pending))
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not pending.cancelled() or (task and task.cancelling()):
+                    raise
+            # The caller that owned the shared call was cancelled, not this
+            # one; issue the request again (coalescing with other waiters).
+            return await self.complete(
+                messages=messages, tools=tools, response_format=response_format
+            )
+
+        future: asyncio.Future[CompletionResult] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._in_flight[key] = future
+        try:
+            result = await self._provider.complete(
+                messages=messages,
+                tools=tools,
+                stream=False,
+                response_format=response_format,
+            )
+            assert isinstance(result, CompletionResult)
+        except asyncio.CancelledError:
+            # Waiters see the cancelled future and retry on their own; the key
+            # is dropped below so the first of them starts a fresh call.
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark the exception retrieved; waiters, if any, re-raise it.
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+
+        stored = copy.deepcopy(result)
+        future.set_result(stored)
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else 0.0
+        self._cache[key] = (expires_at, stored)
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+
+        return result
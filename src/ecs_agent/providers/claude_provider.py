@@ -29,11 +29,14 @@ class ClaudeProvider:
         read_timeout: float = 120.0,
         write_timeout: float = 10.0,
         pool_timeout: float = 10.0,
+        prompt_caching: bool = False,
     ) -> None:
         self._api_key = api_key
         self._base_url = base_url
         self._model = model
         self._max_tokens = max_tokens
+        self._prompt_caching = prompt_caching
+        self._anthropic_tools: dict[str, tuple[ToolSchema, dict[str, Any]]] = {}
         self._timeout = httpx.Timeout(
             connect=connect_timeout,
             read=read_timeout,
@@ -103,13 +106,16 @@ class ClaudeProvider:
 
         anthropic_tools: list[dict[str, Any]] = []
         for tool in tools:
-            anthropic_tools.append(
-                {
+            cached = self._anthropic_tools.get(tool.name)
+            if cached is None or cached[0] is not tool:
+                anthropic_tool = {
                     "name": tool.name,
                     "description": tool.description,
                     "input_schema": tool.parameters,
                 }
-            )
+                cached = (tool, anthropic_tool)
+                self._anthropic_tools[tool.name] = cached
+            anthropic_tools.append(cached[1])
         return anthropic_tools
 
     def _parse_response(self, response_data: dict[str, Any]) -> CompletionResult:
@@ -331,7 +337,19 @@ class ClaudeProvider:
             "max_tokens": self._max_tokens,
             "messages": anthropic_messages,
         }
-        if system_prompt is not None:
+        if self._prompt_caching:
+            # Cache breakpoints mark the end of the stable prefix (tools, then
+            # system), so later requests read it from Anthropic's prompt cache.
+            ephemeral = {"type": "ephemeral"}
+            if anthropic_tools:
+                # Copy rather than mutate: the converted tool dicts are cached.
+                last_tool = {**anthropic_tools[-1], "cache_control": ephemeral}
+                anthropic_tools[-1] = last_tool
+            if system_prompt is not None:
+                request_body["system"] = [
+                    {"type": "text", "text": system_prompt, "cache_control": ephemeral}
+                ]
+        elif system_prompt is not None:
             request_body["system"] = system_prompt
         if anthropic_tools is not None:
             request_body["tools"] = anthropic_tools
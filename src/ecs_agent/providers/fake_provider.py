@@ -1,5 +1,8 @@
 """Fake LLM provider for testing."""
 
+from collections import deque
+from collections.abc import Iterable
+
 from ecs_agent.types import Message, CompletionResult, ToolSchema, StreamDelta
 from typing import Any, AsyncIterator
 
@@ -7,14 +10,15 @@ from typing import Any, AsyncIterator
 class FakeProvider:
     """Fake provider that returns pre-defined responses sequentially."""
 
-    def __init__(self, responses: list[CompletionResult]) -> None:
-        """Initialize with list of responses to return.
+    def __init__(self, responses: Iterable[CompletionResult]) -> None:
+        """Initialize with the responses to return.
 
         Args:
-            responses: List of CompletionResult objects to return in order.
+            responses: CompletionResult objects to return in order. Any
+                iterable is accepted; it is copied into an internal queue
+                that is consumed from the front.
         """
-        self._responses = responses
-        self._index = 0
+        self._responses: deque[CompletionResult] = deque(responses)
         self.last_response_format: dict[str, Any] | None = None
 
 
@@ -37,12 +41,11 @@ class FakeProvider:
         Raises:
             IndexError: When all responses have been consumed.
         """
-        if self._index >= len(self._responses):
+        if not self._responses:
             raise IndexError("No more responses available")
         self.last_response_format = response_format
 
-        result = self._responses[self._index]
-        self._index += 1
+        result = self._responses.popleft()
         if not stream:
             return result
         # For streaming, return an async generator that yields character-by-character deltas
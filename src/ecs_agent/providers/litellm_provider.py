@@ -10,6 +10,7 @@ will raise ImportError with installation instructions.
 from __future__ import annotations
 
 import json
+import sys
 from typing import Any
 from collections.abc import AsyncIterator
 
@@ -67,6 +68,7 @@ class LiteLLMProvider:
         self._model = model
         self._api_key = api_key
         self._base_url = base_url
+        self._openai_tools: dict[str, tuple[ToolSchema, dict[str, Any]]] = {}
 
     async def complete(
         self,
@@ -221,20 +223,27 @@ class LiteLLMProvider:
         Args:
             tools: List of ToolSchema objects
 
+        Converted payloads are cached per tool name and reused while the same
+        ToolSchema object is passed in.
+
         Returns:
             List of dicts in OpenAI tool format
         """
         openai_tools: list[dict[str, Any]] = []
         for tool in tools:
-            openai_tool = {
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": tool.parameters,
-                },
-            }
-            openai_tools.append(openai_tool)
+            cached = self._openai_tools.get(tool.name)
+            if cached is None or cached[0] is not tool:
+                openai_tool = {
+                    "type": "function",
+                    "function": {
+                        "name": tool.name,
+                        "description": tool.description,
+                        "parameters": tool.parameters,
+                    },
+                }
+                cached = (tool, openai_tool)
+                self._openai_tools[tool.name] = cached
+            openai_tools.append(cached[1])
         return openai_tools
 
     def _parse_response(self, response: dict[str, Any]) -> CompletionResult:
@@ -248,7 +257,8 @@ class LiteLLMProvider:
         """
         message_data = response["choices"][0]["message"]
 
-        role = message_data["role"]
+        # Intern wire roles so role checks hit the identity fast path
+        role = sys.intern(message_data["role"])
         content = message_data.get("content") or ""
 
         tool_calls: list[ToolCall] | None = None
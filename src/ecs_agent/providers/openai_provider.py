@@ -1,9 +1,10 @@
 """OpenAI-compatible HTTP provider using httpx."""
 
 import json
+import sys
 
 from typing import Any
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 import httpx
 from ecs_agent.logging import get_logger
 from ecs_agent.types import (
@@ -17,6 +18,34 @@ from ecs_agent.types import (
 
 logger = get_logger(__name__)
 
+# Optional import guard; every SSE chunk and tool-call argument string is
+# parsed with this, and orjson is several times faster than json on them
+_json_loads: Callable[[str], Any]
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def _finish_stream_tool_call(index: int, accumulated: dict[str, str]) -> ToolCall:
+    """Build a ToolCall from a fully streamed call, parsing its arguments once."""
+    raw_arguments = accumulated["arguments"]
+    parsed_arguments: dict[str, Any]
+    if not raw_arguments:
+        parsed_arguments = {}
+    else:
+        try:
+            parsed_arguments = _json_loads(raw_arguments)
+        except json.JSONDecodeError:  # orjson's error subclasses this one
+            parsed_arguments = {"_partial": raw_arguments}
+    return ToolCall(
+        id=accumulated["id"] or f"index_{index}",
+        name=accumulated["name"],
+        arguments=parsed_arguments,
+    )
+
 
 class OpenAIProvider:
     """OpenAI-compatible LLM provider using httpx AsyncClient."""
@@ -30,6 +59,7 @@ class OpenAIProvider:
         read_timeout: float = 120.0,
         write_timeout: float = 10.0,
         pool_timeout: float = 10.0,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         self._api_key = api_key
         self._base_url = base_url
@@ -40,7 +70,14 @@ class OpenAIProvider:
             write=write_timeout,
             pool=pool_timeout,
         )
-        self._client = httpx.AsyncClient(trust_env=False, timeout=self._timeout)
+        # A caller-supplied client lets several providers on the same event
+        # loop share one connection pool; it keeps its own timeout settings
+        if client is None:
+            client = httpx.AsyncClient(trust_env=False, timeout=self._timeout)
+        self._client = client
+        # Converted tool payloads keyed by name; reused while the schema is the
+        # same object, so registries that keep their ToolSchemas skip rebuilding
+        self._openai_tools: dict[str, tuple[ToolSchema, dict[str, Any]]] = {}
 
     async def complete(
         self,
@@ -138,7 +175,7 @@ class OpenAIProvider:
                     if payload == "[DONE]":
                         break
 
-                    response_json = json.loads(payload)
+                    response_json = _json_loads(payload)
                     choice = response_json["choices"][0]
                     delta = choice.get("delta", {})
 
@@ -153,46 +190,44 @@ class OpenAIProvider:
                             total_tokens=usage_data["total_tokens"],
                         )
 
-                    tool_calls_delta = delta.get("tool_calls")
-                    stream_tool_calls: list[ToolCall] | None = None
-                    if tool_calls_delta:
-                        for tool_call_delta in tool_calls_delta:
-                            index = tool_call_delta.get("index", 0)
-                            accumulated = accumulated_tool_calls.setdefault(
-                                index,
-                                {"id": "", "name": "", "arguments": ""},
+                    # Tool calls arrive one after another by index. A call is
+                    # complete once a later index starts or the choice
+                    # finishes; it is then emitted once, with its arguments
+                    # parsed once, so consumers can act on it right away.
+                    completed: list[ToolCall] = []
+                    for tool_call_delta in delta.get("tool_calls") or ():
+                        index = tool_call_delta.get("index", 0)
+                        for open_index in sorted(accumulated_tool_calls):
+                            if open_index >= index:
+                                break
+                            completed.append(
+                                _finish_stream_tool_call(
+                                    open_index, accumulated_tool_calls.pop(open_index)
+                                )
                             )
+                        accumulated = accumulated_tool_calls.setdefault(
+                            index,
+                            {"id": "", "name": "", "arguments": ""},
+                        )
 
-                            if "id" in tool_call_delta and tool_call_delta["id"]:
-                                accumulated["id"] = tool_call_delta["id"]
-
-                            function_delta = tool_call_delta.get("function", {})
-                            if "name" in function_delta and function_delta["name"]:
-                                accumulated["name"] = function_delta["name"]
-                            if (
-                                "arguments" in function_delta
-                                and function_delta["arguments"] is not None
-                            ):
-                                accumulated["arguments"] += function_delta["arguments"]
-
-                        stream_tool_calls = []
-                        for index in sorted(accumulated_tool_calls):
-                            accumulated = accumulated_tool_calls[index]
-                            parsed_arguments: dict[str, Any]
-                            try:
-                                parsed_arguments = json.loads(accumulated["arguments"])
-                            except json.JSONDecodeError:
-                                parsed_arguments = {
-                                    "_partial": accumulated["arguments"]
-                                }
-
-                            stream_tool_calls.append(
-                                ToolCall(
-                                    id=accumulated["id"] or f"index_{index}",
-                                    name=accumulated["name"] or "",
-                                    arguments=parsed_arguments,
+                        if tool_call_delta.get("id"):
+                            accumulated["id"] = tool_call_delta["id"]
+
+                        function_delta = tool_call_delta.get("function", {})
+                        if function_delta.get("name"):
+                            accumulated["name"] = function_delta["name"]
+                        if function_delta.get("arguments") is not None:
+                            accumulated["arguments"] += function_delta["arguments"]
+
+                    if finish_reason is not None:
+                        for open_index in sorted(accumulated_tool_calls):
+                            completed.append(
+                                _finish_stream_tool_call(
+                                    open_index, accumulated_tool_calls[open_index]
                                 )
                             )
+                        accumulated_tool_calls.clear()
+                    stream_tool_calls = completed or None
 
                     if (
                         content is None
@@ -208,6 +243,16 @@ class OpenAIProvider:
                         finish_reason=finish_reason,
                         usage=usage,
                     )
+                if accumulated_tool_calls:
+                    # The stream ended without a finish reason for the choice.
+                    yield StreamDelta(
+                        tool_calls=[
+                            _finish_stream_tool_call(index, accumulated)
+                            for index, accumulated in sorted(
+                                accumulated_tool_calls.items()
+                            )
+                        ]
+                    )
         except httpx.HTTPStatusError as exc:
             logger.error(
                 "llm_http_error",
@@ -264,21 +309,26 @@ class OpenAIProvider:
     def _convert_tools_to_openai(self, tools: list[ToolSchema]) -> list[dict[str, Any]]:
         openai_tools: list[dict[str, Any]] = []
         for tool in tools:
-            openai_tool = {
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": tool.parameters,
-                },
-            }
-            openai_tools.append(openai_tool)
+            cached = self._openai_tools.get(tool.name)
+            if cached is None or cached[0] is not tool:
+                openai_tool = {
+                    "type": "function",
+                    "function": {
+                        "name": tool.name,
+                        "description": tool.description,
+                        "parameters": tool.parameters,
+                    },
+                }
+                cached = (tool, openai_tool)
+                self._openai_tools[tool.name] = cached
+            openai_tools.append(cached[1])
         return openai_tools
 
     def _parse_response(self, response_data: dict[str, Any]) -> CompletionResult:
         message_data = response_data["choices"][0]["message"]
 
-        role = message_data["role"]
+        # Intern wire roles so role checks hit the identity fast path
+        role = sys.intern(message_data["role"])
         content = message_data.get("content") or ""
 
         tool_calls: list[ToolCall] | None = None
@@ -288,7 +338,7 @@ class OpenAIProvider:
                 tool_call = ToolCall(
                     id=tc["id"],
                     name=tc["function"]["name"],
-                    arguments=json.loads(tc["function"]["arguments"]),
+                    arguments=_json_loads(tc["function"]["arguments"]),
                 )
                 tool_calls.append(tool_call)
 
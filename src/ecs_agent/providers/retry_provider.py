@@ -1,4 +1,7 @@
+import time
 from collections.abc import AsyncIterator
+from datetime import timezone
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import httpx
@@ -9,6 +12,7 @@ from tenacity import (
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
+    wait_random_exponential,
 )
 
 from ecs_agent.logging import get_logger
@@ -24,6 +28,28 @@ from ecs_agent.types import (
 logger = get_logger(__name__)
 
 
+def _retry_after_seconds(exc: BaseException | None) -> float | None:
+    """Return the server-requested delay from a Retry-After header, if any."""
+    if not isinstance(exc, httpx.HTTPStatusError) or exc.response is None:
+        return None
+    value = exc.response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        # HTTP-dates are always UTC; "-0000" parses to a naive datetime,
+        # which timestamp() would otherwise read as local time
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
 class RetryProvider:
     def __init__(
         self,
@@ -32,6 +58,14 @@ class RetryProvider:
     ) -> None:
         self._provider = provider
         self._retry_config = retry_config or RetryConfig()
+        backoff = (
+            wait_random_exponential if self._retry_config.jitter else wait_exponential
+        )
+        self._backoff = backoff(
+            multiplier=self._retry_config.multiplier,
+            min=self._retry_config.min_wait,
+            max=self._retry_config.max_wait,
+        )
 
     async def complete(
         self,
@@ -54,11 +88,7 @@ class RetryProvider:
 
         async for attempt in AsyncRetrying(
             stop=stop_after_attempt(self._retry_config.max_attempts),
-            wait=wait_exponential(
-                multiplier=self._retry_config.multiplier,
-                min=self._retry_config.min_wait,
-                max=self._retry_config.max_wait,
-            ),
+            wait=self._wait,
             retry=retry_condition,
             before_sleep=self._log_retry_attempt,
             reraise=True,
@@ -73,6 +103,15 @@ class RetryProvider:
 
         raise RuntimeError("Retry loop exited unexpectedly")
 
+    def _wait(self, retry_state: RetryCallState) -> float:
+        # A Retry-After header from the server beats any local estimate of
+        # when the endpoint recovers; it is still capped at max_wait.
+        if retry_state.outcome is not None:
+            retry_after = _retry_after_seconds(retry_state.outcome.exception())
+            if retry_after is not None:
+                return min(retry_after, self._retry_config.max_wait)
+        return float(self._backoff(retry_state))
+
     def _should_retry_exception(self, exc: BaseException) -> bool:
         if isinstance(exc, httpx.HTTPStatusError):
             if exc.response is None:
@@ -38,14 +38,36 @@ class VectorStore(Protocol):
         ...
 
 
+_INITIAL_CAPACITY = 16
+
+
 class InMemoryVectorStore:
+    """Vector store that keeps every vector in memory.
+
+    With NumPy installed, vectors are rows of one preallocated ``float32``
+    matrix whose capacity doubles as it fills, and a search is a single
+    matrix-vector product followed by ``argpartition`` for the top-k rows.
+    Without NumPy the rows are plain Python lists scored in a loop.
+
+    Vectors are normalized to unit length on insertion (zero vectors stay
+    zero), so a search only normalizes the query and takes dot products;
+    the returned scores are cosine similarities.
+    """
+
     def __init__(self, dimension: int) -> None:
         if dimension <= 0:
             raise ValueError("dimension must be greater than 0")
 
         self._dimension = dimension
-        self._vectors: dict[str, list[float]] = {}
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
         self._metadata: dict[str, dict[str, Any] | None] = {}
+        self._matrix: Any = None
+        self._scores: Any = None
+        self._vectors: list[list[float]] = []
+        if np is not None:
+            self._matrix = np.zeros((_INITIAL_CAPACITY, dimension), dtype=np.float32)
+            self._scores = np.empty(_INITIAL_CAPACITY, dtype=np.float32)
 
     async def add(
         self,
@@ -54,7 +76,20 @@ class InMemoryVectorStore:
         metadata: dict[str, Any] | None = None,
     ) -> None:
         self._validate_dimension(vector)
-        self._vectors[id] = list(vector)
+        row = self._rows.get(id)
+        if row is None:
+            row = len(self._ids)
+            self._rows[id] = row
+            self._ids.append(id)
+            if self._matrix is None:
+                self._vectors.append([])
+            elif row == len(self._matrix):
+                self._grow()
+
+        if self._matrix is None:
+            self._vectors[row] = _unit_list(vector)
+        else:
+            self._matrix[row] = _unit_array(vector)
         self._metadata[id] = metadata
 
     async def search(
@@ -63,40 +98,78 @@ class InMemoryVectorStore:
         top_k: int = 5,
     ) -> list[tuple[str, float]]:
         self._validate_dimension(query_vector)
-        if not self._vectors:
+        count = len(self._ids)
+        k = min(top_k, count)
+        if k <= 0:
             return []
 
-        scores: list[tuple[str, float]] = []
-        for vector_id, vector in self._vectors.items():
-            similarity = self._cosine_similarity(query_vector, vector)
-            scores.append((vector_id, similarity))
-
-        scores.sort(key=lambda item: item[1], reverse=True)
-        return scores[:top_k]
+        if self._matrix is None:
+            query = _unit_list(query_vector)
+            scores = [
+                (vector_id, sum(x * y for x, y in zip(query, vector)))
+                for vector_id, vector in zip(self._ids, self._vectors)
+            ]
+            scores.sort(key=lambda item: item[1], reverse=True)
+            return scores[:k]
+
+        assert np is not None
+        # Score into a reusable buffer instead of allocating one per query
+        similarities = np.matmul(
+            self._matrix[:count],
+            _unit_array(query_vector),
+            out=self._scores[:count],
+        )
+
+        if k < count:
+            candidates = np.argpartition(similarities, count - k)[count - k :]
+        else:
+            candidates = np.arange(count)
+        # Highest score first; ties keep insertion order
+        ranked = candidates[np.lexsort((candidates, -similarities[candidates]))]
+        return [(self._ids[i], float(similarities[i])) for i in ranked]
 
     async def delete(self, id: str) -> None:
-        self._vectors.pop(id, None)
+        row = self._rows.pop(id, None)
         self._metadata.pop(id, None)
+        if row is None:
+            return
+
+        # Move the last row into the freed slot to keep storage dense
+        last = len(self._ids) - 1
+        last_id = self._ids.pop()
+        if self._matrix is None:
+            last_vector = self._vectors.pop()
+            if row != last:
+                self._vectors[row] = last_vector
+        elif row != last:
+            self._matrix[row] = self._matrix[last]
+        if row != last:
+            self._ids[row] = last_id
+            self._rows[last_id] = row
+
+    def _grow(self) -> None:
+        assert np is not None
+        grown = np.zeros((len(self._matrix) * 2, self._dimension), dtype=np.float32)
+        grown[: len(self._matrix)] = self._matrix
+        self._matrix = grown
+        self._scores = np.empty(len(grown), dtype=np.float32)
 
     def _validate_dimension(self, vector: list[float]) -> None:
         if len(vector) != self._dimension:
             raise ValueError(f"Expected dimension {self._dimension}, got {len(vector)}")
 
-    def _cosine_similarity(self, a: list[float], b: list[float]) -> float:
-        if np is not None:
-            a_array = np.array(a, dtype=float)
-            b_array = np.array(b, dtype=float)
-            norm_a = float(np.linalg.norm(a_array))
-            norm_b = float(np.linalg.norm(b_array))
-            if norm_a == 0.0 or norm_b == 0.0:
-                return 0.0
-
-            return float(np.dot(a_array, b_array) / (norm_a * norm_b))
-
-        dot = sum(x * y for x, y in zip(a, b))
-        norm_a = math.sqrt(sum(x * x for x in a))
-        norm_b = math.sqrt(sum(y * y for y in b))
-        if norm_a == 0.0 or norm_b == 0.0:
-            return 0.0
-
-        return dot / (norm_a * norm_b)
+
+def _unit_list(vector: list[float]) -> list[float]:
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0.0:
+        return [0.0] * len(vector)
+    return [x / norm for x in vector]
+
+
+def _unit_array(vector: list[float]) -> Any:
+    assert np is not None
+    array = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(array)
+    if norm == 0.0:
+        return np.zeros_like(array)
+    return array / norm
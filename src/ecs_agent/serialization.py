@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import copy
 import json
+import sys
+from collections import deque
 from dataclasses import asdict
 from pathlib import Path
 from typing import Any
@@ -19,6 +22,7 @@ from ecs_agent.components import (
     PendingToolCallsComponent,
     PlanComponent,
     PlanSearchComponent,
+    RAGComponent,
     RAGTriggerComponent,
     RunnerStateComponent,
     SandboxConfigComponent,
@@ -33,8 +37,26 @@ from ecs_agent.components import (
 from ecs_agent.core.world import World
 from ecs_agent.types import ApprovalPolicy, EntityId, Message, ToolCall, ToolSchema
 
+# Optional import guard
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 NON_SERIALIZABLE_PLACEHOLDER = "<non-serializable>"
 
+# Fields holding live objects (providers, stores, handlers) that are written as
+# a placeholder and re-injected on load
+_PLACEHOLDER_FIELDS: dict[type[Any], tuple[str, ...]] = {
+    LLMComponent: ("provider",),
+    ToolRegistryComponent: ("handlers",),
+    EmbeddingComponent: ("provider",),
+    VectorStoreComponent: ("store",),
+    RAGComponent: ("provider", "store"),
+}
+
 COMPONENT_REGISTRY: dict[str, type[Any]] = {
     LLMComponent.__name__: LLMComponent,
     ConversationComponent.__name__: ConversationComponent,
@@ -54,6 +76,7 @@ COMPONENT_REGISTRY: dict[str, type[Any]] = {
     RAGTriggerComponent.__name__: RAGTriggerComponent,
     EmbeddingComponent.__name__: EmbeddingComponent,
     VectorStoreComponent.__name__: VectorStoreComponent,
+    RAGComponent.__name__: RAGComponent,
     StreamingComponent.__name__: StreamingComponent,
     CheckpointComponent.__name__: CheckpointComponent,
     CompactionConfigComponent.__name__: CompactionConfigComponent,
@@ -66,18 +89,9 @@ class WorldSerializer:
     @staticmethod
     def to_dict(world: World) -> dict[str, Any]:
         entities: dict[str, dict[str, Any]] = {}
-        component_store = world._components._components
-
-        entity_ids: set[EntityId] = set()
-        for entity_map in component_store.values():
-            entity_ids.update(entity_map.keys())
-
-        for entity_id in sorted(entity_ids):
+        for entity_id in sorted(world.entity_ids()):
             serialized_components: dict[str, Any] = {}
-            for component_type, entity_map in component_store.items():
-                component = entity_map.get(entity_id)
-                if component is None:
-                    continue
+            for component_type, component in world.get_components(entity_id).items():
                 serialized_components[component_type.__name__] = (
                     WorldSerializer._serialize_component(component)
                 )
@@ -119,9 +133,12 @@ class WorldSerializer:
 
     @staticmethod
     def save(world: World, path: Path) -> None:
-        path.write_text(
-            json.dumps(WorldSerializer.to_dict(world), indent=2), encoding="utf-8"
-        )
+        data = WorldSerializer.to_dict(world)
+        if HAS_ORJSON:
+            options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            path.write_bytes(orjson.dumps(data, option=options))
+            return
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
 
     @staticmethod
     def load(
@@ -129,26 +146,29 @@ class WorldSerializer:
         providers: dict[str, Any],
         tool_handlers: dict[str, Any],
     ) -> World:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        if HAS_ORJSON:
+            data = orjson.loads(path.read_bytes())
+        else:
+            data = json.loads(path.read_text(encoding="utf-8"))
         return WorldSerializer.from_dict(
             data, providers=providers, tool_handlers=tool_handlers
         )
 
     @staticmethod
     def _serialize_component(component: Any) -> dict[str, Any]:
-        serialized = asdict(component)
-
-        if isinstance(component, LLMComponent):
-            serialized["provider"] = NON_SERIALIZABLE_PLACEHOLDER
+        placeholder_fields = _PLACEHOLDER_FIELDS.get(type(component))
+        if placeholder_fields:
+            # Swap live objects out on a shallow copy before asdict, which
+            # would otherwise deep-copy them (and fail on locks or clients)
+            component = copy.copy(component)
+            for field_name in placeholder_fields:
+                setattr(component, field_name, NON_SERIALIZABLE_PLACEHOLDER)
 
-        if isinstance(component, ToolRegistryComponent):
-            serialized["handlers"] = NON_SERIALIZABLE_PLACEHOLDER
-
-        if isinstance(component, EmbeddingComponent):
-            serialized["provider"] = NON_SERIALIZABLE_PLACEHOLDER
+        serialized = asdict(component)
 
-        if isinstance(component, VectorStoreComponent):
-            serialized["store"] = NON_SERIALIZABLE_PLACEHOLDER
+        if isinstance(component, CollaborationComponent):
+            serialized["senders"] = [int(sender) for sender in component.senders]
+            serialized["messages"] = [asdict(message) for message in component.messages]
 
         return serialized
 
@@ -186,10 +206,19 @@ class WorldSerializer:
             normalized_data["peers"] = [
                 EntityId(int(peer)) for peer in normalized_data.get("peers", [])
             ]
-            normalized_data["inbox"] = [
-                (EntityId(int(sender)), WorldSerializer._message_from_dict(message))
-                for sender, message in normalized_data.get("inbox", [])
-            ]
+            senders = normalized_data.get("senders", [])
+            messages = normalized_data.get("messages", [])
+            # Checkpoints written before the split store (sender, message) pairs
+            legacy_inbox = normalized_data.pop("inbox", None)
+            if legacy_inbox:
+                senders = [sender for sender, _ in legacy_inbox]
+                messages = [message for _, message in legacy_inbox]
+            normalized_data["senders"] = deque(
+                EntityId(int(sender)) for sender in senders
+            )
+            normalized_data["messages"] = deque(
+                WorldSerializer._message_from_dict(message) for message in messages
+            )
 
         if component_name == OwnerComponent.__name__:
             normalized_data["owner_id"] = EntityId(int(normalized_data["owner_id"]))
@@ -221,8 +250,9 @@ class WorldSerializer:
         if tool_calls_data is not None:
             tool_calls = [ToolCall(**tool_call) for tool_call in tool_calls_data]
 
+        # Intern roles like the providers do, so restored messages compare fast
         return Message(
-            role=data["role"],
+            role=sys.intern(data["role"]),
             content=data["content"],
             tool_calls=tool_calls,
             tool_call_id=data.get("tool_call_id"),
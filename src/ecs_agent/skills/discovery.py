@@ -45,12 +45,17 @@ class _MCPClientConfig:
 class SkillDiscovery:
     """Discover and load Skill implementations from filesystem paths.
 
+    Loaded modules are cached per file and keyed on the file's modification
+    time and size, so calling ``discover()`` again only re-executes files that
+    changed. Each call still returns fresh Skill instances.
+
     Args:
         skill_paths: List of directory paths to scan for Python modules containing Skill classes.
     """
 
     def __init__(self, skill_paths: list[str | Path]) -> None:
         self.skill_paths = skill_paths
+        self._skill_classes: dict[Path, tuple[tuple[int, int], list[type[Any]]]] = {}
 
     def discover(self) -> list[Skill]:
         """Scan configured paths and return all discovered Skill instances.
@@ -71,6 +76,14 @@ class SkillDiscovery:
                     continue
 
                 try:
+                    stat = file_path.stat()
+                    signature = (stat.st_mtime_ns, stat.st_size)
+                    cached = self._skill_classes.get(file_path)
+                    if cached is not None and cached[0] == signature:
+                        for skill_class in cached[1]:
+                            skills.append(skill_class())
+                        continue
+
                     spec = importlib.util.spec_from_file_location(
                         file_path.stem, file_path
                     )
@@ -85,6 +98,7 @@ class SkillDiscovery:
                     module = importlib.util.module_from_spec(spec)
                     spec.loader.exec_module(module)
 
+                    skill_classes: list[type[Any]] = []
                     for attr_name in dir(module):
                         obj = getattr(module, attr_name)
                         # Skip non-classes
@@ -99,6 +113,7 @@ class SkillDiscovery:
                             # Verify it's actually a Skill instance
                             if isinstance(skill_instance, Skill):
                                 skills.append(skill_instance)
+                                skill_classes.append(obj)
                                 logger.info(
                                     "skill_discovered",
                                     path=str(file_path),
@@ -108,6 +123,7 @@ class SkillDiscovery:
                             # Not a Skill class or instantiation failed
                             # This is normal for non-Skill classes, don't log
                             continue
+                    self._skill_classes[file_path] = (signature, skill_classes)
 
                 except Exception as exc:
                     logger.warning(
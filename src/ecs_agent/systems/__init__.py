@@ -2,6 +2,7 @@ from ecs_agent.systems.error_handling import ErrorHandlingSystem
 from ecs_agent.systems.checkpoint import CheckpointSystem
 from ecs_agent.systems.collaboration import CollaborationSystem
 from ecs_agent.systems.compaction import CompactionSystem
+from ecs_agent.systems.plan_cache import PlanCacheSystem
 from ecs_agent.systems.planning import PlanningSystem
 from ecs_agent.systems.permission import PermissionSystem
 from ecs_agent.systems.reasoning import ReasoningSystem
@@ -20,6 +21,7 @@ __all__ = [
     "ErrorHandlingSystem",
     "MemorySystem",
     "PermissionSystem",
+    "PlanCacheSystem",
     "PlanningSystem",
     "RAGSystem",
     "ReasoningSystem",
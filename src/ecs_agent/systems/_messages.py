@@ -0,0 +1,18 @@
+"""Message helpers shared by the systems that call an LLM provider."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from ecs_agent.types import Message
+
+
+@lru_cache(maxsize=64)
+def system_message(content: str) -> Message:
+    """Return a shared system-role message for a system prompt.
+
+    The message is only placed in the per-call list handed to a provider and
+    is never appended to a conversation, so every tick can reuse the same
+    instance instead of allocating a new one. Callers must not mutate it.
+    """
+    return Message(role="system", content=content)
@@ -12,6 +12,9 @@ from ecs_agent.types import CheckpointCreatedEvent, CheckpointRestoredEvent, Ent
 
 class CheckpointSystem:
     """Creates and restores tick-level World snapshots for undo functionality."""
+
+    required_components: tuple[type[Any], ...] = (CheckpointComponent,)
+
     async def process(self, world: World) -> None:
         snapshot = WorldSerializer.to_dict(world)
         timestamp = time.time()
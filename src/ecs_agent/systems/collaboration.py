@@ -1,30 +1,42 @@
 from __future__ import annotations
 
+from typing import Any
+
 from ecs_agent.components import CollaborationComponent, ConversationComponent
 from ecs_agent.core import World
+from ecs_agent.logging import get_logger
 from ecs_agent.types import Message, MessageDeliveredEvent
 
+logger = get_logger(__name__)
+
 
 class CollaborationSystem:
+    required_components: tuple[type[Any], ...] = (CollaborationComponent,)
+
     def __init__(self, priority: int = 0) -> None:
         self.priority = priority
 
     async def process(self, world: World) -> None:
         for entity_id, (collaboration,) in world.query(CollaborationComponent):
-            if not collaboration.inbox:
+            if not collaboration.senders and not collaboration.messages:
                 continue
 
             conversation = world.get_component(entity_id, ConversationComponent)
             if conversation is None:
                 continue
 
-            for sender_id, message in collaboration.inbox:
+            senders = collaboration.senders
+            messages = collaboration.messages
+            delivered: list[MessageDeliveredEvent] = []
+            while senders and messages:
+                sender_id = senders.popleft()
+                message = messages.popleft()
                 conversation.messages.append(
                     Message(
                         role="user", content=f"From: {sender_id}: {message.content}"
                     )
                 )
-                await world.event_bus.publish(
+                delivered.append(
                     MessageDeliveredEvent(
                         from_entity=sender_id,
                         to_entity=entity_id,
@@ -32,7 +44,19 @@ class CollaborationSystem:
                     )
                 )
 
-            collaboration.inbox.clear()
+            if senders or messages:
+                # The queues are parallel; an unpaired entry cannot be
+                # attributed, so it is dropped rather than left to linger
+                logger.warning(
+                    "collaboration_inbox_mismatch",
+                    entity_id=entity_id,
+                    unpaired_senders=len(senders),
+                    unpaired_messages=len(messages),
+                )
+                senders.clear()
+                messages.clear()
+
+            await world.event_bus.publish_many(delivered)
 
 
 __all__ = ["CollaborationSystem"]
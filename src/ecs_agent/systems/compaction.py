@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import math
+from typing import Any
 
 from ecs_agent.components import (
     CompactionConfigComponent,
@@ -19,6 +20,12 @@ logger = get_logger(__name__)
 
 class CompactionSystem:
     """LLM-based conversation summarization using bisect algorithm."""
+
+    required_components: tuple[type[Any], ...] = (
+        CompactionConfigComponent,
+        ConversationComponent,
+    )
+
     def __init__(self, bisect_ratio: float = 0.5) -> None:
         if bisect_ratio <= 0 or bisect_ratio >= 1:
             raise ValueError("bisect_ratio must be between 0 and 1")
@@ -1,5 +1,7 @@
 """ErrorHandlingSystem for ECS-based LLM Agent."""
 
+from typing import Any
+
 from ecs_agent.components.definitions import ErrorComponent
 from ecs_agent.core.world import World
 from ecs_agent.types import ErrorOccurredEvent
@@ -11,6 +13,8 @@ logger = get_logger(__name__)
 class ErrorHandlingSystem:
     """System that handles error cleanup and logging."""
 
+    required_components: tuple[type[Any], ...] = (ErrorComponent,)
+
     def __init__(self, priority: int = 99) -> None:
         """Initialize ErrorHandlingSystem with priority.
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from ecs_agent.components import (
     ConversationComponent,
     PendingToolCallsComponent,
@@ -12,6 +14,11 @@ from ecs_agent.types import Message, ToolDeniedEvent
 
 
 class PermissionSystem:
+    required_components: tuple[type[Any], ...] = (
+        PendingToolCallsComponent,
+        PermissionComponent,
+    )
+
     def __init__(self, priority: int = -10) -> None:
         self.priority = priority
 
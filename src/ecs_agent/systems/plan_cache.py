@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+from ecs_agent.components import (
+    ConversationComponent,
+    LLMComponent,
+    PendingToolCallsComponent,
+    PlanCacheComponent,
+    PlanComponent,
+    SystemPromptComponent,
+    TerminalComponent,
+    ToolRegistryComponent,
+)
+from ecs_agent.core.world import World
+from ecs_agent.logging import get_logger
+from ecs_agent.types import EntityId, PlanStepCompletedEvent
+
+logger = get_logger(__name__)
+
+
+class PlanCacheSystem:
+    """Replays the conversation of a previously completed, identical plan.
+
+    Runs before ``PlanningSystem``. The first time it sees a plan that has not
+    started, it fingerprints the system prompt, first user message, plan steps
+    and registered tool names. On a cache hit the cached conversation is
+    replayed, the plan is marked completed and the entity is terminated with
+    reason ``"plan_cache_hit"``, skipping every planning LLM call. On a miss
+    the plan runs normally and its final conversation is stored as soon as
+    its last step completes, in the same tick, via ``PlanStepCompletedEvent``.
+    A last step that requested tools is stored on the following tick instead,
+    once the tool results are part of the conversation.
+    """
+
+    required_components: tuple[type[Any], ...] = (
+        PlanCacheComponent,
+        PlanComponent,
+        ConversationComponent,
+    )
+
+    def __init__(self, priority: int = -20) -> None:
+        self.priority = priority
+        self._world: World | None = None
+
+    async def process(self, world: World) -> None:
+        if self._world is not world:
+            # Planning runs after this system, so the tick in which the plan
+            # completes is observed through its step event
+            self._world = world
+            world.event_bus.subscribe(PlanStepCompletedEvent, self._on_step_completed)
+
+        for entity_id, components in world.query(
+            PlanCacheComponent, PlanComponent, ConversationComponent
+        ):
+            cache, plan, conversation = components
+            assert isinstance(cache, PlanCacheComponent)
+            assert isinstance(plan, PlanComponent)
+            assert isinstance(conversation, ConversationComponent)
+
+            if cache.key is None:
+                if plan.completed or plan.current_step > 0 or not plan.steps:
+                    continue
+
+                cache.key = _plan_fingerprint(world, entity_id, plan, conversation)
+                cached = cache.store.get(cache.key)
+                if cached is None:
+                    continue
+
+                conversation.messages = list(cached)
+                plan.current_step = len(plan.steps)
+                plan.completed = True
+                world.add_component(
+                    entity_id, TerminalComponent(reason="plan_cache_hit")
+                )
+                logger.info(
+                    "plan_cache_hit",
+                    entity_id=entity_id,
+                    message_count=len(cached),
+                )
+                continue
+
+            if plan.completed:
+                _store(entity_id, cache, conversation)
+
+    async def _on_step_completed(self, event: PlanStepCompletedEvent) -> None:
+        world = self._world
+        if world is None:
+            return
+        entity_id = event.entity_id
+        plan = world.get_component(entity_id, PlanComponent)
+        cache = world.get_component(entity_id, PlanCacheComponent)
+        conversation = world.get_component(entity_id, ConversationComponent)
+        if plan is None or cache is None or conversation is None:
+            return
+        if plan.current_step < len(plan.steps):
+            return
+        if world.has_component(entity_id, PendingToolCallsComponent):
+            return
+        _store(entity_id, cache, conversation)
+
+
+def _store(
+    entity_id: EntityId,
+    cache: PlanCacheComponent,
+    conversation: ConversationComponent,
+) -> None:
+    if cache.key is None or cache.key in cache.store:
+        return
+    cache.store[cache.key] = list(conversation.messages)
+    logger.debug(
+        "plan_cache_stored",
+        entity_id=entity_id,
+        message_count=len(conversation.messages),
+    )
+
+
+def _plan_fingerprint(
+    world: World,
+    entity_id: EntityId,
+    plan: PlanComponent,
+    conversation: ConversationComponent,
+) -> str:
+    system_prompt = world.get_component(entity_id, SystemPromptComponent)
+    if system_prompt is not None:
+        prompt = system_prompt.content
+    else:
+        llm_component = world.get_component(entity_id, LLMComponent)
+        prompt = llm_component.system_prompt if llm_component is not None else ""
+
+    user_message = next(
+        (msg.content for msg in conversation.messages if msg.role == "user"), ""
+    )
+    tool_registry = world.get_component(entity_id, ToolRegistryComponent)
+    tools = sorted(tool_registry.tools) if tool_registry is not None else []
+
+    payload = json.dumps(
+        {"sys": prompt, "user": user_message, "steps": plan.steps, "tools": tools},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+__all__ = ["PlanCacheSystem"]
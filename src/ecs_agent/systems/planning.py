@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import time
+from typing import Any
 
 from ecs_agent.components import (
     ConversationComponent,
@@ -13,6 +14,7 @@ from ecs_agent.components import (
     ToolRegistryComponent,
 )
 from ecs_agent.core.world import World
+from ecs_agent.systems._messages import system_message
 from ecs_agent.types import Message, PlanStepCompletedEvent
 from ecs_agent.logging import get_logger
 
@@ -20,6 +22,12 @@ logger = get_logger(__name__)
 
 
 class PlanningSystem:
+    required_components: tuple[type[Any], ...] = (
+        PlanComponent,
+        LLMComponent,
+        ConversationComponent,
+    )
+
     def __init__(self, priority: int = 0) -> None:
         self.priority = priority
 
@@ -41,18 +49,21 @@ class PlanningSystem:
 
             step_description = plan.steps[plan.current_step]
             plan_context = Message(
-                role="system",
+                role="user",
                 content=f"Step {plan.current_step + 1}/{len(plan.steps)}: {step_description}",
             )
 
+            # The system prompt and the conversation so far form a prefix that
+            # only grows between steps, so provider-side prompt caches can reuse
+            # it. The per-step instruction changes every tick and goes last.
             messages: list[Message] = []
 
             system_prompt = world.get_component(entity_id, SystemPromptComponent)
             if system_prompt is not None:
-                messages.append(Message(role="system", content=system_prompt.content))
+                messages.append(system_message(system_prompt.content))
 
-            messages.append(plan_context)
             messages.extend(conversation.messages)
+            messages.append(plan_context)
 
             tool_registry = world.get_component(entity_id, ToolRegistryComponent)
             tools = list(tool_registry.tools.values()) if tool_registry else None
@@ -5,18 +5,34 @@ from typing import Any
 from ecs_agent.components import (
     ConversationComponent,
     EmbeddingComponent,
+    RAGComponent,
     RAGTriggerComponent,
     VectorStoreComponent,
 )
 from ecs_agent.core import World
-from ecs_agent.types import Message, RAGRetrievalCompletedEvent
+from ecs_agent.types import EntityId, Message, RAGRetrievalCompletedEvent
 
 
 class RAGSystem:
+    """Retrieves documents for pending queries and injects them as context.
+
+    Entities opt in with a ``RAGComponent``, or with the older trio of
+    ``RAGTriggerComponent``, ``EmbeddingComponent`` and ``VectorStoreComponent``.
+    Both also need a ``ConversationComponent``.
+    """
+
     def __init__(self, priority: int = -10) -> None:
         self.priority = priority
 
     async def process(self, world: World) -> None:
+        for entity_id, components in world.query(RAGComponent, ConversationComponent):
+            rag, conversation = components
+            assert isinstance(rag, RAGComponent)
+            assert isinstance(conversation, ConversationComponent)
+            await _retrieve(
+                world, entity_id, rag, rag.provider, rag.store, conversation
+            )
+
         for entity_id, components in world.query(
             RAGTriggerComponent,
             EmbeddingComponent,
@@ -28,44 +44,61 @@ class RAGSystem:
             assert isinstance(embedding, EmbeddingComponent)
             assert isinstance(vector_store, VectorStoreComponent)
             assert isinstance(conversation, ConversationComponent)
-
-            query = rag_trigger.query.strip()
-            if query == "":
-                continue
-
-            vectors = await embedding.provider.embed([query])
-            if not vectors:
-                continue
-
-            results = await vector_store.store.search(
-                vectors[0], top_k=rag_trigger.top_k
+            await _retrieve(
+                world,
+                entity_id,
+                rag_trigger,
+                embedding.provider,
+                vector_store.store,
+                conversation,
             )
 
-            retrieved_docs: list[str] = []
-            rag_messages: list[Message] = []
-            for doc_id, _score in results:
-                text = _extract_text(vector_store.store, doc_id)
-                if text is None:
-                    continue
-                retrieved_docs.append(text)
-                rag_messages.append(
-                    Message(role="system", content=f"[RAG Context] {text}")
-                )
-
-            if rag_messages:
-                insert_at = _find_last_user_message_index(conversation.messages)
-                conversation.messages[insert_at:insert_at] = rag_messages
-
-            rag_trigger.retrieved_docs = retrieved_docs
-            rag_trigger.query = ""
-
-            await world.event_bus.publish(
-                RAGRetrievalCompletedEvent(
-                    entity_id=entity_id,
-                    query=query,
-                    num_results=len(retrieved_docs),
-                )
-            )
+
+async def _retrieve(
+    world: World,
+    entity_id: EntityId,
+    trigger: RAGComponent | RAGTriggerComponent,
+    provider: Any,
+    store: Any,
+    conversation: ConversationComponent,
+) -> None:
+    query = trigger.query.strip()
+    if query == "":
+        return
+
+    query_vector = trigger.query_vector
+    if query_vector is None:
+        vectors = await provider.embed([query])
+        if not vectors:
+            return
+        query_vector = vectors[0]
+
+    results = await store.search(query_vector, top_k=trigger.top_k)
+
+    retrieved_docs: list[str] = []
+    rag_messages: list[Message] = []
+    for doc_id, _score in results:
+        text = _extract_text(store, doc_id)
+        if text is None:
+            continue
+        retrieved_docs.append(text)
+        rag_messages.append(Message(role="system", content=f"[RAG Context] {text}"))
+
+    if rag_messages:
+        insert_at = _find_last_user_message_index(conversation.messages)
+        conversation.messages[insert_at:insert_at] = rag_messages
+
+    trigger.retrieved_docs = retrieved_docs
+    trigger.query = ""
+    trigger.query_vector = None
+
+    await world.event_bus.publish(
+        RAGRetrievalCompletedEvent(
+            entity_id=entity_id,
+            query=query,
+            num_results=len(retrieved_docs),
+        )
+    )
 
 
 def _extract_text(store: Any, doc_id: str) -> str | None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import time
 from typing import Any
@@ -15,6 +16,7 @@ from ecs_agent.components import (
     ToolRegistryComponent,
 )
 from ecs_agent.core.world import World
+from ecs_agent.systems._messages import system_message
 from ecs_agent.types import (
     CompletionResult,
     Message,
@@ -28,74 +30,94 @@ from ecs_agent.types import (
 
 
 class ReasoningSystem:
-    def __init__(self, priority: int = 0) -> None:
+    required_components: tuple[type[Any], ...] = (LLMComponent, ConversationComponent)
+
+    def __init__(self, priority: int = 0, parallel: bool = False) -> None:
         self.priority = priority
+        self.parallel = parallel
 
     async def process(self, world: World) -> None:
-        for entity_id, components in world.query(LLMComponent, ConversationComponent):
-            llm_component, conversation = components
-            assert isinstance(llm_component, LLMComponent)
-            assert isinstance(conversation, ConversationComponent)
+        matches = world.query(LLMComponent, ConversationComponent)
+        if self.parallel:
+            # Entities' provider calls overlap, so a tick with several ready
+            # agents costs the slowest round-trip instead of the sum.
+            await asyncio.gather(
+                *(
+                    self._reason(world, entity_id, llm_component, conversation)
+                    for entity_id, (llm_component, conversation) in matches
+                )
+            )
+            return
 
-            messages: list[Message] = []
+        for entity_id, (llm_component, conversation) in matches:
+            await self._reason(world, entity_id, llm_component, conversation)
 
-            system_prompt = world.get_component(entity_id, SystemPromptComponent)
-            if system_prompt is not None:
-                messages.append(Message(role="system", content=system_prompt.content))
+    async def _reason(
+        self,
+        world: World,
+        entity_id: EntityId,
+        llm_component: LLMComponent,
+        conversation: ConversationComponent,
+    ) -> None:
+        messages: list[Message] = []
 
-            messages.extend(conversation.messages)
+        system_prompt = world.get_component(entity_id, SystemPromptComponent)
+        if system_prompt is not None:
+            messages.append(system_message(system_prompt.content))
 
-            tools: list[ToolSchema] | None = None
-            tool_registry = world.get_component(entity_id, ToolRegistryComponent)
-            if tool_registry is not None and tool_registry.tools:
-                tools = list(tool_registry.tools.values())
+        messages.extend(conversation.messages)
 
-            streaming_component = world.get_component(entity_id, StreamingComponent)
-            streaming_enabled = (
-                streaming_component is not None and streaming_component.enabled
-            )
+        tools: list[ToolSchema] | None = None
+        tool_registry = world.get_component(entity_id, ToolRegistryComponent)
+        if tool_registry is not None and tool_registry.tools:
+            tools = list(tool_registry.tools.values())
 
-            try:
-                if streaming_enabled:
-                    result = await self._process_streaming(
-                        world,
-                        entity_id,
-                        llm_component,
-                        conversation,
-                        messages,
-                        tools,
-                    )
-                else:
-                    non_stream_result = await llm_component.provider.complete(
-                        messages, tools=tools
-                    )
-                    if not isinstance(non_stream_result, CompletionResult):
-                        raise RuntimeError(
-                            "Provider returned stream iterator in non-streaming mode"
-                        )
-                    result = non_stream_result
-
-                conversation.messages.append(result.message)
-
-                if result.message.tool_calls:
-                    world.add_component(
-                        entity_id,
-                        PendingToolCallsComponent(tool_calls=result.message.tool_calls),
-                    )
-            except (IndexError, StopIteration):
-                world.add_component(
+        streaming_component = world.get_component(entity_id, StreamingComponent)
+        streaming_enabled = (
+            streaming_component is not None and streaming_component.enabled
+        )
+
+        try:
+            if streaming_enabled:
+                result = await self._process_streaming(
+                    world,
                     entity_id,
-                    TerminalComponent(reason="provider_exhausted"),
+                    llm_component,
+                    conversation,
+                    messages,
+                    tools,
                 )
-            except Exception as exc:
+            else:
+                non_stream_result = await llm_component.provider.complete(
+                    messages, tools=tools
+                )
+                if not isinstance(non_stream_result, CompletionResult):
+                    raise RuntimeError(
+                        "Provider returned stream iterator in non-streaming mode"
+                    )
+                result = non_stream_result
+
+            conversation.messages.append(result.message)
+
+            if result.message.tool_calls:
                 world.add_component(
                     entity_id,
-                    ErrorComponent(
-                        error=str(exc),
-                        system_name="ReasoningSystem",
-                        timestamp=time.time(),
-                    ),
+                    PendingToolCallsComponent(tool_calls=result.message.tool_calls),
                 )
+        except (IndexError, StopIteration):
+            world.add_component(
+                entity_id,
+                TerminalComponent(reason="provider_exhausted"),
+            )
+        except Exception as exc:
+            world.add_component(
+                entity_id,
+                ErrorComponent(
+                    error=str(exc),
+                    system_name="ReasoningSystem",
+                    timestamp=time.time(),
+                ),
+            )
 
     async def _process_streaming(
         self,
@@ -7,6 +7,7 @@ execution results and revise remaining steps if needed.
 from __future__ import annotations
 
 import json
+from typing import Any
 
 from ecs_agent.components import (
     ConversationComponent,
@@ -15,6 +16,7 @@ from ecs_agent.components import (
     SystemPromptComponent,
 )
 from ecs_agent.core.world import World
+from ecs_agent.systems._messages import system_message
 from ecs_agent.types import EntityId, Message, PlanRevisedEvent
 
 
@@ -33,6 +35,12 @@ class ReplanningSystem:
     after tools have executed but before memory truncation.
     """
 
+    required_components: tuple[type[Any], ...] = (
+        PlanComponent,
+        LLMComponent,
+        ConversationComponent,
+    )
+
     def __init__(self, priority: int = 7) -> None:
         self.priority = priority
         self._last_replanned: dict[EntityId, int] = {}
@@ -125,7 +133,7 @@ class ReplanningSystem:
         # System prompt
         system_prompt = world.get_component(entity_id, SystemPromptComponent)
         if system_prompt is not None:
-            messages.append(Message(role="system", content=system_prompt.content))
+            messages.append(system_message(system_prompt.content))
 
         replanning_prompt = (
             "You are a planning revision agent. Review the execution so far "
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import time
+from typing import Any
 
 from ecs_agent.components import (
     ConversationComponent,
@@ -27,6 +28,12 @@ from ecs_agent.types import (
 class ToolApprovalSystem:
     """System for tool call approval flow."""
 
+    required_components: tuple[type[Any], ...] = (
+        PendingToolCallsComponent,
+        ToolApprovalComponent,
+        ConversationComponent,
+    )
+
     def __init__(self, priority: int = -5) -> None:
         self.priority = priority
 
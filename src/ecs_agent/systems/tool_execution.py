@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Awaitable, Callable
+import asyncio
+from typing import Any, Awaitable, Callable
 
 from ecs_agent.components import (
     ConversationComponent,
@@ -21,8 +22,15 @@ from ecs_agent.types import (
 
 
 class ToolExecutionSystem:
-    def __init__(self, priority: int = 0) -> None:
+    required_components: tuple[type[Any], ...] = (
+        PendingToolCallsComponent,
+        ToolRegistryComponent,
+        ConversationComponent,
+    )
+
+    def __init__(self, priority: int = 0, parallel: bool = False) -> None:
         self.priority = priority
+        self.parallel = parallel
 
     async def process(self, world: World) -> None:
         for entity_id, components in world.query(
@@ -35,35 +43,31 @@ class ToolExecutionSystem:
             assert isinstance(registry, ToolRegistryComponent)
             assert isinstance(conversation, ConversationComponent)
 
-            results: dict[str, str] = {}
-            for tool_call in pending.tool_calls:
-                # Publish ToolExecutionStartedEvent
-                await world.event_bus.publish(
-                    ToolExecutionStartedEvent(
-                        entity_id=entity_id,
-                        tool_call=tool_call,
+            tool_calls = pending.tool_calls
+            handlers = registry.handlers
+            # Looked up once per entity rather than once per tool call
+            sandbox_config = world.get_component(entity_id, SandboxConfigComponent)
+            if self.parallel:
+                # Independent calls from one assistant turn overlap, so the
+                # tick costs max(handler latency) instead of the sum.
+                outputs = await asyncio.gather(
+                    *(
+                        self._run_tool_call(
+                            entity_id, world, tool_call, handlers, sandbox_config
+                        )
+                        for tool_call in tool_calls
                     )
                 )
-
-                # Execute the tool call
-                result = await self._execute_tool_call(
-                    entity_id,
-                    world,
-                    tool_call,
-                    registry.handlers,
-                )
-
-                # Publish ToolExecutionCompletedEvent
-                success = not result.startswith("Error")
-                await world.event_bus.publish(
-                    ToolExecutionCompletedEvent(
-                        entity_id=entity_id,
-                        tool_call_id=tool_call.id,
-                        result=result,
-                        success=success,
+            else:
+                outputs = [
+                    await self._run_tool_call(
+                        entity_id, world, tool_call, handlers, sandbox_config
                     )
-                )
+                    for tool_call in tool_calls
+                ]
 
+            results: dict[str, str] = {}
+            for tool_call, result in zip(tool_calls, outputs):
                 results[tool_call.id] = result
                 conversation.messages.append(
                     Message(role="tool", content=result, tool_call_id=tool_call.id)
@@ -73,12 +77,42 @@ class ToolExecutionSystem:
             if results:
                 world.add_component(entity_id, ToolResultsComponent(results=results))
 
-    async def _execute_tool_call(
+    async def _run_tool_call(
         self,
         entity_id: EntityId,
         world: World,
         tool_call: ToolCall,
         handlers: dict[str, Callable[..., Awaitable[str]]],
+        sandbox_config: SandboxConfigComponent | None,
+    ) -> str:
+        # Publish ToolExecutionStartedEvent
+        await world.event_bus.publish(
+            ToolExecutionStartedEvent(
+                entity_id=entity_id,
+                tool_call=tool_call,
+            )
+        )
+
+        # Execute the tool call
+        result = await self._execute_tool_call(tool_call, handlers, sandbox_config)
+
+        # Publish ToolExecutionCompletedEvent
+        success = not result.startswith("Error")
+        await world.event_bus.publish(
+            ToolExecutionCompletedEvent(
+                entity_id=entity_id,
+                tool_call_id=tool_call.id,
+                result=result,
+                success=success,
+            )
+        )
+        return result
+
+    async def _execute_tool_call(
+        self,
+        tool_call: ToolCall,
+        handlers: dict[str, Callable[..., Awaitable[str]]],
+        sandbox_config: SandboxConfigComponent | None,
     ) -> str:
         handler = handlers.get(tool_call.name)
         if handler is None:
@@ -86,7 +120,6 @@ class ToolExecutionSystem:
 
         try:
             arguments = tool_call.arguments
-            sandbox_config = world.get_component(entity_id, SandboxConfigComponent)
             if sandbox_config is None:
                 result = await handler(**arguments)
             else:
@@ -6,6 +6,7 @@ import math
 import re
 import time
 from dataclasses import dataclass, field
+from typing import Any
 
 from ecs_agent.components import (
     ConversationComponent,
@@ -22,7 +23,7 @@ from ecs_agent.types import CompletionResult, EntityId, MCTSNodeScoredEvent, Mes
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TreeNode:
     id: int
     parent_id: int | None
@@ -33,6 +34,12 @@ class TreeNode:
 
 
 class TreeSearchSystem:
+    required_components: tuple[type[Any], ...] = (
+        PlanSearchComponent,
+        LLMComponent,
+        ConversationComponent,
+    )
+
     def __init__(self, priority: int = 0) -> None:
         self.priority = priority
         self._nodes_by_entity: dict[int, dict[int, TreeNode]] = {}
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import time
+from typing import Any
 
 from ecs_agent.components.definitions import (
     ConversationComponent,
@@ -37,6 +38,8 @@ class UserInputSystem:
     ``event.input_future.set_result(text)`` to provide the input.
     """
 
+    required_components: tuple[type[Any], ...] = (UserInputComponent,)
+
     def __init__(self, priority: int = -10) -> None:
         self.priority = priority
 
@@ -31,10 +31,11 @@ async def bash(command: str, timeout: float, workspace_root: str) -> str:
         raise ValueError(f"Command timed out after {timeout}s") from exc
 
     stdout_text = stdout.decode("utf-8", errors="replace")
-    stderr_text = stderr.decode("utf-8", errors="replace")
     logger.info("bash", command=command, returncode=process.returncode)
 
     if process.returncode != 0:
+        # stderr is only reported on failure, so only decode it then
+        stderr_text = stderr.decode("utf-8", errors="replace")
         return (
             f"Exit code {process.returncode}\n"
             f"STDOUT:\n{stdout_text}\n"
@@ -52,11 +52,15 @@ async def bwrap_execute(command: str, timeout: float = 30.0) -> str:
     try:
         stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
     except asyncio.TimeoutError:
+        # Kill and reap the child so a timed-out command does not keep running
+        process.kill()
+        await process.wait()
         return f"Error: command timed out after {timeout}s"
 
     output = stdout.decode().strip()
-    error_output = stderr.decode().strip()
     if process.returncode != 0:
+        # stderr is only reported on failure, so only decode it then
+        error_output = stderr.decode().strip()
         return error_output or output or f"Error: command failed ({process.returncode})"
     return output
 
@@ -109,6 +109,7 @@ class RetryConfig:
     min_wait: float = 4.0
     max_wait: float = 60.0
     retry_status_codes: tuple[int, ...] = (429, 500, 502, 503, 504)
+    jitter: bool = False
 
 
 class ToolTimeoutError(Exception):
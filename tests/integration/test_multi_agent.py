@@ -44,7 +44,8 @@ def _deliver_to_peer(
         )
         return False
 
-    target_collaboration.inbox.append((sender_id, message))
+    target_collaboration.senders.append(sender_id)
+    target_collaboration.messages.append(message)
     return True
 
 
@@ -57,23 +58,24 @@ async def test_agent_sends_message_to_peer() -> None:
     world.add_component(agent_a_id, ConversationComponent(messages=[]))
     world.add_component(
         agent_a_id,
-        CollaborationComponent(peers=[agent_b_id], inbox=[]),
+        CollaborationComponent(peers=[agent_b_id]),
     )
 
     world.add_component(agent_b_id, ConversationComponent(messages=[]))
     world.add_component(
         agent_b_id,
-        CollaborationComponent(peers=[agent_a_id], inbox=[]),
+        CollaborationComponent(peers=[agent_a_id]),
     )
 
     collab_b = world.get_component(agent_b_id, CollaborationComponent)
     assert collab_b is not None
 
     outbound = Message(role="user", content="Hello from A")
-    collab_b.inbox.append((agent_a_id, outbound))
+    collab_b.senders.append(agent_a_id)
+    collab_b.messages.append(outbound)
 
-    assert len(collab_b.inbox) > 0
-    sender_id, message = collab_b.inbox[0]
+    assert len(collab_b.senders) == len(collab_b.messages) == 1
+    sender_id, message = collab_b.senders[0], collab_b.messages[0]
     assert sender_id == agent_a_id
     assert message.content == "Hello from A"
 
@@ -88,7 +90,7 @@ async def test_agent_sends_message_to_peer() -> None:
     conversation_b = world.get_component(agent_b_id, ConversationComponent)
     assert conversation_b is not None
     assert conversation_b.messages[-1].content == f"From: {agent_a_id}: Hello from A"
-    assert collab_b.inbox == []
+    assert not collab_b.senders and not collab_b.messages
     assert len(delivered_events) == 1
 
 
@@ -101,12 +103,12 @@ async def test_bidirectional_communication() -> None:
     world.add_component(agent_a_id, ConversationComponent(messages=[]))
     world.add_component(
         agent_a_id,
-        CollaborationComponent(peers=[agent_b_id], inbox=[]),
+        CollaborationComponent(peers=[agent_b_id]),
     )
     world.add_component(agent_b_id, ConversationComponent(messages=[]))
     world.add_component(
         agent_b_id,
-        CollaborationComponent(peers=[agent_a_id], inbox=[]),
+        CollaborationComponent(peers=[agent_a_id]),
     )
 
     collab_a = world.get_component(agent_a_id, CollaborationComponent)
@@ -114,8 +116,10 @@ async def test_bidirectional_communication() -> None:
     assert collab_a is not None
     assert collab_b is not None
 
-    collab_b.inbox.append((agent_a_id, Message(role="user", content="A to B")))
-    collab_a.inbox.append((agent_b_id, Message(role="user", content="B to A")))
+    collab_b.senders.append(agent_a_id)
+    collab_b.messages.append(Message(role="user", content="A to B"))
+    collab_a.senders.append(agent_b_id)
+    collab_a.messages.append(Message(role="user", content="B to A"))
 
     await CollaborationSystem(priority=5).process(world)
 
@@ -125,8 +129,8 @@ async def test_bidirectional_communication() -> None:
     assert conv_b is not None
     assert any(msg.content == f"From: {agent_b_id}: B to A" for msg in conv_a.messages)
     assert any(msg.content == f"From: {agent_a_id}: A to B" for msg in conv_b.messages)
-    assert collab_a.inbox == []
-    assert collab_b.inbox == []
+    assert not collab_a.senders and not collab_a.messages
+    assert not collab_b.senders and not collab_b.messages
 
 
 @pytest.mark.asyncio
@@ -138,7 +142,7 @@ async def test_unknown_peer_graceful_failure() -> None:
     world.add_component(agent_a_id, ConversationComponent(messages=[]))
     world.add_component(
         agent_a_id,
-        CollaborationComponent(peers=[unknown_peer], inbox=[]),
+        CollaborationComponent(peers=[unknown_peer]),
     )
 
     delivered = _deliver_to_peer(
@@ -173,7 +177,7 @@ async def test_multi_agent_full_loop() -> None:
     )
     world.add_component(
         agent_a_id,
-        CollaborationComponent(peers=[agent_b_id], inbox=[]),
+        CollaborationComponent(peers=[agent_b_id]),
     )
 
     world.add_component(
@@ -186,15 +190,17 @@ async def test_multi_agent_full_loop() -> None:
     )
     world.add_component(
         agent_b_id,
-        CollaborationComponent(peers=[agent_a_id], inbox=[]),
+        CollaborationComponent(peers=[agent_a_id]),
     )
 
     collab_a = world.get_component(agent_a_id, CollaborationComponent)
     collab_b = world.get_component(agent_b_id, CollaborationComponent)
     assert collab_a is not None
     assert collab_b is not None
-    collab_b.inbox.append((agent_a_id, Message(role="user", content="Ping from A")))
-    collab_a.inbox.append((agent_b_id, Message(role="user", content="Pong from B")))
+    collab_b.senders.append(agent_a_id)
+    collab_b.messages.append(Message(role="user", content="Ping from A"))
+    collab_a.senders.append(agent_b_id)
+    collab_a.messages.append(Message(role="user", content="Pong from B"))
 
     world.register_system(ReasoningSystem(priority=0), priority=0)
     world.register_system(CollaborationSystem(priority=5), priority=5)
@@ -218,6 +224,6 @@ async def test_multi_agent_full_loop() -> None:
     assert any(
         msg.content == f"From: {agent_a_id}: Ping from A" for msg in conv_b.messages
     )
-    assert collab_a.inbox == []
-    assert collab_b.inbox == []
+    assert not collab_a.senders and not collab_a.messages
+    assert not collab_b.senders and not collab_b.messages
     assert list(world.query(ErrorComponent)) == []
@@ -22,6 +22,25 @@ class _FakeProcess:
         return self._stdout, self._stderr
 
 
+class _HangingProcess:
+    def __init__(self) -> None:
+        self.returncode: int | None = None
+        self.killed = False
+        self.reaped = False
+
+    async def communicate(self) -> tuple[bytes, bytes]:
+        await asyncio.Event().wait()
+        return b"", b""
+
+    def kill(self) -> None:
+        self.killed = True
+
+    async def wait(self) -> int:
+        self.reaped = True
+        self.returncode = -9
+        return self.returncode
+
+
 @pytest.mark.asyncio
 async def test_bwrap_execute_falls_back_to_shell_when_unavailable(
     monkeypatch: pytest.MonkeyPatch,
@@ -70,6 +89,26 @@ async def test_bwrap_execute_uses_bwrap_when_available(
     assert calls[0][-3:] == ("sh", "-c", "echo wrapped")
 
 
+@pytest.mark.asyncio
+async def test_bwrap_execute_kills_and_reaps_process_on_timeout(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    process = _HangingProcess()
+
+    async def fake_shell(command: str, stdout: int, stderr: int) -> _HangingProcess:
+        _ = command, stdout, stderr
+        return process
+
+    monkeypatch.setattr("ecs_agent.tools.bwrap_sandbox._BWRAP_AVAILABLE", False)
+    monkeypatch.setattr(asyncio, "create_subprocess_shell", fake_shell)
+
+    result = await bwrap_execute("sleep 30", timeout=0.01)
+
+    assert result == "Error: command timed out after 0.01s"
+    assert process.killed
+    assert process.reaped
+
+
 @pytest.mark.skipif(not shutil.which("bwrap"), reason="bwrap not installed")
 @pytest.mark.asyncio
 async def test_bwrap_execute_real_command_when_bwrap_installed() -> None:
@@ -0,0 +1,225 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from ecs_agent.providers.caching_provider import CachingProvider
+from ecs_agent.types import CompletionResult, Message, StreamDelta, ToolSchema
+
+
+async def _stream_delta_iter() -> AsyncIterator[StreamDelta]:
+    yield StreamDelta(content="chunk")
+
+
+class CountingProvider:
+    def __init__(self) -> None:
+        self.call_count = 0
+        self.stream_call_count = 0
+
+    async def complete(
+        self,
+        messages: list[Message],
+        tools=None,
+        stream: bool = False,
+        response_format=None,
+    ):
+        self.call_count += 1
+        if stream:
+            self.stream_call_count += 1
+            return _stream_delta_iter()
+        return CompletionResult(
+            message=Message(role="assistant", content=f"reply {self.call_count}")
+        )
+
+
+def _messages(content: str = "hi") -> list[Message]:
+    return [Message(role="user", content=content)]
+
+
+@pytest.mark.asyncio
+async def test_identical_request_is_served_from_cache() -> None:
+    base = CountingProvider()
+    provider = CachingProvider(base)
+
+    first = await provider.complete(_messages())
+    second = await provider.complete(_messages())
+
+    assert base.call_count == 1
+    assert isinstance(first, CompletionResult)
+    assert isinstance(second, CompletionResult)
+    assert second.message.content == "reply 1"
+
+
+@pytest.mark.asyncio
+async def test_different_messages_tools_or_format_miss_cache() -> None:
+    base = CountingProvider()
+    provider = CachingProvider(base)
+    tool = ToolSchema(name="lookup", description="Lookup", parameters={})
+
+    await provider.complete(_messages("a"))
+    await provider.complete(_messages("b"))
+    await provider.complete(_messages("a"), tools=[tool])
+    await provider.complete(_messages("a"), response_format={"type": "json_object"})
+
+    assert base.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_cached_result_is_isolated_from_caller_mutation() -> None:
+    provider = CachingProvider(CountingProvider())
+
+    first = await provider.complete(_messages())
+    assert isinstance(first, CompletionResult)
+    first.message.content = "mutated"
+
+    second = await provider.complete(_messages())
+    assert isinstance(second, CompletionResult)
+    assert second.message.content == "reply 1"
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_refetched(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(
+        "ecs_agent.providers.caching_provider.time.monotonic", lambda: now[0]
+    )
+    base = CountingProvider()
+    provider = CachingProvider(base, ttl=10)
+
+    await provider.complete(_messages())
+    now[0] = 105.0
+    await provider.complete(_messages())
+    assert base.call_count == 1
+
+    now[0] = 111.0
+    result = await provider.complete(_messages())
+    assert base.call_count == 2
+    assert isinstance(result, CompletionResult)
+    assert result.message.content == "reply 2"
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted() -> None:
+    base = CountingProvider()
+    provider = CachingProvider(base, max_entries=2)
+
+    await provider.complete(_messages("a"))
+    await provider.complete(_messages("b"))
+    await provider.complete(_messages("a"))
+    await provider.complete(_messages("c"))
+    assert base.call_count == 3
+
+    await provider.complete(_messages("a"))
+    assert base.call_count == 3
+    await provider.complete(_messages("b"))
+    assert base.call_count == 4
+
+
+class GatedProvider(CountingProvider):
+    def __init__(self, error: Exception | None = None) -> None:
+        super().__init__()
+        self.release = asyncio.Event()
+        self._error = error
+
+    async def complete(
+        self,
+        messages: list[Message],
+        tools=None,
+        stream: bool = False,
+        response_format=None,
+    ):
+        await self.release.wait()
+        if self._error is not None:
+            self.call_count += 1
+            raise self._error
+        return await super().complete(messages, tools, stream, response_format)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call() -> None:
+    base = GatedProvider()
+    provider = CachingProvider(base)
+
+    tasks = [asyncio.create_task(provider.complete(_messages())) for _ in range(3)]
+    await asyncio.sleep(0)
+    base.release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert base.call_count == 1
+    assert [r.message.content for r in results] == ["reply 1"] * 3
+    assert results[0] is not results[1]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_waiters_see_failure_and_nothing_is_cached() -> None:
+    base = GatedProvider(error=RuntimeError("boom"))
+    provider = CachingProvider(base)
+
+    tasks = [asyncio.create_task(provider.complete(_messages())) for _ in range(2)]
+    await asyncio.sleep(0)
+    base.release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert base.call_count == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    with pytest.raises(RuntimeError):
+        await provider.complete(_messages())
+    assert base.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_waiter_survives_cancellation_of_the_first_caller() -> None:
+    base = GatedProvider()
+    provider = CachingProvider(base)
+
+    first = asyncio.create_task(provider.complete(_messages()))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(provider.complete(_messages()))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    base.release.set()
+    result = await second
+
+    assert isinstance(result, CompletionResult)
+    assert result.message.content == "reply 1"
+    assert base.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_the_shared_call() -> None:
+    base = GatedProvider()
+    provider = CachingProvider(base)
+
+    first = asyncio.create_task(provider.complete(_messages()))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(provider.complete(_messages()))
+    await asyncio.sleep(0)
+
+    second.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await second
+    base.release.set()
+    result = await first
+
+    assert result.message.content == "reply 1"
+    assert base.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_streaming_bypasses_cache() -> None:
+    base = CountingProvider()
+    provider = CachingProvider(base)
+
+    await provider.complete(_messages(), stream=True)
+    await provider.complete(_messages(), stream=True)
+
+    assert base.stream_call_count == 2
+
+
+@pytest.mark.parametrize("kwargs", [{"ttl": 0}, {"max_entries": 0}])
+def test_invalid_limits_raise(kwargs: dict[str, int]) -> None:
+    with pytest.raises(ValueError):
+        CachingProvider(CountingProvider(), **kwargs)
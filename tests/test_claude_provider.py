@@ -97,6 +97,22 @@ def test_build_messages_converts_tool_result_to_user_tool_result_block() -> None
     ]
 
 
+def test_build_tools_reuses_payload_for_same_schema() -> None:
+    provider = ClaudeProvider(api_key="test-key", model="claude-3-haiku-20240307")
+    tool = ToolSchema(name="lookup", description="Lookup", parameters={})
+
+    first = provider._build_tools([tool])
+    second = provider._build_tools([tool])
+    assert first is not None and second is not None
+    assert first[0] is second[0]
+
+    replaced = ToolSchema(name="lookup", description="New lookup", parameters={})
+    third = provider._build_tools([replaced])
+    assert third is not None
+    assert third[0] is not first[0]
+    assert third[0]["description"] == "New lookup"
+
+
 def test_build_tools_converts_parameters_to_input_schema() -> None:
     provider = ClaudeProvider(api_key="test-key", model="claude-3-haiku-20240307")
     tools = [
@@ -254,6 +270,49 @@ async def test_complete_non_streaming_makes_expected_request() -> None:
     assert result.message.content == "Response"
 
 
+@pytest.mark.asyncio
+async def test_complete_with_prompt_caching_marks_stable_prefix() -> None:
+    mock_response = Mock(spec=httpx.Response)
+    mock_response.json.return_value = {
+        "content": [{"type": "text", "text": "Response"}],
+        "usage": {"input_tokens": 7, "output_tokens": 3},
+    }
+    mock_response.raise_for_status = Mock()
+
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client.post.return_value = mock_response
+
+    provider = ClaudeProvider(
+        api_key="test-key", model="claude-3-haiku-20240307", prompt_caching=True
+    )
+    provider._client = mock_client
+
+    tools = [
+        ToolSchema(name="first", description="First", parameters={}),
+        ToolSchema(name="second", description="Second", parameters={}),
+    ]
+    await provider.complete(
+        messages=[
+            Message(role="system", content="System prompt"),
+            Message(role="user", content="Hello"),
+        ],
+        tools=tools,
+    )
+
+    body = mock_client.post.call_args[1]["json"]
+    assert body["system"] == [
+        {
+            "type": "text",
+            "text": "System prompt",
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+    assert "cache_control" not in body["tools"][0]
+    assert body["tools"][1]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in provider._build_tools(tools)[1]
+    assert "cache_control" not in body["messages"][0]
+
+
 @pytest.mark.asyncio
 async def test_complete_raises_on_http_status_error() -> None:
     mock_response = Mock(spec=httpx.Response)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import deque
+
 import pytest
 
 from ecs_agent.components import CollaborationComponent, ConversationComponent
@@ -24,7 +26,8 @@ async def test_basic_message_delivery_appends_to_conversation_and_clears_inbox()
         receiver,
         CollaborationComponent(
             peers=[sender],
-            inbox=[(sender, _msg("assistant", "Hello from sender"))],
+            senders=deque([sender]),
+            messages=deque([_msg("assistant", "Hello from sender")]),
         ),
     )
     world.add_component(receiver, ConversationComponent(messages=[]))
@@ -46,13 +49,45 @@ async def test_basic_message_delivery_appends_to_conversation_and_clears_inbox()
         f"From: {sender}: Hello from sender"
     ]
     assert conversation.messages[0].role == "user"
-    assert collaboration.inbox == []
+    assert not collaboration.senders and not collaboration.messages
     assert len(events) == 1
     assert events[0].from_entity == sender
     assert events[0].to_entity == receiver
     assert events[0].message.content == "Hello from sender"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("sender_count", "message_count"), [(2, 1), (1, 2), (0, 1)])
+async def test_mismatched_inbox_delivers_pairs_and_drops_the_rest(
+    sender_count: int, message_count: int
+) -> None:
+    world = World()
+    sender = world.create_entity()
+    receiver = world.create_entity()
+    world.add_component(
+        receiver,
+        CollaborationComponent(
+            peers=[sender],
+            senders=deque([sender] * sender_count),
+            messages=deque(
+                _msg("assistant", f"note {i}") for i in range(message_count)
+            ),
+        ),
+    )
+    world.add_component(receiver, ConversationComponent(messages=[]))
+
+    await CollaborationSystem().process(world)
+
+    conversation = world.get_component(receiver, ConversationComponent)
+    collaboration = world.get_component(receiver, CollaborationComponent)
+    assert conversation is not None and collaboration is not None
+    delivered = min(sender_count, message_count)
+    assert [m.content for m in conversation.messages] == [
+        f"From: {sender}: note {i}" for i in range(delivered)
+    ]
+    assert not collaboration.senders and not collaboration.messages
+
+
 @pytest.mark.asyncio
 async def test_empty_inbox_is_noop() -> None:
     world = World()
@@ -60,7 +95,7 @@ async def test_empty_inbox_is_noop() -> None:
     entity_id = world.create_entity()
 
     existing = [_msg("assistant", "already here")]
-    world.add_component(entity_id, CollaborationComponent(peers=[peer], inbox=[]))
+    world.add_component(entity_id, CollaborationComponent(peers=[peer]))
     world.add_component(entity_id, ConversationComponent(messages=list(existing)))
 
     events: list[MessageDeliveredEvent] = []
@@ -76,7 +111,7 @@ async def test_empty_inbox_is_noop() -> None:
     assert conversation is not None
     assert collaboration is not None
     assert conversation.messages == existing
-    assert collaboration.inbox == []
+    assert not collaboration.senders and not collaboration.messages
     assert events == []
 
 
@@ -90,11 +125,14 @@ async def test_multiple_messages_are_processed_in_order() -> None:
         receiver,
         CollaborationComponent(
             peers=[sender],
-            inbox=[
-                (sender, _msg("assistant", "first")),
-                (sender, _msg("assistant", "second")),
-                (sender, _msg("assistant", "third")),
-            ],
+            senders=deque([sender, sender, sender]),
+            messages=deque(
+                [
+                    _msg("assistant", "first"),
+                    _msg("assistant", "second"),
+                    _msg("assistant", "third"),
+                ]
+            ),
         ),
     )
     world.add_component(receiver, ConversationComponent(messages=[]))
@@ -116,7 +154,7 @@ async def test_multiple_messages_are_processed_in_order() -> None:
         f"From: {sender}: second",
         f"From: {sender}: third",
     ]
-    assert collaboration.inbox == []
+    assert not collaboration.senders and not collaboration.messages
     assert delivered == [
         (sender, receiver, "first"),
         (sender, receiver, "second"),
@@ -133,7 +171,8 @@ async def test_entity_without_conversation_is_skipped() -> None:
         receiver,
         CollaborationComponent(
             peers=[sender],
-            inbox=[(sender, _msg("assistant", "pending"))],
+            senders=deque([sender]),
+            messages=deque([_msg("assistant", "pending")]),
         ),
     )
 
@@ -147,7 +186,8 @@ async def test_entity_without_conversation_is_skipped() -> None:
 
     collaboration = world.get_component(receiver, CollaborationComponent)
     assert collaboration is not None
-    assert [item[1].content for item in collaboration.inbox] == ["pending"]
+    assert list(collaboration.senders) == [sender]
+    assert [m.content for m in collaboration.messages] == ["pending"]
     assert seen == []
 
 
@@ -163,14 +203,16 @@ async def test_multiple_entities_are_processed() -> None:
         receiver_a,
         CollaborationComponent(
             peers=[sender_a],
-            inbox=[(sender_a, _msg("assistant", "a-msg"))],
+            senders=deque([sender_a]),
+            messages=deque([_msg("assistant", "a-msg")]),
         ),
     )
     world.add_component(
         receiver_b,
         CollaborationComponent(
             peers=[sender_b],
-            inbox=[(sender_b, _msg("assistant", "b-msg"))],
+            senders=deque([sender_b]),
+            messages=deque([_msg("assistant", "b-msg")]),
         ),
     )
     world.add_component(receiver_a, ConversationComponent(messages=[]))
@@ -188,5 +230,5 @@ async def test_multiple_entities_are_processed() -> None:
     assert collab_b is not None
     assert [m.content for m in conv_a.messages] == [f"From: {sender_a}: a-msg"]
     assert [m.content for m in conv_b.messages] == [f"From: {sender_b}: b-msg"]
-    assert collab_a.inbox == []
-    assert collab_b.inbox == []
+    assert not collab_a.senders and not collab_a.messages
+    assert not collab_b.senders and not collab_b.messages
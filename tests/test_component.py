@@ -65,3 +65,60 @@ def test_component_store_delete_entity_removes_all_component_types() -> None:
 
     assert store.get(entity_id, Position) is None
     assert store.get(entity_id, Velocity) is None
+
+
+def test_component_store_keeps_other_components_when_adding_and_removing() -> None:
+    store = ComponentStore()
+    first = EntityId(1)
+    second = EntityId(2)
+    store.add(first, Position(x=1.0, y=1.0))
+    store.add(second, Position(x=2.0, y=2.0))
+    store.add(first, Velocity(dx=0.1, dy=0.1))
+
+    store.remove(first, Position)
+
+    assert store.get(first, Position) is None
+    assert store.get(first, Velocity) == Velocity(dx=0.1, dy=0.1)
+    assert store.get(second, Position) == Position(x=2.0, y=2.0)
+    assert store.components_of(first) == {Velocity: Velocity(dx=0.1, dy=0.1)}
+
+
+def test_component_store_delete_entity_keeps_remaining_rows_intact() -> None:
+    store = ComponentStore()
+    for value in range(1, 4):
+        store.add(EntityId(value), Position(x=float(value), y=0.0))
+
+    store.delete_entity(EntityId(1))
+
+    assert store.get_all(Position) == {
+        EntityId(2): Position(x=2.0, y=0.0),
+        EntityId(3): Position(x=3.0, y=0.0),
+    }
+    assert sorted(store.entity_ids()) == [EntityId(2), EntityId(3)]
+
+
+@dataclass(slots=True)
+class Health:
+    hp: int
+
+
+def test_component_store_cached_query_sees_archetypes_created_later() -> None:
+    store = ComponentStore()
+    first = EntityId(1)
+    store.add(first, Position(x=0.0, y=0.0))
+    store.add(first, Velocity(dx=1.0, dy=1.0))
+    assert store.count((Position, Velocity)) == 1
+
+    second = EntityId(2)
+    store.add(second, Velocity(dx=2.0, dy=2.0))
+    store.add(second, Health(hp=5))
+    store.add(second, Position(x=3.0, y=3.0))
+    store.add(EntityId(3), Position(x=4.0, y=4.0))
+
+    assert store.count((Position, Velocity)) == 2
+    assert [
+        archetype.entities for archetype in store.archetypes_with((Velocity, Position))
+    ] == [[first], [second]]
+
+    store.delete_entity(first)
+    assert store.count((Position, Velocity)) == 1
@@ -1,6 +1,7 @@
 """Tests for Component dataclasses."""
 
 import dataclasses
+from collections import deque
 from typing import TYPE_CHECKING
 
 import pytest
@@ -199,16 +200,20 @@ class TestCollaborationComponent:
     def test_instantiation(self):
         """Test CollaborationComponent can be instantiated."""
         peers = [EntityId(1), EntityId(2)]
-        inbox = [(EntityId(1), Message(role="user", content="msg"))]
-        comp = CollaborationComponent(peers=peers, inbox=inbox)
+        senders = deque([EntityId(1)])
+        messages = deque([Message(role="user", content="msg")])
+        comp = CollaborationComponent(
+            peers=peers, senders=senders, messages=messages
+        )
         assert comp.peers == peers
-        assert comp.inbox == inbox
+        assert comp.senders == senders
+        assert comp.messages == messages
 
     def test_empty_peers_and_inbox(self):
         """Test CollaborationComponent with empty peers and inbox."""
-        comp = CollaborationComponent(peers=[], inbox=[])
+        comp = CollaborationComponent(peers=[])
         assert comp.peers == []
-        assert comp.inbox == []
+        assert not comp.senders and not comp.messages
 
     def test_dataclass_slots(self):
         """Test CollaborationComponent uses slots."""
@@ -275,7 +280,7 @@ class TestComponentCount:
     """Test component count limit."""
 
     def test_component_count_limit(self):
-        """Test that component count does not exceed 27."""
+        """Test that component count does not exceed 29."""
         import ecs_agent.components.definitions as d
 
         count = sum(
@@ -285,7 +290,7 @@ class TestComponentCount:
             and dataclasses.is_dataclass(getattr(d, name, None))
             and getattr(d, name).__module__ == "ecs_agent.components.definitions"
         )
-        assert count <= 27, f"Component count {count} exceeds limit of 27"
+        assert count <= 29, f"Component count {count} exceeds limit of 29"
 
 
 class TestComponentsExportedInInit:
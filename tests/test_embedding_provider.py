@@ -6,6 +6,7 @@ import pytest
 import httpx
 from unittest.mock import AsyncMock, patch
 
+from ecs_agent.providers.caching_embedding_provider import CachingEmbeddingProvider
 from ecs_agent.providers.embedding_protocol import EmbeddingProvider
 from ecs_agent.providers.fake_embedding_provider import FakeEmbeddingProvider
 from ecs_agent.providers.embedding_provider import OpenAIEmbeddingProvider
@@ -246,4 +247,77 @@ async def test_openai_embedding_provider_custom_timeouts() -> None:
     )
 
     assert provider._timeout.connect == 5.0
-    assert provider._timeout.read == 60.0
\ No newline at end of file
+    assert provider._timeout.read == 60.0
+
+
+class _CountingEmbeddingProvider:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+        self._inner = FakeEmbeddingProvider(dimension=4)
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return await self._inner.embed(texts)
+
+
+@pytest.mark.asyncio
+async def test_caching_embedding_provider_only_embeds_misses_in_order() -> None:
+    """CachingEmbeddingProvider should forward only uncached texts, once each."""
+    inner = _CountingEmbeddingProvider()
+    provider = CachingEmbeddingProvider(inner)
+
+    first = await provider.embed(["a", "b", "a"])
+    second = await provider.embed(["b", "c"])
+
+    expected = FakeEmbeddingProvider(dimension=4)
+    assert inner.calls == [["a", "b"], ["c"]]
+    assert first == await expected.embed(["a", "b", "a"])
+    assert second == await expected.embed(["b", "c"])
+    assert isinstance(provider, EmbeddingProvider)
+
+
+@pytest.mark.asyncio
+async def test_caching_embedding_provider_evicts_least_recently_used() -> None:
+    """CachingEmbeddingProvider should drop the LRU entry past max_entries."""
+    inner = _CountingEmbeddingProvider()
+    provider = CachingEmbeddingProvider(inner, max_entries=2)
+
+    await provider.embed(["a", "b"])
+    await provider.embed(["a"])
+    await provider.embed(["c"])
+    await provider.embed(["a", "b"])
+
+    assert inner.calls == [["a", "b"], ["c"], ["b"]]
+
+
+@pytest.mark.asyncio
+async def test_caching_embedding_provider_returns_independent_vectors() -> None:
+    """Mutating a returned vector should not corrupt the cache."""
+    provider = CachingEmbeddingProvider(FakeEmbeddingProvider(dimension=4))
+
+    vector = (await provider.embed(["a"]))[0]
+    expected = list(vector)
+    vector.clear()
+
+    assert (await provider.embed(["a"]))[0] == expected
+
+
+def test_caching_embedding_provider_rejects_non_positive_max_entries() -> None:
+    """CachingEmbeddingProvider should validate max_entries."""
+    with pytest.raises(ValueError, match="max_entries"):
+        CachingEmbeddingProvider(FakeEmbeddingProvider(), max_entries=0)
+
+
+class _ShortEmbeddingProvider:
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        return [[0.0]] * (len(texts) - 1)
+
+
+@pytest.mark.asyncio
+async def test_caching_embedding_provider_rejects_short_vector_batch() -> None:
+    """A provider returning too few vectors should raise, caching nothing."""
+    provider = CachingEmbeddingProvider(_ShortEmbeddingProvider())
+
+    with pytest.raises(ValueError, match="returned 1 vectors for 2 texts"):
+        await provider.embed(["a", "b"])
+    assert len(provider._cache) == 0
@@ -89,6 +89,37 @@ async def test_publish_executes_handlers_in_parallel() -> None:
     assert elapsed < 0.09
 
 
+@pytest.mark.asyncio
+async def test_publish_many_runs_handlers_across_events_in_parallel() -> None:
+    bus = EventBus()
+    seen: list[object] = []
+
+    async def sample_handler(event: SampleEvent) -> None:
+        seen.append(event.value)
+        await asyncio.sleep(0.05)
+
+    async def other_handler(event: OtherEvent) -> None:
+        seen.append(event.name)
+        await asyncio.sleep(0.05)
+
+    bus.subscribe(SampleEvent, sample_handler)
+    bus.subscribe(OtherEvent, other_handler)
+
+    started = time.perf_counter()
+    await bus.publish_many([SampleEvent(value=1), OtherEvent(name="x"), SampleEvent(2)])
+    elapsed = time.perf_counter() - started
+
+    assert seen == [1, "x", 2]
+    assert elapsed < 0.09
+
+
+@pytest.mark.asyncio
+async def test_publish_many_without_handlers_is_noop() -> None:
+    bus = EventBus()
+    await bus.publish_many([OtherEvent(name="unused")])
+    await bus.publish_many([])
+
+
 @pytest.mark.asyncio
 async def test_unsubscribe_removes_specific_handler() -> None:
     bus = EventBus()
@@ -127,6 +158,39 @@ async def test_handler_exception_isolated_from_other_handlers() -> None:
     assert seen == [42]
 
 
+@pytest.mark.asyncio
+async def test_publish_many_isolates_handler_that_fails_when_called() -> None:
+    bus = EventBus()
+    seen: list[int] = []
+
+    def broken_handler(event: SampleEvent) -> None:
+        _ = event
+        raise RuntimeError("boom")
+
+    async def good_handler(event: SampleEvent) -> None:
+        seen.append(event.value)
+
+    bus.subscribe(SampleEvent, good_handler)
+    bus.subscribe(SampleEvent, broken_handler)  # type: ignore[arg-type]
+
+    await bus.publish_many([SampleEvent(value=1), SampleEvent(value=2)])
+    await bus.publish(SampleEvent(value=3))
+    assert seen == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_single_handler_exception_is_swallowed() -> None:
+    bus = EventBus()
+
+    async def bad_handler(event: SampleEvent) -> None:
+        _ = event
+        raise RuntimeError("boom")
+
+    bus.subscribe(SampleEvent, bad_handler)
+
+    await bus.publish(SampleEvent(value=1))
+
+
 @pytest.mark.asyncio
 async def test_publish_unsubscribed_event_type_is_silent_noop() -> None:
     bus = EventBus()
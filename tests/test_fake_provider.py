@@ -20,6 +20,24 @@ async def test_fake_provider_returns_responses_sequentially() -> None:
     assert result2.message.content == "Second"
 
 
+@pytest.mark.asyncio
+async def test_fake_provider_accepts_any_iterable_without_aliasing_it() -> None:
+    """FakeProvider should copy tuples/generators and leave the caller's list intact."""
+    resp1 = CompletionResult(message=Message(role="assistant", content="First"))
+    resp2 = CompletionResult(message=Message(role="assistant", content="Second"))
+    template = [resp1, resp2]
+
+    from_tuple = FakeProvider(responses=tuple(template))
+    from_generator = FakeProvider(responses=(r for r in template))
+
+    for provider in (from_tuple, from_generator):
+        first = await provider.complete([Message(role="user", content="Hi")])
+        second = await provider.complete([Message(role="user", content="Hey")])
+        assert [first.message.content, second.message.content] == ["First", "Second"]
+
+    assert template == [resp1, resp2]
+
+
 @pytest.mark.asyncio
 async def test_fake_provider_raises_on_exhaustion() -> None:
     """FakeProvider should raise IndexError when responses exhausted."""
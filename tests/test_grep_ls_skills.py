@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+
 import pytest
 
 from ecs_agent.skills.protocol import Skill
@@ -31,6 +34,18 @@ class TestGrepSkillProtocol:
         assert schema.name == "grep"
         assert callable(handler)
 
+    async def test_skill_tools_are_shared_across_instances(self) -> None:
+        """Each install should reuse the schema and handler built by @tool."""
+        from examples.skills.grep_skill import GrepSkill
+        from examples.skills.ls_skill import LsSkill
+
+        for skill_class in (GrepSkill, LsSkill):
+            first = skill_class().tools()
+            second = skill_class().tools()
+            for name, (schema, handler) in first.items():
+                assert second[name][0] is schema
+                assert second[name][1] is handler
+
 
 class TestGrepSkillFunctionality:
     """Test GrepSkill tool functionality."""
@@ -71,6 +86,84 @@ class TestGrepSkillFunctionality:
         )
 
 
+    async def test_grep_recursive_prefixes_matches_with_file_names(
+        self, tmp_path
+    ) -> None:
+        """Recursive grep should search nested files and name each match."""
+        from examples.skills.grep_skill import GrepSkill
+
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.txt").write_text("needle one\nhay\n")
+        (tmp_path / "sub" / "b.txt").write_text("hay\nneedle two\n")
+        (tmp_path / "sub" / "c.bin").write_bytes(b"needle\0binary")
+
+        _, grep_handler = GrepSkill().tools()["grep"]
+
+        result = await grep_handler(
+            pattern="needle", path=str(tmp_path), recursive=True
+        )
+        assert result.splitlines() == [
+            f"{tmp_path / 'a.txt'}:needle one",
+            f"{tmp_path / 'sub' / 'b.txt'}:needle two",
+        ]
+
+    async def test_grep_anchors_and_repeated_matches_are_per_line(
+        self, tmp_path
+    ) -> None:
+        """Anchors should match at line boundaries and each line print once."""
+        from examples.skills.grep_skill import GrepSkill
+
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("ab ab ab\nxab\n\nab\n")
+        _, grep_handler = GrepSkill().tools()["grep"]
+
+        result = await grep_handler(pattern="^ab", path=str(test_file))
+        assert result.splitlines() == ["ab ab ab", "ab"]
+
+        result = await grep_handler(pattern=r"b\s", path=str(test_file))
+        assert result.splitlines() == ["ab ab ab"]
+
+    async def test_grep_invalid_pattern_returns_error(self, tmp_path) -> None:
+        """Grep tool should report an invalid pattern instead of raising."""
+        from examples.skills.grep_skill import GrepSkill
+
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("hello\n")
+        _, grep_handler = GrepSkill().tools()["grep"]
+
+        result = await grep_handler(pattern="(", path=str(test_file))
+        assert result.startswith("error:")
+
+    async def test_grep_times_out_and_stops_scanning(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        """A slow search should return a timeout error and stop the walk."""
+        from examples.skills import grep_skill
+
+        for index in range(50):
+            (tmp_path / f"{index:02}.txt").write_text("needle\n")
+        scanned: list[str] = []
+
+        def slow_scan(regex, file_path, stop) -> list[str]:
+            if stop.is_set():
+                return []
+            time.sleep(0.2)
+            scanned.append(file_path.name)
+            return []
+
+        monkeypatch.setattr(grep_skill, "_TIMEOUT_SECONDS", 0.05)
+        monkeypatch.setattr(grep_skill, "_scan_file", slow_scan)
+        _, grep_handler = grep_skill.GrepSkill().tools()["grep"]
+
+        result = await grep_handler(
+            pattern="needle", path=str(tmp_path), recursive=True
+        )
+        assert result == "error: grep timed out"
+
+        await asyncio.sleep(0.5)
+        assert len(scanned) < 50
+
+
 class TestLsSkillProtocol:
     """Test LsSkill implements Skill protocol."""
 
@@ -133,6 +226,35 @@ class TestLsSkillFunctionality:
             or len(result) == 0
         )
 
+    async def test_ls_long_format_sorts_and_hides_dotfiles(self, tmp_path) -> None:
+        """Ls long format should show sizes, mark directories and skip dotfiles."""
+        from examples.skills.ls_skill import LsSkill
+
+        (tmp_path / "b.txt").write_text("12345")
+        (tmp_path / "a_dir").mkdir()
+        (tmp_path / ".hidden").write_text("x")
+        _, ls_handler = LsSkill().tools()["ls"]
+
+        result = await ls_handler(path=str(tmp_path), long_format=True)
+        assert result.splitlines() == [f"{'-':10} a_dir/", f"{5:10} b.txt"]
+
+        result = await ls_handler(path=str(tmp_path), all_files=True)
+        assert result.splitlines() == [".hidden", "a_dir/", "b.txt"]
+
+    async def test_ls_limit_truncates_listing(self, tmp_path) -> None:
+        """Ls should keep the first entries by name and report the rest."""
+        from examples.skills.ls_skill import LsSkill
+
+        for name in ["d", "b", "e", "a", "c"]:
+            (tmp_path / name).write_text(name)
+        _, ls_handler = LsSkill().tools()["ls"]
+
+        result = await ls_handler(path=str(tmp_path), limit=2)
+        assert result.splitlines() == ["a", "b", "(truncated, 3 more entries)"]
+
+        result = await ls_handler(path=str(tmp_path), limit=0)
+        assert result.startswith("error:")
+
 
 class TestSkillDiscoveryIntegration:
     """Test both skills loadable via SkillDiscovery."""
@@ -162,6 +162,24 @@ async def test_complete_with_tools(mock_litellm) -> None:
     assert call_kwargs["tools"][0]["function"]["name"] == "get_weather"
 
 
+@pytest.mark.asyncio
+async def test_tool_conversion_reuses_payload_for_same_schema(mock_litellm) -> None:
+    """Test converted tools are cached per schema object."""
+    from ecs_agent.providers.litellm_provider import LiteLLMProvider
+
+    provider = LiteLLMProvider(model="openai/gpt-4o", api_key="test")
+    tool = ToolSchema(name="lookup", description="Lookup", parameters={})
+
+    first = provider._convert_tools_to_openai([tool])
+    second = provider._convert_tools_to_openai([tool])
+    assert first[0] is second[0]
+
+    replaced = ToolSchema(name="lookup", description="New lookup", parameters={})
+    third = provider._convert_tools_to_openai([replaced])
+    assert third[0] is not first[0]
+    assert third[0]["function"]["description"] == "New lookup"
+
+
 @pytest.mark.asyncio
 async def test_streaming_complete(mock_litellm) -> None:
     """Test streaming completion yields StreamDelta objects."""
@@ -76,6 +76,23 @@ async def test_truncation_preserves_first_system_message() -> None:
     ]
 
 
+@pytest.mark.asyncio
+async def test_truncation_mutates_message_list_in_place() -> None:
+    world = World()
+    entity_id = world.create_entity()
+    messages = [_msg("system", "s0")] + [_msg("user", f"u{i}") for i in range(6)]
+    world.add_component(
+        entity_id, ConversationComponent(messages=messages, max_messages=3)
+    )
+
+    await MemorySystem().process(world)
+
+    conversation = world.get_component(entity_id, ConversationComponent)
+    assert conversation is not None
+    assert conversation.messages is messages
+    assert [message.content for message in messages] == ["s0", "u4", "u5"]
+
+
 @pytest.mark.asyncio
 async def test_event_published_on_truncation_with_removed_count() -> None:
     world = World()
@@ -1,6 +1,7 @@
 """Tests for OpenAI-compatible provider."""
 
 import json
+import sys
 import pytest
 import httpx
 from unittest.mock import AsyncMock, Mock
@@ -18,6 +19,27 @@ async def test_constructor_instantiation() -> None:
     assert provider is not None
 
 
+@pytest.mark.asyncio
+async def test_providers_can_share_a_client() -> None:
+    """Test a caller-supplied client is used instead of a new one."""
+    mock_response = Mock(spec=httpx.Response)
+    mock_response.json.return_value = {
+        "choices": [{"message": {"role": "assistant", "content": "ok"}}],
+    }
+    mock_response.raise_for_status = Mock()
+    shared = AsyncMock(spec=httpx.AsyncClient)
+    shared.post.return_value = mock_response
+
+    first = OpenAIProvider(api_key="test-key", model="a", client=shared)
+    second = OpenAIProvider(api_key="test-key", model="b", client=shared)
+    messages = [Message(role="user", content="hi")]
+    await first.complete(messages)
+    await second.complete(messages)
+
+    models = [call[1]["json"]["model"] for call in shared.post.call_args_list]
+    assert models == ["a", "b"]
+
+
 @pytest.mark.asyncio
 async def test_request_format(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test HTTP request format matches OpenAI spec."""
@@ -104,6 +126,52 @@ async def test_response_parsing_content_and_usage(
     assert result.usage.total_tokens == 15
 
 
+@pytest.mark.asyncio
+async def test_response_parsing_interns_role() -> None:
+    """Test roles decoded from the wire are interned."""
+    wire_role = "".join(["assist", "ant"])
+    assert wire_role is not sys.intern("assistant")
+
+    mock_response = Mock(spec=httpx.Response)
+    mock_response.json.return_value = {
+        "choices": [{"message": {"role": wire_role, "content": "Hi"}}],
+    }
+    mock_response.raise_for_status = Mock()
+
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client.post.return_value = mock_response
+
+    provider = OpenAIProvider(api_key="test-key")
+    provider._client = mock_client
+
+    result = await provider.complete([Message(role="user", content="test")])
+
+    assert result.message.role is sys.intern("assistant")
+
+
+def test_tool_conversion_reuses_payload_for_same_schema() -> None:
+    """Test converted tools are cached per schema object."""
+    provider = OpenAIProvider(api_key="test-key")
+    tool = ToolSchema(
+        name="test_tool",
+        description="test description",
+        parameters={"type": "object", "properties": {}},
+    )
+
+    first = provider._convert_tools_to_openai([tool])
+    second = provider._convert_tools_to_openai([tool])
+    assert first[0] is second[0]
+
+    replaced = ToolSchema(
+        name="test_tool",
+        description="new description",
+        parameters={"type": "object", "properties": {}},
+    )
+    third = provider._convert_tools_to_openai([replaced])
+    assert third[0] is not first[0]
+    assert third[0]["function"]["description"] == "new description"
+
+
 @pytest.mark.asyncio
 async def test_response_parsing_tool_calls(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test response parsing handles tool calls correctly."""
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import pytest
+
+from ecs_agent.components import (
+    ConversationComponent,
+    LLMComponent,
+    PendingToolCallsComponent,
+    PlanCacheComponent,
+    PlanComponent,
+    SystemPromptComponent,
+    TerminalComponent,
+)
+from ecs_agent.core import Runner, World
+from ecs_agent.providers import FakeProvider
+from ecs_agent.systems.plan_cache import PlanCacheSystem
+from ecs_agent.systems.planning import PlanningSystem
+from ecs_agent.types import CompletionResult, EntityId, Message, ToolCall
+
+
+def _build_world(
+    store: dict[str, list[Message]],
+    responses: list[CompletionResult],
+    prompt: str = "You plan trips.",
+) -> tuple[World, EntityId]:
+    world = World()
+    entity_id = world.create_entity()
+    world.add_component(
+        entity_id, LLMComponent(provider=FakeProvider(responses=responses), model="fake")
+    )
+    world.add_component(entity_id, SystemPromptComponent(content=prompt))
+    world.add_component(
+        entity_id,
+        ConversationComponent(messages=[Message(role="user", content="plan a trip")]),
+    )
+    world.add_component(entity_id, PlanComponent(steps=["research", "summarize"]))
+    world.add_component(entity_id, PlanCacheComponent(store=store))
+    world.register_systems([(PlanCacheSystem(), -20), (PlanningSystem(), 0)])
+    return world, entity_id
+
+
+def _responses() -> list[CompletionResult]:
+    return [
+        CompletionResult(message=Message(role="assistant", content="researched")),
+        CompletionResult(message=Message(role="assistant", content="summary")),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_plan_cache_stores_completed_plan_and_replays_it_on_hit() -> None:
+    store: dict[str, list[Message]] = {}
+
+    first_world, first_id = _build_world(store, _responses())
+    await Runner().run(first_world, max_ticks=2)
+
+    assert len(store) == 1
+    first_conv = first_world.get_component(first_id, ConversationComponent)
+    assert first_conv is not None
+    assert [m.content for m in first_conv.messages] == [
+        "plan a trip",
+        "researched",
+        "summary",
+    ]
+
+    second_world, second_id = _build_world(store, responses=[])
+    await Runner().run(second_world, max_ticks=4)
+
+    second_conv = second_world.get_component(second_id, ConversationComponent)
+    plan = second_world.get_component(second_id, PlanComponent)
+    terminal = second_world.get_component(second_id, TerminalComponent)
+    assert second_conv is not None and plan is not None and terminal is not None
+    assert second_conv.messages == first_conv.messages
+    assert second_conv.messages is not store[next(iter(store))]
+    assert plan.completed is True
+    assert plan.current_step == len(plan.steps)
+    assert terminal.reason == "plan_cache_hit"
+
+
+@pytest.mark.asyncio
+async def test_plan_cache_stores_plan_in_the_tick_it_completes() -> None:
+    store: dict[str, list[Message]] = {}
+    world, entity_id = _build_world(store, _responses())
+
+    await world.process()
+    assert store == {}
+    await world.process()
+
+    plan = world.get_component(entity_id, PlanComponent)
+    assert plan is not None and plan.completed is True
+    assert [m.content for m in store[next(iter(store))]] == [
+        "plan a trip",
+        "researched",
+        "summary",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_plan_cache_defers_store_until_final_tool_results() -> None:
+    store: dict[str, list[Message]] = {}
+    tool_call = ToolCall(id="call_1", name="lookup", arguments={})
+    responses = [
+        CompletionResult(message=Message(role="assistant", content="researched")),
+        CompletionResult(
+            message=Message(role="assistant", content="", tool_calls=[tool_call])
+        ),
+    ]
+    world, entity_id = _build_world(store, responses)
+
+    await world.process()
+    await world.process()
+    assert store == {}
+
+    world.remove_component(entity_id, PendingToolCallsComponent)
+    conversation = world.get_component(entity_id, ConversationComponent)
+    assert conversation is not None
+    conversation.messages.append(
+        Message(role="tool", content="found", tool_call_id="call_1")
+    )
+    await world.process()
+
+    assert [m.content for m in store[next(iter(store))]][-1] == "found"
+
+
+@pytest.mark.asyncio
+async def test_plan_cache_misses_when_fingerprint_inputs_differ() -> None:
+    store: dict[str, list[Message]] = {}
+
+    first_world, _ = _build_world(store, _responses())
+    await Runner().run(first_world, max_ticks=4)
+
+    other_world, other_id = _build_world(store, _responses(), prompt="Different.")
+    await other_world.process()
+
+    assert other_world.get_component(other_id, TerminalComponent) is None
+    plan = other_world.get_component(other_id, PlanComponent)
+    assert plan is not None and plan.current_step == 1
+
+
+@pytest.mark.asyncio
+async def test_plan_cache_ignores_plans_already_in_progress() -> None:
+    world = World()
+    entity_id = world.create_entity()
+    world.add_component(
+        entity_id, ConversationComponent(messages=[Message(role="user", content="hi")])
+    )
+    world.add_component(entity_id, PlanComponent(steps=["a", "b"], current_step=1))
+    cache = PlanCacheComponent()
+    world.add_component(entity_id, cache)
+
+    await PlanCacheSystem().process(world)
+
+    assert cache.key is None
+    assert cache.store == {}
@@ -145,8 +145,8 @@ async def test_plan_context_is_injected_before_llm_call() -> None:
     assert len(provider.calls) == 1
     sent = provider.calls[0]
     assert sent[0] == Message(role="system", content="You are concise")
-    assert sent[1] == Message(role="system", content="Step 1/1: inspect state")
-    assert sent[2] == Message(role="user", content="hello")
+    assert sent[1] == Message(role="user", content="hello")
+    assert sent[2] == Message(role="user", content="Step 1/1: inspect state")
 
 
 @pytest.mark.asyncio
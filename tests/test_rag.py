@@ -6,6 +6,7 @@ from ecs_agent.components import (
     ConversationComponent,
     EmbeddingComponent,
     KVStoreComponent,
+    RAGComponent,
     RAGTriggerComponent,
     VectorStoreComponent,
 )
@@ -62,6 +63,36 @@ async def test_rag_trigger_with_query_retrieves_and_injects_context() -> None:
     assert trigger.query == ""
 
 
+@pytest.mark.asyncio
+async def test_precomputed_query_vector_skips_embedding_call() -> None:
+    world = World()
+    entity_id = world.create_entity()
+    provider = RecordingEmbeddingProvider(dimension=8)
+    store = InMemoryVectorStore(dimension=8)
+    doc_vector, query_vector = await provider.embed(["Python is great", "Python"])
+    await store.add("doc-1", doc_vector, metadata={"text": "Python is great"})
+    provider.calls.clear()
+
+    world.add_component(
+        entity_id,
+        RAGTriggerComponent(query="Python", top_k=1, query_vector=query_vector),
+    )
+    world.add_component(entity_id, EmbeddingComponent(provider=provider, dimension=8))
+    world.add_component(entity_id, VectorStoreComponent(store=store))
+    world.add_component(
+        entity_id,
+        ConversationComponent(messages=[Message(role="user", content="Python?")]),
+    )
+
+    await RAGSystem().process(world)
+
+    trigger = world.get_component(entity_id, RAGTriggerComponent)
+    assert trigger is not None
+    assert provider.calls == []
+    assert trigger.retrieved_docs == ["Python is great"]
+    assert trigger.query_vector is None
+
+
 @pytest.mark.asyncio
 async def test_empty_query_skips_retrieval() -> None:
     world = World()
@@ -192,5 +223,38 @@ async def test_retrieval_publishes_rag_completed_event() -> None:
     assert seen[0].num_results == 1
 
 
+@pytest.mark.asyncio
+async def test_rag_component_retrieves_with_single_component() -> None:
+    world = World()
+    entity_id = world.create_entity()
+    provider = RecordingEmbeddingProvider(dimension=8)
+    store = InMemoryVectorStore(dimension=8)
+    vector = (await provider.embed(["Python is great"]))[0]
+    await store.add("doc-1", vector, metadata={"text": "Python is great"})
+    provider.calls.clear()
+
+    world.add_component(
+        entity_id,
+        RAGComponent(provider=provider, store=store, query="Python", top_k=1),
+    )
+    world.add_component(
+        entity_id,
+        ConversationComponent(
+            messages=[Message(role="user", content="Tell me about Python")]
+        ),
+    )
+
+    await RAGSystem().process(world)
+
+    conversation = world.get_component(entity_id, ConversationComponent)
+    rag = world.get_component(entity_id, RAGComponent)
+    assert conversation is not None
+    assert rag is not None
+    assert provider.calls == [["Python"]]
+    assert conversation.messages[0].content == "[RAG Context] Python is great"
+    assert rag.retrieved_docs == ["Python is great"]
+    assert rag.query == ""
+
+
 def test_default_priority_is_lower_than_reasoning_system() -> None:
     assert RAGSystem().priority == -10
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from ecs_agent.components import (
@@ -40,6 +42,27 @@ class ErrorFakeProvider(FakeProvider):
         raise RuntimeError("provider exploded")
 
 
+class BarrierProvider(FakeProvider):
+    """Answers only once ``expected`` calls are in flight at the same time."""
+
+    def __init__(self, reply: str, arrived: list[str], expected: int) -> None:
+        result = CompletionResult(message=Message(role="assistant", content=reply))
+        super().__init__(responses=[result])
+        self._reply = reply
+        self._arrived = arrived
+        self._expected = expected
+
+    async def complete(
+        self,
+        messages: list[Message],
+        tools: list[ToolSchema] | None = None,
+    ) -> CompletionResult:
+        self._arrived.append(self._reply)
+        while len(self._arrived) < self._expected:
+            await asyncio.sleep(0)
+        return await super().complete(messages, tools)
+
+
 @pytest.mark.asyncio
 async def test_basic_conversation_appends_assistant_response() -> None:
     world = World()
@@ -114,6 +137,32 @@ async def test_system_prompt_component_is_prepended_to_messages() -> None:
     assert sent_messages[1] == Message(role="user", content="Hello")
 
 
+@pytest.mark.asyncio
+async def test_system_prompt_message_is_reused_across_ticks() -> None:
+    world = World()
+    provider = RecordingFakeProvider(
+        responses=[
+            CompletionResult(message=Message(role="assistant", content="one")),
+            CompletionResult(message=Message(role="assistant", content="two")),
+        ]
+    )
+    entity_id = world.create_entity()
+    world.add_component(entity_id, LLMComponent(provider=provider, model="fake"))
+    world.add_component(entity_id, SystemPromptComponent(content="You are concise"))
+    world.add_component(
+        entity_id,
+        ConversationComponent(messages=[Message(role="user", content="Hello")]),
+    )
+
+    system = ReasoningSystem()
+    await system.process(world)
+    await system.process(world)
+
+    first, _ = provider.calls[0]
+    second, _ = provider.calls[1]
+    assert first[0] is second[0]
+
+
 @pytest.mark.asyncio
 async def test_tool_registry_tools_are_passed_to_provider() -> None:
     world = World()
@@ -282,3 +331,31 @@ async def test_entities_missing_required_components_are_skipped() -> None:
     assert incomplete_terminal is None
     assert valid_conversation is not None
     assert valid_conversation.messages[-1].content == "ok"
+
+
+@pytest.mark.asyncio
+async def test_parallel_overlaps_provider_calls_across_entities() -> None:
+    world = World()
+    arrived: list[str] = []
+    entities = []
+    for reply in ("A1", "B1"):
+        entity_id = world.create_entity()
+        entities.append(entity_id)
+        world.add_component(
+            entity_id,
+            LLMComponent(
+                provider=BarrierProvider(reply, arrived, expected=2), model="fake"
+            ),
+        )
+        world.add_component(
+            entity_id,
+            ConversationComponent(messages=[Message(role="user", content=reply)]),
+        )
+
+    await asyncio.wait_for(ReasoningSystem(parallel=True).process(world), timeout=1)
+
+    assert arrived == ["A1", "B1"]
+    for entity_id, reply in zip(entities, ("A1", "B1")):
+        conversation = world.get_component(entity_id, ConversationComponent)
+        assert conversation is not None
+        assert conversation.messages[-1].content == reply
@@ -1,10 +1,11 @@
 from collections.abc import AsyncIterator
 
 import asyncio
+import time
 import httpx
 import pytest
 
-from ecs_agent.providers.retry_provider import RetryProvider
+from ecs_agent.providers.retry_provider import RetryProvider, _retry_after_seconds
 from ecs_agent.types import CompletionResult, Message, RetryConfig, StreamDelta
 
 
@@ -12,9 +13,13 @@ def _result(content: str = "ok") -> CompletionResult:
     return CompletionResult(message=Message(role="assistant", content=content))
 
 
-def _http_status_error(status_code: int) -> httpx.HTTPStatusError:
+def _http_status_error(
+    status_code: int, headers: dict[str, str] | None = None
+) -> httpx.HTTPStatusError:
     request = httpx.Request("POST", "https://example.test/v1/chat/completions")
-    response = httpx.Response(status_code=status_code, request=request)
+    response = httpx.Response(
+        status_code=status_code, headers=headers, request=request
+    )
     return httpx.HTTPStatusError(
         f"HTTP {status_code}",
         request=request,
@@ -192,3 +197,85 @@ async def test_exponential_backoff_timing(monkeypatch: pytest.MonkeyPatch) -> No
 
     assert result.message.content == "ok"
     assert waits == [1.0, 2.0, 4.0]
+
+
+@pytest.mark.asyncio
+async def test_jitter_spreads_waits_within_backoff_bounds(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    waits: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        waits.append(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    request = httpx.Request("POST", "https://example.test/v1/chat/completions")
+    provider = SequencedProvider(
+        outcomes=[
+            httpx.ConnectError("1", request=request),
+            httpx.ConnectError("2", request=request),
+            httpx.ConnectError("3", request=request),
+            _result("ok"),
+        ]
+    )
+    config = RetryConfig(
+        max_attempts=4, multiplier=1.0, min_wait=0.5, max_wait=10.0, jitter=True
+    )
+    retry_provider = RetryProvider(provider, config)
+
+    result = await retry_provider.complete([Message(role="user", content="x")])
+
+    assert result.message.content == "ok"
+    assert len(waits) == 3
+    for wait, ceiling in zip(waits, [1.0, 2.0, 4.0]):
+        assert 0.5 <= wait <= ceiling
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("retry_after", "expected"), [("7", 7.0), ("120", 30.0), ("soon", 1.0)]
+)
+async def test_retry_after_header_overrides_backoff(
+    monkeypatch: pytest.MonkeyPatch, retry_after: str, expected: float
+) -> None:
+    waits: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        waits.append(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    provider = SequencedProvider(
+        outcomes=[
+            _http_status_error(429, headers={"Retry-After": retry_after}),
+            _result("ok"),
+        ]
+    )
+    config = RetryConfig(max_attempts=2, multiplier=1.0, min_wait=0.0, max_wait=30.0)
+    retry_provider = RetryProvider(provider, config)
+
+    result = await retry_provider.complete([Message(role="user", content="x")])
+
+    assert result.message.content == "ok"
+    assert waits == [expected]
+
+
+@pytest.mark.parametrize(
+    "retry_after",
+    ["Wed, 21 Oct 2026 07:28:10 GMT", "Wed, 21 Oct 2026 07:28:10 -0000"],
+)
+def test_retry_after_http_date_is_read_as_utc(
+    monkeypatch: pytest.MonkeyPatch, retry_after: str
+) -> None:
+    # 2026-10-21 07:28:00 UTC, ten seconds before the Retry-After date
+    now = 1792567680.0
+    monkeypatch.setattr(time, "time", lambda: now)
+    monkeypatch.setenv("TZ", "Asia/Shanghai")
+    time.tzset()
+    try:
+        error = _http_status_error(429, headers={"Retry-After": retry_after})
+        assert _retry_after_seconds(error) == pytest.approx(10.0)
+    finally:
+        monkeypatch.undo()
+        time.tzset()
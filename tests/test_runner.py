@@ -57,6 +57,23 @@ class TestRunner:
 
         assert counter.run_count > 0
 
+    @pytest.mark.asyncio
+    async def test_run_does_not_sleep_between_ticks(
+        self, world: World, runner: Runner, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that ticks run back to back without a polling delay."""
+
+        async def fail_sleep(delay: float, *args: object, **kwargs: object) -> None:
+            raise AssertionError(f"Runner slept for {delay}s between ticks")
+
+        monkeypatch.setattr("asyncio.sleep", fail_sleep)
+        counter = CounterSystem()
+        world.register_system(counter, priority=0)
+
+        await runner.run(world, max_ticks=20)
+
+        assert counter.run_count == 20
+
     @pytest.mark.asyncio
     async def test_run_stops_on_terminal_component(
         self, world: World, runner: Runner
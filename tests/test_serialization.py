@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import json
+import sys
+from collections import deque
 from typing import Any
 
+import pytest
+
 from ecs_agent.components import (
     CollaborationComponent,
     ConversationComponent,
@@ -13,6 +18,7 @@ from ecs_agent.components import (
     PendingToolCallsComponent,
     PlanComponent,
     PlanSearchComponent,
+    RAGComponent,
     RAGTriggerComponent,
     SandboxConfigComponent,
     SystemPromptComponent,
@@ -211,6 +217,53 @@ def test_save_and_load_to_file(tmp_path) -> None:
     assert loaded_kv == KVStoreComponent(store={"a": 1})
 
 
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_save_and_load_with_and_without_orjson(
+    tmp_path, monkeypatch: pytest.MonkeyPatch, has_orjson: bool
+) -> None:
+    if has_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr("ecs_agent.serialization.HAS_ORJSON", has_orjson)
+    provider = DummyProvider()
+
+    world = World()
+    entity = world.create_entity()
+    world.add_component(entity, LLMComponent(provider=provider, model="gpt-4"))
+    world.add_component(
+        entity,
+        ConversationComponent(messages=[Message(role="user", content="héllo")]),
+    )
+
+    path = tmp_path / "world.json"
+    WorldSerializer.save(world, path)
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert saved == WorldSerializer.to_dict(world)
+
+    loaded = WorldSerializer.load(path, providers={"gpt-4": provider}, tool_handlers={})
+    loaded_conv = loaded.get_component(EntityId(1), ConversationComponent)
+    assert loaded_conv is not None
+    assert loaded_conv.messages == [Message(role="user", content="héllo")]
+
+
+def test_to_dict_does_not_copy_placeholder_fields() -> None:
+    class UncopyableProvider(DummyProvider):
+        def __deepcopy__(self, memo: dict[int, Any]) -> Any:
+            raise TypeError("cannot copy a live client")
+
+    provider = UncopyableProvider()
+    world = World()
+    entity = world.create_entity()
+    llm = LLMComponent(provider=provider, model="gpt-4")
+    world.add_component(entity, llm)
+
+    data = WorldSerializer.to_dict(world)
+
+    assert data["entities"]["1"]["LLMComponent"]["provider"] == (
+        NON_SERIALIZABLE_PLACEHOLDER
+    )
+    assert llm.provider is provider
+
+
 def test_serialization_with_all_component_types() -> None:
     provider = DummyProvider()
     providers = {"default": provider, "gpt-4": provider}
@@ -246,7 +299,8 @@ def test_serialization_with_all_component_types() -> None:
         entity,
         CollaborationComponent(
             peers=[EntityId(2)],
-            inbox=[(EntityId(2), Message(role="assistant", content="x"))],
+            senders=deque([EntityId(2)]),
+            messages=deque([Message(role="assistant", content="x")]),
         ),
     )
     world.add_component(entity, OwnerComponent(owner_id=EntityId(99)))
@@ -431,6 +485,24 @@ def test_serialization_vector_store_component_uses_placeholder() -> None:
     )
 
 
+def test_serialization_rag_component_uses_placeholders() -> None:
+    """Test that RAGComponent provider and store are serialized as placeholders."""
+    from unittest.mock import Mock
+
+    world = World()
+    entity = world.create_entity()
+    world.add_component(
+        entity,
+        RAGComponent(provider=Mock(), store=Mock(), dimension=8, query="q"),
+    )
+
+    data = WorldSerializer.to_dict(world)["entities"]["1"]["RAGComponent"]
+    assert data["provider"] == NON_SERIALIZABLE_PLACEHOLDER
+    assert data["store"] == NON_SERIALIZABLE_PLACEHOLDER
+    assert data["dimension"] == 8
+    assert data["query"] == "q"
+
+
 def test_serialization_roundtrip_mixed_new_components() -> None:
     """Test roundtrip with multiple new components together."""
     world = World()
@@ -563,6 +635,73 @@ def test_serialization_roundtrip_runner_state_component() -> None:
     assert restored_comp.checkpoint_path == "/tmp/checkpoint.json"
 
 
+def test_serialization_roundtrip_collaboration_inbox() -> None:
+    """Test that the parallel sender/message queues survive a JSON roundtrip."""
+    world = World()
+    entity = world.create_entity()
+    world.add_component(
+        entity,
+        CollaborationComponent(
+            peers=[EntityId(2), EntityId(3)],
+            senders=deque([EntityId(2), EntityId(3)]),
+            messages=deque(
+                [
+                    Message(role="assistant", content="from two"),
+                    Message(role="assistant", content="from three"),
+                ]
+            ),
+        ),
+    )
+
+    serialized = json.loads(json.dumps(WorldSerializer.to_dict(world)))
+    restored = WorldSerializer.from_dict(serialized, providers={}, tool_handlers={})
+
+    restored_comp = restored.get_component(entity, CollaborationComponent)
+    assert restored_comp is not None
+    assert restored_comp.senders == deque([EntityId(2), EntityId(3)])
+    assert [m.content for m in restored_comp.messages] == ["from two", "from three"]
+
+
+def test_serialization_loads_legacy_collaboration_inbox() -> None:
+    """Test that checkpoints with (sender, message) inbox pairs still load."""
+    old_data = {
+        "next_entity_id": 2,
+        "entities": {
+            "1": {
+                "CollaborationComponent": {
+                    "peers": [2],
+                    "inbox": [
+                        [2, {"role": "user", "content": "hi", "tool_calls": None}]
+                    ],
+                }
+            }
+        },
+    }
+
+    restored = WorldSerializer.from_dict(old_data, providers={}, tool_handlers={})
+    collaboration = restored.get_component(EntityId(1), CollaborationComponent)
+    assert collaboration is not None
+    assert collaboration.senders == deque([EntityId(2)])
+    assert [m.content for m in collaboration.messages] == ["hi"]
+
+
+def test_deserialized_message_roles_are_interned() -> None:
+    """Test that roles read back from JSON are the interned role strings."""
+    world = World()
+    entity = world.create_entity()
+    world.add_component(
+        entity,
+        ConversationComponent(messages=[Message(role="assistant", content="hi")]),
+    )
+
+    serialized = json.loads(json.dumps(WorldSerializer.to_dict(world)))
+    restored = WorldSerializer.from_dict(serialized, providers={}, tool_handlers={})
+
+    conversation = restored.get_component(entity, ConversationComponent)
+    assert conversation is not None
+    assert conversation.messages[0].role is sys.intern("assistant")
+
+
 def test_serialization_backward_compatibility_without_new_components() -> None:
     """Test that world without new components deserializes successfully."""
     # Old serialized data without new components
@@ -305,3 +305,48 @@ class InitSkill(Skill):
     skills = discovery.discover()
 
     assert skills == []
+
+
+def test_skill_discovery_reuses_unchanged_modules(tmp_path: Path) -> None:
+    """Test discover() only re-executes skill files that changed."""
+    skills_dir = tmp_path / "skills"
+    skills_dir.mkdir()
+    load_log = tmp_path / "loads.txt"
+    skill_source = f"""
+from pathlib import Path
+from ecs_agent.skills.protocol import Skill
+
+with Path({str(load_log)!r}).open("a") as log:
+    log.write("load\\n")
+
+
+class CachedSkill(Skill):
+    name = "cached"
+    description = "Cached skill"
+
+    def tools(self):
+        return {{}}
+
+    def system_prompt(self) -> str:
+        return ""
+
+    def install(self, world, entity_id) -> None:
+        pass
+
+    def uninstall(self, world, entity_id) -> None:
+        pass
+"""
+    skill_file = skills_dir / "cached_skill.py"
+    skill_file.write_text(skill_source)
+
+    discovery = SkillDiscovery(skill_paths=[skills_dir])
+    first = discovery.discover()
+    second = discovery.discover()
+
+    assert [s.name for s in second] == ["cached"]
+    assert second[0] is not first[0]
+    assert load_log.read_text().splitlines() == ["load"]
+
+    skill_file.write_text(skill_source + "\n# changed\n")
+    discovery.discover()
+    assert load_log.read_text().splitlines() == ["load", "load"]
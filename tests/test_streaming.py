@@ -168,13 +168,82 @@ async def test_streaming_accumulates_tool_call_chunks_by_index() -> None:
     )
     deltas = [delta async for delta in stream_iter]
 
-    assert deltas[0].tool_calls is not None
-    assert deltas[0].tool_calls[0].id == "call_1"
-    assert deltas[0].tool_calls[0].name == "get_weather"
-    assert deltas[0].tool_calls[0].arguments == {"_partial": '{"city":"'}
+    tool_call_deltas = [delta for delta in deltas if delta.tool_calls]
+    assert len(tool_call_deltas) == 1
+    assert tool_call_deltas[0].finish_reason == "tool_calls"
+    tool_calls = tool_call_deltas[0].tool_calls
+    assert tool_calls is not None
+    assert len(tool_calls) == 1
+    assert tool_calls[0].id == "call_1"
+    assert tool_calls[0].name == "get_weather"
+    assert tool_calls[0].arguments == {"city": "NYC"}
+
+
+def _tool_call_chunk(index: int, **function: str) -> str:
+    tool_call: dict = {"index": index, "function": function}
+    if "name" in function:
+        tool_call["id"] = f"call_{index}"
+    return _sse_data(
+        {"choices": [{"delta": {"tool_calls": [tool_call]}, "finish_reason": None}]}
+    )
+
+
+@pytest.mark.asyncio
+async def test_streaming_emits_each_tool_call_once_when_complete() -> None:
+    stream_lines = [
+        _tool_call_chunk(0, name="get_weather", arguments='{"ci'),
+        _tool_call_chunk(0, arguments='ty": "Bei'),
+        _tool_call_chunk(0, arguments='jing"}'),
+        _tool_call_chunk(1, name="get_population", arguments=""),
+        _tool_call_chunk(1, arguments='{"city": "Tokyo"}'),
+        _sse_data({"choices": [{"delta": {}, "finish_reason": "tool_calls"}]}),
+        "data: [DONE]",
+    ]
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client.stream = Mock(
+        return_value=_MockStreamContext(_MockStreamResponse(stream_lines))
+    )
+    provider = OpenAIProvider(api_key="test-key")
+    provider._client = mock_client
+
+    stream_iter = await provider.complete(
+        [Message(role="user", content="weather")], stream=True
+    )
+    emitted = [
+        (delta.finish_reason, call)
+        async for delta in stream_iter
+        for call in delta.tool_calls or ()
+    ]
+
+    # The first call is released as soon as the second one starts, before the
+    # stream finishes; the last one is released with the finish reason.
+    assert [(reason, call.name, call.arguments) for reason, call in emitted] == [
+        (None, "get_weather", {"city": "Beijing"}),
+        ("tool_calls", "get_population", {"city": "Tokyo"}),
+    ]
+    assert [call.id for _, call in emitted] == ["call_0", "call_1"]
+
+
+@pytest.mark.asyncio
+async def test_streaming_flushes_tool_calls_when_stream_ends_early() -> None:
+    stream_lines = [
+        _tool_call_chunk(0, name="get_weather", arguments='{"city": "Oslo"}'),
+        "data: [DONE]",
+    ]
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client.stream = Mock(
+        return_value=_MockStreamContext(_MockStreamResponse(stream_lines))
+    )
+    provider = OpenAIProvider(api_key="test-key")
+    provider._client = mock_client
+
+    stream_iter = await provider.complete(
+        [Message(role="user", content="weather")], stream=True
+    )
+    deltas = [delta async for delta in stream_iter]
 
-    assert deltas[1].tool_calls is not None
-    assert deltas[1].tool_calls[0].arguments == {"city": "NYC"}
+    assert deltas[-1].tool_calls is not None
+    assert deltas[-1].tool_calls[0].arguments == {"city": "Oslo"}
 
 
 @pytest.mark.asyncio
@@ -73,6 +73,26 @@ class ToolCallStreamingFakeProvider(FakeProvider):
         yield StreamDelta(finish_reason="tool_calls")
 
 
+class CompletedToolCallStreamingFakeProvider(FakeProvider):
+    """Emits each tool call once, fully parsed, as OpenAIProvider does."""
+
+    async def _stream_complete(
+        self, result: CompletionResult
+    ) -> AsyncIterator[StreamDelta]:
+        _ = result
+        yield StreamDelta(
+            tool_calls=[
+                ToolCall(id="call-1", name="get_weather", arguments={"city": "Paris"})
+            ]
+        )
+        yield StreamDelta(
+            tool_calls=[
+                ToolCall(id="call-2", name="get_weather", arguments={"city": "Rome"})
+            ],
+            finish_reason="tool_calls",
+        )
+
+
 class FailingStreamingFakeProvider(FakeProvider):
     async def _stream_complete(
         self, result: CompletionResult
@@ -193,6 +213,30 @@ async def test_streaming_tool_call_deltas_accumulate_into_pending_tool_calls() -
     assert conversation.messages[-1].tool_calls == pending.tool_calls
 
 
+@pytest.mark.asyncio
+async def test_streaming_completed_tool_calls_keep_their_arguments() -> None:
+    world = World()
+    provider = CompletedToolCallStreamingFakeProvider(
+        responses=[CompletionResult(message=Message(role="assistant", content=""))]
+    )
+    entity_id = world.create_entity()
+    world.add_component(entity_id, LLMComponent(provider=provider, model="fake"))
+    world.add_component(
+        entity_id,
+        ConversationComponent(messages=[Message(role="user", content="Weather")]),
+    )
+    world.add_component(entity_id, StreamingComponent(enabled=True))
+
+    await ReasoningSystem().process(world)
+
+    pending = world.get_component(entity_id, PendingToolCallsComponent)
+    assert pending is not None
+    assert pending.tool_calls == [
+        ToolCall(id="call-1", name="get_weather", arguments={"city": "Paris"}),
+        ToolCall(id="call-2", name="get_weather", arguments={"city": "Rome"}),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_streaming_error_preserves_partial_content_and_sets_error_component() -> (
     None
@@ -81,3 +81,96 @@ async def test_system_protocol_structural_typing_works_with_world_registration()
 
     await world.process()
     assert log == ["typed"]
+
+
+@pytest.mark.asyncio
+async def test_world_register_systems_registers_all_pairs_in_priority_order() -> None:
+    world = World()
+    log: list[str] = []
+    world.register_systems(
+        [
+            (LoggingSystem(name="p10", log=log), 10),
+            (LoggingSystem(name="p0", log=log), 0),
+            (LoggingSystem(name="p5", log=log), 5),
+        ]
+    )
+
+    await world.process()
+    assert log == ["p0", "p5", "p10"]
+
+
+@pytest.mark.asyncio
+async def test_system_executor_register_after_execute_is_picked_up() -> None:
+    executor = SystemExecutor()
+    world = World()
+    log: list[str] = []
+    executor.register(LoggingSystem(name="p1", log=log), priority=1)
+    await executor.execute(world)
+
+    executor.register(LoggingSystem(name="p0", log=log), priority=0)
+    await executor.execute(world)
+    assert log == ["p1", "p0", "p1"]
+
+
+@dataclass(slots=True)
+class Marker:
+    pass
+
+
+@dataclass(slots=True)
+class RequiresMarkerSystem:
+    log: list[str]
+    required_components: tuple[type, ...] = (Marker,)
+
+    async def process(self, world: World) -> None:
+        _ = world
+        self.log.append("ran")
+
+
+@pytest.mark.asyncio
+async def test_system_executor_skips_system_without_required_components() -> None:
+    executor = SystemExecutor()
+    world = World()
+    log: list[str] = []
+    executor.register(RequiresMarkerSystem(log=log), priority=0)
+
+    await executor.execute(world)
+    assert log == []
+
+    world.add_component(world.create_entity(), Marker())
+    await executor.execute(world)
+    assert log == ["ran"]
+
+
+@pytest.mark.asyncio
+async def test_system_executor_sees_components_added_by_earlier_priority() -> None:
+    executor = SystemExecutor()
+    world = World()
+    log: list[str] = []
+
+    class AddMarkerSystem:
+        async def process(self, world: World) -> None:
+            world.add_component(world.create_entity(), Marker())
+
+    executor.register(AddMarkerSystem(), priority=0)
+    executor.register(RequiresMarkerSystem(log=log), priority=1)
+
+    await executor.execute(world)
+    assert log == ["ran"]
+
+
+@pytest.mark.asyncio
+async def test_system_executor_sees_components_added_earlier_in_same_group() -> None:
+    executor = SystemExecutor()
+    world = World()
+    log: list[str] = []
+
+    class AddMarkerSystem:
+        async def process(self, world: World) -> None:
+            world.add_component(world.create_entity(), Marker())
+
+    executor.register(AddMarkerSystem(), priority=0)
+    executor.register(RequiresMarkerSystem(log=log), priority=0)
+
+    await executor.execute(world)
+    assert log == ["ran"]
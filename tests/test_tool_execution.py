@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from ecs_agent.components import (
@@ -223,3 +225,62 @@ async def test_entities_missing_required_components_are_skipped() -> None:
         Message(role="tool", content="pong", tool_call_id="ok-1")
     ]
     assert world.get_component(valid, PendingToolCallsComponent) is None
+
+
+@pytest.mark.asyncio
+async def test_parallel_mode_runs_tool_calls_concurrently_in_call_order() -> None:
+    world = World()
+    entity_id = world.create_entity()
+    first_started = asyncio.Event()
+    second_started = asyncio.Event()
+
+    async def slow_first() -> str:
+        first_started.set()
+        await asyncio.wait_for(second_started.wait(), timeout=1.0)
+        return "first"
+
+    async def fast_second() -> str:
+        second_started.set()
+        await asyncio.wait_for(first_started.wait(), timeout=1.0)
+        return "second"
+
+    world.add_component(entity_id, ConversationComponent(messages=[]))
+    world.add_component(
+        entity_id,
+        ToolRegistryComponent(
+            tools={
+                "slow_first": ToolSchema(
+                    name="slow_first",
+                    description="Slow",
+                    parameters={"type": "object"},
+                ),
+                "fast_second": ToolSchema(
+                    name="fast_second",
+                    description="Fast",
+                    parameters={"type": "object"},
+                ),
+            },
+            handlers={"slow_first": slow_first, "fast_second": fast_second},
+        ),
+    )
+    world.add_component(
+        entity_id,
+        PendingToolCallsComponent(
+            tool_calls=[
+                ToolCall(id="call-1", name="slow_first", arguments={}),
+                ToolCall(id="call-2", name="fast_second", arguments={}),
+            ]
+        ),
+    )
+
+    await ToolExecutionSystem(parallel=True).process(world)
+
+    conversation = world.get_component(entity_id, ConversationComponent)
+    assert conversation is not None
+    assert conversation.messages == [
+        Message(role="tool", content="first", tool_call_id="call-1"),
+        Message(role="tool", content="second", tool_call_id="call-2"),
+    ]
+    results = world.get_component(entity_id, ToolResultsComponent)
+    assert results is not None
+    assert results.results == {"call-1": "first", "call-2": "second"}
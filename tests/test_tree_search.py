@@ -145,6 +145,14 @@ def test_backpropagate_updates_scores_and_visits_to_root() -> None:
     assert nodes[0].score == pytest.approx(0.8)
 
 
+def test_tree_node_uses_slots() -> None:
+    node = TreeNode(id=0, parent_id=None, action="root")
+
+    assert not hasattr(node, "__dict__")
+    with pytest.raises(AttributeError):
+        node.extra = 1  # type: ignore[attr-defined]
+
+
 @pytest.mark.asyncio
 async def test_depth_limit_stops_search_and_sets_best_plan() -> None:
     provider = RecordingFakeProvider(
@@ -95,6 +95,18 @@ async def test_cosine_similarity_correctness_and_ordering() -> None:
     assert results[2][1] == pytest.approx(-1.0)
 
 
+@pytest.mark.asyncio
+async def test_scores_ignore_vector_magnitude() -> None:
+    store = InMemoryVectorStore(dimension=2)
+    await store.add("long", [10.0, 0.0])
+    await store.add("short", [0.1, 0.1])
+
+    results = await store.search([0.5, 0.0], top_k=2)
+
+    assert results[0] == ("long", pytest.approx(1.0))
+    assert results[1] == ("short", pytest.approx(0.70710678, rel=1e-6))
+
+
 @pytest.mark.asyncio
 async def test_delete_missing_id_is_no_op() -> None:
     store = InMemoryVectorStore(dimension=2)
@@ -117,6 +129,25 @@ async def test_search_respects_top_k() -> None:
     assert [result_id for result_id, _ in results] == ["a", "b"]
 
 
+@pytest.mark.asyncio
+async def test_store_grows_past_initial_capacity_and_keeps_rows_after_delete() -> None:
+    store = InMemoryVectorStore(dimension=2)
+    for i in range(40):
+        await store.add(f"v{i}", [1.0, i / 40], metadata={"text": f"t{i}"})
+
+    await store.delete("v0")
+    await store.delete("v20")
+    await store.add("v5", [0.0, 1.0])
+
+    results = await store.search([1.0, 0.0], top_k=40)
+    ids = [result_id for result_id, _ in results]
+    assert len(ids) == 38
+    assert "v0" not in ids and "v20" not in ids
+    assert ids[0] == "v1"
+    assert ids[-1] == "v5"
+    assert results[-1][1] == pytest.approx(0.0)
+
+
 def test_vector_store_protocol_is_runtime_checkable() -> None:
     assert isinstance(ConformingVectorStore(), VectorStore)
     assert not isinstance(NonConformingVectorStore(), VectorStore)
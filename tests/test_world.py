@@ -111,6 +111,37 @@ def test_world_query_returns_expected_components() -> None:
     assert results == [(a, (Position(x=1.0, y=2.0), Velocity(dx=0.1, dy=0.2)))]
 
 
+def test_world_query_count_counts_entities_with_all_types() -> None:
+    world = World()
+    a = world.create_entity()
+    b = world.create_entity()
+    world.add_component(a, Position(x=1.0, y=2.0))
+    world.add_component(a, Velocity(dx=0.1, dy=0.2))
+    world.add_component(b, Position(x=3.0, y=4.0))
+
+    assert world.query_count(Position) == 2
+    assert world.query_count(Position, Velocity) == 1
+    assert world.query_count(Velocity, Position) == 1
+    assert world.query_count() == 0
+
+
+def test_world_get_components_and_entity_ids() -> None:
+    world = World()
+    a = world.create_entity()
+    b = world.create_entity()
+    empty = world.create_entity()
+    world.add_component(a, Position(x=1.0, y=2.0))
+    world.add_component(a, Velocity(dx=0.1, dy=0.2))
+    world.add_component(b, Position(x=3.0, y=4.0))
+
+    assert world.get_components(a) == {
+        Position: Position(x=1.0, y=2.0),
+        Velocity: Velocity(dx=0.1, dy=0.2),
+    }
+    assert world.get_components(empty) == {}
+    assert sorted(world.entity_ids()) == [a, b]
+
+
 @pytest.mark.asyncio
 async def test_world_process_executes_systems_by_priority() -> None:
     world = World()